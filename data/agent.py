@@ -0,0 +1,112 @@
+import socket
+import time
+
+from data.collector import Collector
+from data.recording import SnapshotRecorder
+from data.snapshot_codec import FORMAT_VERSION, SnapshotEncoder
+from data.system_monitor import SystemMonitor
+from data.wire import encode_frame, encode_message
+
+DEFAULT_RECEIVER_PORT = 9200
+
+def parse_address(text, default_port=DEFAULT_RECEIVER_PORT):
+    """"host:port" 또는 "host" 를 (host, port) 로 바꿉니다."""
+    host, _, port = text.rpartition(":")
+    if not host:
+        return text, default_port
+    return host, int(port)
+
+class AgentConnection:
+    """
+    수신기로 가는 TCP 연결입니다. 연결할 때마다 hello 메시지(호스트 이름, 형식 버전)를 먼저 보내고
+    새 SnapshotEncoder 로 바이너리 스냅샷을 보냅니다. 첫 프레임은 정적 정보를 담은 키프레임입니다.
+    연결이 끊기면 재시도 간격을 두 배씩 늘리며(최대 max_backoff 초) 다시 연결합니다.
+    재시도 대기 중에 들어온 스냅샷은 버립니다. 수신기는 최신 값만 쓰므로 밀린 값을 쌓아 두지 않습니다.
+    """
+    def __init__(self, address, host_name, static_info=None, timeout=5.0, max_backoff=30.0):
+        self.address = address
+        self.host_name = host_name
+        self.static_info = static_info
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.sock = None
+        self.encoder = None
+        self.backoff = 1.0
+        self.retry_at = 0.0
+
+    def _connect(self):
+        sock = socket.create_connection(self.address, timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.sendall(encode_message({"type": "hello", "host": self.host_name, "format": FORMAT_VERSION}))
+        print(f"수신기에 연결했습니다: {self.address[0]}:{self.address[1]}")
+        self.sock = sock
+        self.encoder = SnapshotEncoder()
+        self.backoff = 1.0
+
+    def send(self, snapshot):
+        """스냅샷 하나를 보냅니다. 연결이 없고 재시도 시각 전이면 보내지 않고 False 를 반환합니다."""
+        if self.sock is None:
+            if time.monotonic() < self.retry_at:
+                return False
+            try:
+                self._connect()
+            except OSError as e:
+                self._schedule_retry(e)
+                return False
+        try:
+            self.sock.sendall(encode_frame(self.encoder.encode(snapshot, self.static_info)))
+        except OSError as e:
+            self.close()
+            self._schedule_retry(e)
+            return False
+        return True
+
+    def _schedule_retry(self, error):
+        print(f"수신기 연결 실패 ({error}). {self.backoff:.0f}초 뒤 다시 시도합니다.")
+        self.retry_at = time.monotonic() + self.backoff
+        self.backoff = min(self.max_backoff, self.backoff * 2)
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+def run_agent(receiver, host_name=None, sample_interval_ms=1000, display_interval_ms=None, process_limit=0,
+              record_path=None, monitor=None):
+    """
+    Qt 없이 SystemMonitor 로 수집하고, 화면 주기마다 Snapshot 을 수신기(--listen 으로 띄운 대시보드)에
+    TCP 로 보냅니다. receiver 는 "host:port" 문자열입니다. Ctrl+C 로 종료할 때까지 반환하지 않습니다.
+    monitor 를 넘기면 SystemMonitor 대신 그 모니터로 수집합니다.
+    """
+    if monitor is None:
+        monitor = SystemMonitor()
+    static_info = monitor.get_static_system_info()
+    recorder = SnapshotRecorder(record_path) if record_path else None
+    collector = Collector(monitor, sample_interval_ms, display_interval_ms, process_limit=process_limit,
+                          recorder=recorder)
+    collector.set_static_info(static_info)
+
+    connection = AgentConnection(parse_address(receiver), host_name or socket.gethostname(), static_info)
+    interval = collector.tick_interval_ms / 1000
+    deadline = time.monotonic()
+    collector.reset()
+    try:
+        while True:
+            snapshot = collector.tick()
+            if snapshot is not None:
+                connection.send(snapshot)
+
+            # 수집 시간만큼 밀리지 않도록 고정된 마감 시각을 기준으로 잠듭니다.
+            deadline += interval
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                deadline = time.monotonic()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        connection.close()
+        if recorder is not None:
+            recorder.close()
+    return 0
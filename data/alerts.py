@@ -0,0 +1,251 @@
+import math
+import os
+import re
+import subprocess
+from collections import deque
+
+# 규칙 한 줄의 형식:
+#   <지표> [ewma|mean|max [기간]] <비교> <임계값>[단위] [for <기간>] [=> <훅 명령>]
+# 예) cpu avg > 85% for 30s
+#     disk C: > 95%
+#     net recv ewma 10s > 80MB/s => notify-send "network saturated"
+CONDITION = (
+    r"\s+(?:(?P<aggregate>ewma|mean|max)(?:\s+(?P<span>\d+(?:\.\d+)?(?:ms|s|m|h)))?\s*)?"
+    r"(?P<op>>=|<=|>|<)\s*(?P<threshold>\d+(?:\.\d+)?)\s*(?P<unit>%|[kmgt]?i?b(?:/s)?)?"
+    r"(?:\s+for\s+(?P<hold>\d+(?:\.\d+)?(?:ms|s|m|h)))?"
+    r"(?:\s*=>\s*(?P<command>.+))?$"
+)
+# 지표 이름 뒤의 조건 부분. METRICS 의 이름을 먼저 맞춘 뒤 그 위치부터 맞춥니다.
+CONDITION_PATTERN = re.compile(CONDITION, re.IGNORECASE)
+# METRICS 에 없는 지표("disk C:" 처럼 장치 이름이 붙는 지표)의 규칙 전체
+RULE_PATTERN = re.compile(r"^(?P<metric>.+?)" + CONDITION, re.IGNORECASE)
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+# 화면의 format_bytes 와 같이 1024 배수입니다.
+BYTE_UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+DEFAULT_SPANS = {"ewma": 30.0, "mean": 60.0, "max": 60.0}
+OPERATORS = {">": float.__gt__, ">=": float.__ge__, "<": float.__lt__, "<=": float.__le__}
+
+# 지표 이름 → (Snapshot 에서 값을 읽는 함수, 강조할 화면 섹션)
+METRICS = {
+    "cpu": (lambda s: s.cpu_average, "cpu_mem"),
+    "cpu avg": (lambda s: s.cpu_average, "cpu_mem"),
+    "cpu max": (lambda s: max(s.cpu_percents) if s.cpu_percents else None, "cpu_cores"),
+    "ram": (lambda s: s.ram_percent, "cpu_mem"),
+    "net sent": (lambda s: s.sent_rate, "network"),
+    "net recv": (lambda s: s.received_rate, "network"),
+    "disk read": (lambda s: s.read_speed, "disk_io"),
+    "disk write": (lambda s: s.write_speed, "disk_io"),
+}
+# 속도(바이트/초) 지표. 나머지 지표와 "disk <장치>" 는 사용률(%)입니다.
+RATE_METRICS = {"net sent", "net recv", "disk read", "disk write"}
+# "cpu max > 90" 이 "cpu" 의 max 집계가 아니라 "cpu max" 지표가 되도록 긴 이름부터 맞춥니다.
+METRIC_NAMES = sorted(METRICS, key=len, reverse=True)
+
+def _duration(text):
+    number = re.match(r"\d+(?:\.\d+)?", text).group()
+    return float(number) * DURATION_UNITS[text[len(number):].lower()]
+
+def _disk_percent(device_id):
+    def read(snapshot):
+        usage = snapshot.disk_usage.get(device_id)
+        return usage[2] if usage and usage[1] > 0 else None
+    return read
+
+class Ewma:
+    """시간 상수 span 초의 지수 가중 이동 평균. 샘플 간격이 달라도 같은 시간 상수가 되도록 가중치를 정합니다."""
+    __slots__ = ("span", "value")
+
+    def __init__(self, span):
+        self.span = span
+        self.value = None
+
+    def update(self, timestamp, interval, value):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += (value - self.value) * (1.0 - math.exp(-max(interval, 0.0) / self.span))
+        return self.value
+
+class WindowMean:
+    """최근 span 초 평균. 누적 합을 들고 있어 샘플당 상각 O(1) 입니다."""
+    __slots__ = ("span", "samples", "total")
+
+    def __init__(self, span):
+        self.span = span
+        self.samples = deque()
+        self.total = 0.0
+
+    def update(self, timestamp, interval, value):
+        samples = self.samples
+        samples.append((timestamp, value))
+        self.total += value
+        while samples[0][0] <= timestamp - self.span:
+            self.total -= samples.popleft()[1]
+        return self.total / len(samples)
+
+class WindowMax:
+    """최근 span 초 최대값. 값이 단조 감소하는 덱만 유지하므로 샘플당 상각 O(1) 입니다."""
+    __slots__ = ("span", "samples")
+
+    def __init__(self, span):
+        self.span = span
+        self.samples = deque()
+
+    def update(self, timestamp, interval, value):
+        samples = self.samples
+        while samples and samples[-1][1] <= value:
+            samples.pop()
+        samples.append((timestamp, value))
+        while samples[0][0] <= timestamp - self.span:
+            samples.popleft()
+        return samples[0][1]
+
+AGGREGATES = {"ewma": Ewma, "mean": WindowMean, "max": WindowMax}
+
+class Rule:
+    """
+    파싱된 규칙 하나와 그 평가 상태입니다.
+    hold 초 동안 조건이 계속 참이면 firing 이 되고, 조건이 거짓이 되면 바로 해제됩니다.
+    """
+    __slots__ = ("text", "metric", "read", "section", "aggregate", "compare", "threshold", "hold", "command",
+                 "since", "firing", "value")
+
+    def __init__(self, text, metric, read, section, aggregate, compare, threshold, hold, command):
+        self.text = text
+        self.metric = metric
+        self.read = read
+        self.section = section
+        self.aggregate = aggregate
+        self.compare = compare
+        self.threshold = threshold
+        self.hold = hold
+        self.command = command
+        self.since = None
+        self.firing = False
+        self.value = None
+
+    def __repr__(self):
+        return f"Rule({self.text!r})"
+
+def parse_rule(text):
+    """규칙 문자열 한 줄을 Rule 로 바꿉니다. 형식이 틀리면 ValueError 입니다."""
+    text = text.strip()
+    match = None
+    lowered = " ".join(text.split()).lower()
+    for name in METRIC_NAMES:
+        if lowered.startswith(name):
+            # 지표 이름 안의 공백 수가 달라도 원문에서 같은 위치를 찾습니다.
+            end = re.match(r"\s*".join(map(re.escape, name.split())), text, re.IGNORECASE).end()
+            match = CONDITION_PATTERN.match(text, end)
+            if match is not None:
+                metric = name
+                break
+    if match is None:
+        match = RULE_PATTERN.match(text)
+        if match is None:
+            raise ValueError(f"invalid alert rule: {text}")
+        metric = " ".join(match["metric"].split())
+    key = metric.lower()
+    if key in METRICS:
+        read, section = METRICS[key]
+    elif key.startswith("disk "):
+        # "disk C:" 처럼 장치 이름은 대소문자를 그대로 씁니다.
+        key = metric
+        read, section = _disk_percent(metric[5:]), "disk_usage"
+    else:
+        raise ValueError(f"unknown metric in alert rule: {metric}")
+
+    aggregate = None
+    if match["aggregate"]:
+        name = match["aggregate"].lower()
+        span = _duration(match["span"]) if match["span"] else DEFAULT_SPANS[name]
+        aggregate = AGGREGATES[name](span)
+
+    unit = (match["unit"] or "").lower()
+    if unit == "%" and key in RATE_METRICS:
+        raise ValueError(f"percent threshold on a rate metric in alert rule: {text}")
+    threshold = float(match["threshold"])
+    if unit and unit != "%":
+        threshold *= BYTE_UNITS[unit[0] if unit[0] in "kmgt" else ""]
+    hold = _duration(match["hold"]) if match["hold"] else 0.0
+    command = None
+    if match["command"]:
+        command = match["command"].strip()
+        text = text[:match.start("command")].rstrip().removesuffix("=>").rstrip()
+    return Rule(text, key, read, section, aggregate, OPERATORS[match["op"]], threshold, hold, command)
+
+def load_rules(path):
+    """한 줄에 규칙 하나인 파일을 읽습니다. 빈 줄과 # 으로 시작하는 줄은 건너뜁니다."""
+    rules = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                rules.append(parse_rule(line))
+            except ValueError as e:
+                raise ValueError(f"{path}:{number}: {e}") from None
+    return rules
+
+class AlertEngine:
+    """
+    Snapshot 이 도착할 때마다 규칙들을 증분으로 평가합니다. Qt 에 의존하지 않습니다.
+
+    - 같은 지표를 보는 규칙이 여러 개여도 Snapshot 에서 값은 지표마다 한 번만 읽습니다.
+    - EWMA/구간 평균/구간 최대와 "for" 유지 시간은 규칙마다 샘플당 O(1) 상태로 계산합니다.
+    - 지표 값이 없는 틱(예: 아직 읽지 않은 디스크)은 그 규칙의 상태를 바꾸지 않습니다.
+    - 규칙이 발생하면 command 가 있는 경우 셸 명령을 기다리지 않고 실행합니다.
+      환경 변수 ALERT_RULE, ALERT_VALUE 로 규칙 문자열과 현재 값을 넘깁니다.
+    """
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.readers = {}
+        for rule in self.rules:
+            self.readers.setdefault(rule.metric, rule.read)
+        self.hooks = []
+
+    def evaluate(self, snapshot):
+        """규칙을 평가하고 발생 또는 해제된 규칙 목록을 반환합니다. 대부분의 틱에서는 빈 목록입니다."""
+        values = {}
+        for metric, read in self.readers.items():
+            value = read(snapshot)
+            values[metric] = None if value is None else float(value)
+
+        timestamp = snapshot.timestamp
+        interval = snapshot.interval
+        changed = []
+        for rule in self.rules:
+            value = values[rule.metric]
+            if value is None:
+                continue
+            if rule.aggregate is not None:
+                value = rule.aggregate.update(timestamp, interval, value)
+            rule.value = value
+            if rule.compare(value, rule.threshold):
+                if rule.since is None:
+                    rule.since = timestamp
+                if not rule.firing and timestamp - rule.since >= rule.hold:
+                    rule.firing = True
+                    changed.append(rule)
+                    if rule.command:
+                        self.run_hook(rule)
+            else:
+                rule.since = None
+                if rule.firing:
+                    rule.firing = False
+                    changed.append(rule)
+        return changed
+
+    def firing(self, section=None):
+        """현재 발생 중인 규칙들입니다. section 을 주면 그 화면 섹션의 규칙만 돌려줍니다."""
+        return [rule for rule in self.rules if rule.firing and (section is None or rule.section == section)]
+
+    def run_hook(self, rule):
+        # 끝난 훅 프로세스를 정리해 좀비가 쌓이지 않게 합니다.
+        self.hooks = [process for process in self.hooks if process.poll() is None]
+        env = dict(os.environ, ALERT_RULE=rule.text, ALERT_VALUE=f"{rule.value:g}")
+        try:
+            self.hooks.append(subprocess.Popen(rule.command, shell=True, env=env))
+        except OSError as e:
+            print(f"Failed to run alert hook for '{rule.text}': {e}")
@@ -0,0 +1,219 @@
+import time
+
+from data.history import history_row
+from data.processes import ProcessScanner
+from data.scheduler import CollectorScheduler
+from data.system_monitor import Snapshot
+
+# 수집 주기의 하한. 이보다 짧으면 psutil 호출 비용이 측정값을 왜곡합니다.
+MIN_SAMPLE_INTERVAL_MS = 50
+
+class SnapshotAggregator:
+    """
+    고빈도로 수집된 Snapshot 여러 개를 화면 갱신 한 번 분량으로 합칩니다.
+    속도와 사용률은 각 샘플의 구간 길이(interval)로 가중 평균하고,
+    구간 안의 순간 최대 속도는 *_peak 필드에 남겨 짧은 버스트가 평균에 묻히지 않게 합니다.
+    """
+    MEAN_FIELDS = ("cpu_average", "ram_percent", "sent_rate", "received_rate", "read_speed", "write_speed")
+    PEAK_FIELDS = ("sent_peak", "received_peak", "read_peak", "write_peak")
+    DEVICE_FIELDS = ("nic_rates", "disk_rates")
+
+    def __init__(self):
+        self.pending = []
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, snapshot):
+        self.pending.append(snapshot)
+
+    def flush(self):
+        """쌓인 샘플을 하나의 Snapshot 으로 합쳐 반환하고 버퍼를 비웁니다."""
+        pending, self.pending = self.pending, []
+        if not pending:
+            return None
+        if len(pending) == 1:
+            return pending[0]
+
+        total = sum(s.interval for s in pending)
+        if total > 0:
+            weights = [s.interval / total for s in pending]
+        else:
+            weights = [1 / len(pending)] * len(pending)
+
+        # 총량, uptime, 디스크 사용량처럼 누적/상태 값은 마지막 샘플을 그대로 사용합니다.
+        last = pending[-1]
+        values = {name: getattr(last, name) for name in Snapshot.__slots__}
+        for name in self.MEAN_FIELDS:
+            values[name] = sum(getattr(s, name) * w for s, w in zip(pending, weights))
+        for name in self.PEAK_FIELDS:
+            values[name] = max(getattr(s, name) for s in pending)
+        if all(len(s.cpu_percents) == len(last.cpu_percents) for s in pending):
+            values["cpu_percents"] = tuple(
+                sum(p * w for p, w in zip(core, weights)) for core in zip(*(s.cpu_percents for s in pending))
+            )
+        # 장치별 속도는 마지막 샘플에 있는 장치만, 그 장치가 있던 샘플끼리 가중 평균합니다.
+        for name in self.DEVICE_FIELDS:
+            merged = {}
+            for device in getattr(last, name):
+                samples = [
+                    (getattr(s, name)[device], w) for s, w in zip(pending, weights) if device in getattr(s, name)
+                ]
+                weight = sum(w for _, w in samples) or 1.0
+                merged[device] = tuple(
+                    sum(rates[i] * w for rates, w in samples) / weight for i in range(len(samples[0][0]))
+                )
+            values[name] = merged
+        values["interval"] = total
+        return Snapshot(**values)
+
+# 수집 함수별 기본 주기(초). 빠르게 변하는 값은 자주, 천천히 변하는 값은 드물게 읽습니다.
+DEFAULT_CADENCES = {
+    "cpu": 0.25,
+    "network": 0.5,
+    "disk_io": 0.5,
+    "ram": 1.0,
+    "disk_usage": 30.0,
+    "processes": 2.0,
+}
+
+# 프로세스 스캔이 수집 스레드 시간을 이 비율 이상 쓰면 스캔 주기를 늘립니다.
+PROCESS_SCAN_BUDGET = 0.05
+
+class Collector:
+    """
+    SystemMonitor, 수집 스케줄러, 집계기, 링 파일을 묶은 Qt 비의존 수집 코어입니다.
+
+    각 지표는 CollectorScheduler 에 자신의 주기로 등록되며, tick() 은 기한이 된 지표만 읽고
+    나머지는 최근 값을 재사용해 Snapshot 을 만듭니다. display_interval_ms 가 지날 때마다
+    그 사이 샘플을 합친 Snapshot 을 반환하고 나머지 호출에서는 None 을 반환합니다.
+    GUI 샘플러 스레드와 헤드리스 모드가 같은 코어를 사용합니다.
+
+    sample_interval_ms 는 CPU/네트워크/디스크 I/O 의 최대 주기로, 기본 주기보다 짧게 주면
+    (예: 50~100ms) 그 값으로 더 자주 읽습니다.
+
+    process_limit 가 0 보다 크면 ProcessScanner 로 상위 프로세스를 함께 수집합니다.
+    recorder(SnapshotRecorder)를 주면 화면에 보내는 Snapshot 을 그대로 녹화합니다.
+    percentiles(PercentileStore)를 주면 화면 주기로 합치기 전의 샘플을 매 틱 분위값 창에 더합니다.
+    """
+    def __init__(self, monitor, sample_interval_ms=1000, display_interval_ms=None, ring_file=None,
+                 cadences=None, process_limit=0, recorder=None, percentiles=None):
+        self.monitor = monitor
+        self.ring_file = ring_file
+        self.recorder = recorder
+        self.percentiles = percentiles
+        self.sample_interval_ms = max(MIN_SAMPLE_INTERVAL_MS, int(sample_interval_ms))
+        self.display_interval_ms = max(self.sample_interval_ms, int(display_interval_ms or sample_interval_ms))
+        self.aggregator = SnapshotAggregator()
+        self.disk_ids = ()
+
+        sample_seconds = self.sample_interval_ms / 1000
+        self.cadences = dict(DEFAULT_CADENCES)
+        for name in ("cpu", "network", "disk_io"):
+            self.cadences[name] = min(self.cadences[name], sample_seconds)
+        for name in ("ram", "disk_usage", "processes"):
+            self.cadences[name] = max(self.cadences[name], sample_seconds)
+        self.cadences.update(cadences or {})
+
+        self.scheduler = CollectorScheduler()
+        self.scheduler.add("cpu", lambda: tuple(monitor.get_cpu_usage()), self.cadences["cpu"])
+        self.scheduler.add("network", monitor.get_network_stats, self.cadences["network"])
+        self.scheduler.add("disk_io", monitor.get_disk_io, self.cadences["disk_io"])
+        self.scheduler.add("ram", monitor.get_ram_usage, self.cadences["ram"])
+        self.scheduler.add("disk_usage", self._disk_usage, self.cadences["disk_usage"])
+        self.process_scanner = None
+        if process_limit > 0:
+            self.process_scanner = ProcessScanner(process_limit)
+            self.scheduler.add("processes", self.process_scanner.scan, self.cadences["processes"],
+                               budget=PROCESS_SCAN_BUDGET)
+
+        # 타이머는 가장 짧은 주기로 돌고, 각 지표는 자신의 기한이 됐을 때만 읽습니다.
+        cadences_in_use = [self.cadences[name] for name in self.scheduler.collectors]
+        self.tick_interval_ms = max(MIN_SAMPLE_INTERVAL_MS, int(min(cadences_in_use) * 1000))
+        self.slowdown = 1.0
+        self.last_tick = time.monotonic()
+        self.last_emit = self.last_tick
+
+    def _disk_usage(self):
+        return {device_id: self.monitor.get_disk_usage(device_id) for device_id in self.disk_ids}
+
+    def set_static_info(self, info):
+        """정적 정보의 디스크 목록을 수집 대상으로 지정하고, 녹화 중이면 다음 프레임에 정적 정보를 남깁니다."""
+        if info:
+            self.set_disks(disk["device_id"] for disk in info["disks"])
+        if self.recorder is not None:
+            self.recorder.static_info = info
+
+    def set_disks(self, disk_ids):
+        """수집할 디스크 목록을 바꾸고 다음 틱에서 바로 사용량을 읽도록 합니다."""
+        self.disk_ids = tuple(disk_ids)
+        self.scheduler.collectors["disk_usage"].next_due = 0.0
+
+    def set_slowdown(self, factor):
+        """
+        창이 최소화되거나 가려졌을 때 모든 수집 주기와 화면 갱신 주기를 factor 배로 늘립니다.
+        1 이면 원래 주기로 돌아갑니다.
+        """
+        self.slowdown = max(1.0, float(factor))
+        self.scheduler.set_slowdown(self.slowdown)
+
+    def load_percentiles(self):
+        """
+        링 파일에 남은 히스토리로 분위값 창을 채웁니다. 링 파일 한 행은 화면 주기 하나이므로
+        그 사이의 틱 수만큼의 샘플로 셉니다.
+        """
+        if self.percentiles is None or self.ring_file is None:
+            return
+        longest = max(histogram.window for histogram in self.percentiles.windows.values())
+        timestamps, rows = self.ring_file.since(time.time() - longest)
+        weight = max(1, round(self.display_interval_ms / self.tick_interval_ms))
+        self.percentiles.load(timestamps, rows, weight)
+
+    def reset(self):
+        """수집을 (다시) 시작할 때 기준 시각을 초기화합니다."""
+        self.last_tick = time.monotonic()
+        self.last_emit = self.last_tick
+
+    def stats(self):
+        """
+        지표별 실제 수집 비용을 반환합니다. 프로세스 스캔 항목에는 마지막 스캔의 프로세스 수(processes)와
+        그중 RSS/I/O 를 다시 읽은 수(refreshed)도 들어 있습니다.
+        """
+        stats = self.scheduler.stats()
+        if self.process_scanner is not None:
+            stats["processes"]["processes"] = self.process_scanner.process_count
+            stats["processes"]["refreshed"] = self.process_scanner.refreshed_count
+        return stats
+
+    def tick(self):
+        now = time.monotonic()
+        interval = now - self.last_tick
+        self.last_tick = now
+        self.scheduler.run_due(now, tolerance=self.tick_interval_ms / 2000)
+        values = self.scheduler.values()
+        sample = self.monitor.make_snapshot(
+            cpu_percents=values["cpu"],
+            ram_percent=values["ram"],
+            network=values["network"],
+            disk_io=values["disk_io"],
+            disk_usage=values["disk_usage"],
+            interval=interval,
+            processes=values.get("processes") or (),
+        )
+        self.aggregator.add(sample)
+        if self.percentiles is not None:
+            # 화면 주기의 평균/최대가 아니라 매 샘플을 세므로 화면 주기보다 짧은 값도 분포에 들어갑니다.
+            self.percentiles.add(sample.timestamp, history_row(sample))
+
+        # 타이머가 밀려도 화면 갱신 주기가 유지되도록 실제 경과 시간으로 판단합니다.
+        # 틱 주기의 절반을 여유로 두어 경계에서 한 틱씩 밀리는 것을 막습니다.
+        due = (self.display_interval_ms - self.tick_interval_ms / 2) * self.slowdown / 1000
+        if now - self.last_emit < due:
+            return None
+        self.last_emit = now
+        snapshot = self.aggregator.flush()
+        if self.ring_file is not None:
+            self.ring_file.append(snapshot.timestamp, history_row(snapshot))
+        if self.recorder is not None:
+            self.recorder.write(snapshot)
+        return snapshot
@@ -0,0 +1,106 @@
+import numpy as np
+
+class DeviceCounterTable:
+    """
+    NIC/디스크별 누적 카운터를 장치 이름 → 고정 행 번호 표로 관리하고,
+    초당 속도를 NumPy 벡터 연산 한 번으로 계산합니다.
+
+    - 장치가 새로 나타나면 빈 행(사라진 장치가 반납한 행 포함)을 배정하고, 첫 틱의 속도는 0 입니다.
+    - 장치가 사라지면 행을 반납하므로, 컨테이너의 veth 처럼 장치가 계속 바뀌어도 표가 커지지 않습니다.
+    - 남아 있는 장치의 행 번호는 바뀌지 않습니다.
+    - 카운터가 줄어든 경우(드라이버 재시작 등)에는 그 장치의 속도를 0 으로 봅니다.
+
+    positions 는 psutil 이 돌려주는 namedtuple 에서 읽을 필드 위치입니다.
+    (예: net_io_counters 의 bytes_sent, bytes_recv 는 (0, 1))
+    """
+    def __init__(self, positions, capacity=8):
+        self.positions = tuple(positions)
+        width = len(self.positions)
+        self.index = {}
+        self.names = [None] * capacity
+        self.free = list(range(capacity - 1, -1, -1))
+        self.counters = np.zeros((capacity, width), dtype=np.float64)
+        self.rates = np.zeros((capacity, width), dtype=np.float64)
+        self.present = np.zeros(capacity, dtype=bool)
+        # 장치가 추가되거나 빠질 때마다 증가합니다. 화면은 이 값이 바뀔 때만 장치 목록을 다시 봅니다.
+        self.version = 0
+
+    def _grow(self):
+        capacity = len(self.names)
+        self.names.extend([None] * capacity)
+        self.free.extend(range(2 * capacity - 1, capacity - 1, -1))
+        self.counters = np.concatenate([self.counters, np.zeros_like(self.counters)])
+        self.rates = np.concatenate([self.rates, np.zeros_like(self.rates)])
+        self.present = np.concatenate([self.present, np.zeros_like(self.present)])
+
+    def _add(self, name):
+        if not self.free:
+            self._grow()
+        row = self.free.pop()
+        self.index[name] = row
+        self.names[row] = name
+        self.version += 1
+        return row
+
+    def update(self, counters, elapsed):
+        """
+        psutil 의 pernic/perdisk dict 로 카운터를 갱신하고 장치별 속도 배열을 반환합니다.
+        반환값은 내부 배열이므로 다음 update 전까지만 유효합니다.
+        """
+        positions = self.positions
+        index = self.index
+        rows = np.fromiter(
+            (index[name] if name in index else self._add(name) for name in counters),
+            dtype=np.intp, count=len(counters),
+        )
+        current = np.array(
+            [[values[p] for p in positions] for values in counters.values()], dtype=np.float64
+        ).reshape(len(rows), len(positions))
+
+        # 직전 틱에도 있던 장치만 속도를 계산하고, 새 장치는 0 에서 시작합니다.
+        was_present = self.present[rows]
+        self.rates[:] = 0.0
+        if elapsed > 0:
+            delta = current - self.counters[rows]
+            np.maximum(delta, 0.0, out=delta)
+            delta[~was_present] = 0.0
+            self.rates[rows] = delta / elapsed
+        self.counters[rows] = current
+
+        present = np.zeros_like(self.present)
+        present[rows] = True
+        gone = self.present & ~present
+        self.present = present
+        if gone.any():
+            for row in np.flatnonzero(gone):
+                del index[self.names[row]]
+                self.names[row] = None
+                self.counters[row] = 0.0
+                self.free.append(int(row))
+            self.version += 1
+        return self.rates
+
+    def totals(self, mask=None):
+        """현재 있는 장치(또는 mask 로 고른 장치)의 누적 카운터 합계입니다."""
+        selected = self.present if mask is None else self.present & mask
+        return self.counters[selected].sum(axis=0)
+
+    def rate_totals(self, mask=None):
+        selected = self.present if mask is None else self.present & mask
+        return self.rates[selected].sum(axis=0)
+
+    def mask(self, predicate):
+        """predicate(name) 이 참인 현재 장치의 행 마스크를 만듭니다."""
+        mask = np.zeros_like(self.present)
+        for name, row in self.index.items():
+            mask[row] = predicate(name)
+        return mask
+
+    def as_dict(self, mask=None):
+        """장치 이름 → 속도 튜플 dict. 스레드 사이로 넘길 수 있도록 값을 복사합니다."""
+        rates = self.rates.tolist()
+        return {
+            name: tuple(rates[row])
+            for name, row in self.index.items()
+            if mask is None or mask[row]
+        }
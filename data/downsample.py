@@ -0,0 +1,31 @@
+import numpy as np
+
+def minmax_downsample(values, pixel_width):
+    """
+    시계열을 픽셀 하나당 최소/최대 두 점으로 줄입니다.
+
+    각 구간에서 최소값과 최대값을 원래 순서대로 남기므로 짧은 피크가 사라지지 않고,
+    결과 점 수는 데이터 길이와 상관없이 최대 2 * pixel_width (+2) 개입니다.
+    (x 인덱스, y 값) 을 반환하며, 줄일 필요가 없으면 원본을 그대로 돌려줍니다.
+    """
+    count = len(values)
+    pixel_width = max(1, int(pixel_width))
+    if count <= 2 * pixel_width:
+        return np.arange(count), values
+
+    bucket = -(-count // pixel_width)
+    full = count - count % bucket
+    blocks = values[:full].reshape(-1, bucket)
+    starts = np.arange(0, full, bucket)
+    low = blocks.argmin(axis=1)
+    high = blocks.argmax(axis=1)
+
+    index = np.empty(2 * len(starts) + (2 if full < count else 0), dtype=np.intp)
+    index[0:2 * len(starts):2] = starts + np.minimum(low, high)
+    index[1:2 * len(starts):2] = starts + np.maximum(low, high)
+    if full < count:
+        # 나누어떨어지지 않고 남은 마지막 구간
+        tail = values[full:]
+        low, high = full + tail.argmin(), full + tail.argmax()
+        index[-2:] = (min(low, high), max(low, high))
+    return index, values[index]
@@ -0,0 +1,151 @@
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+JSONL_CONTENT_TYPE = "application/jsonl; charset=utf-8"
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _static_value(text):
+    """"OS | Windows 11" 형식의 정적 정보에서 값 부분만 꺼냅니다."""
+    return text.split("|", 1)[-1].strip()
+
+def snapshot_to_dict(snapshot):
+    """Snapshot 을 JSON 으로 직렬화할 수 있는 dict 로 변환합니다."""
+    values = {name: getattr(snapshot, name) for name in snapshot.__slots__}
+    values["cpu_percents"] = list(snapshot.cpu_percents)
+    values["disk_usage"] = {
+        device_id: {"used": used, "total": total, "percent": percent}
+        for device_id, (used, total, percent) in snapshot.disk_usage.items()
+    }
+    values["nic_rates"] = {
+        nic: {"sent": sent, "received": received} for nic, (sent, received) in snapshot.nic_rates.items()
+    }
+    values["disk_rates"] = {
+        disk: {"read": read, "write": write} for disk, (read, write) in snapshot.disk_rates.items()
+    }
+    # 명령줄에는 토큰 같은 민감한 인자가 들어 있을 수 있으므로 HTTP 로는 내보내지 않습니다.
+    values["processes"] = [
+        {key: value for key, value in process._asdict().items() if key != "cmdline"}
+        for process in snapshot.processes
+    ]
+    return values
+
+def render_openmetrics(snapshot, static_info=None):
+    """Snapshot 하나를 OpenMetrics 텍스트 형식으로 변환합니다."""
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {help_text}")
+        suffix = "_total" if kind == "counter" else "_info" if kind == "info" else ""
+        for labels, value in samples:
+            label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels)
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{name}{suffix}{label_text} {value}")
+
+    if static_info:
+        metric("pc_dashboard_system", "info", "Static system information.", [(
+            (("os", _static_value(static_info["os"])), ("cpu", _static_value(static_info["cpu"])),
+             ("gpu", _static_value(static_info["gpu"])), ("board", _static_value(static_info["board"]))),
+            1,
+        )])
+    metric("pc_dashboard_uptime_seconds", "gauge", "Seconds since boot.", [((), snapshot.uptime_seconds)])
+    metric("pc_dashboard_cpu_percent", "gauge", "Average CPU usage over all cores.", [((), snapshot.cpu_average)])
+    metric("pc_dashboard_cpu_core_percent", "gauge", "CPU usage per logical core.",
+           [((("core", i),), percent) for i, percent in enumerate(snapshot.cpu_percents)])
+    metric("pc_dashboard_memory_percent", "gauge", "RAM usage.", [((), snapshot.ram_percent)])
+    metric("pc_dashboard_network_bytes_per_second", "gauge", "Network throughput.", [
+        ((("direction", "sent"),), snapshot.sent_rate),
+        ((("direction", "received"),), snapshot.received_rate),
+    ])
+    metric("pc_dashboard_network_bytes", "counter", "Total network bytes since boot.", [
+        ((("direction", "sent"),), snapshot.sent_total),
+        ((("direction", "received"),), snapshot.received_total),
+    ])
+    metric("pc_dashboard_disk_io_bytes_per_second", "gauge", "Disk I/O throughput.", [
+        ((("direction", "read"),), snapshot.read_speed),
+        ((("direction", "write"),), snapshot.write_speed),
+    ])
+    metric("pc_dashboard_nic_bytes_per_second", "gauge", "Network throughput per NIC.", [
+        ((("nic", nic), ("direction", direction)), value)
+        for nic, rates in snapshot.nic_rates.items()
+        for direction, value in zip(("sent", "received"), rates)
+    ])
+    metric("pc_dashboard_disk_device_bytes_per_second", "gauge", "Disk I/O throughput per disk.", [
+        ((("disk", disk), ("direction", direction)), value)
+        for disk, rates in snapshot.disk_rates.items()
+        for direction, value in zip(("read", "write"), rates)
+    ])
+    metric("pc_dashboard_disk_used_bytes", "gauge", "Used bytes per disk.",
+           [((("device", device_id),), used) for device_id, (used, _, _) in snapshot.disk_usage.items()])
+    metric("pc_dashboard_disk_size_bytes", "gauge", "Total bytes per disk.",
+           [((("device", device_id),), total) for device_id, (_, total, _) in snapshot.disk_usage.items()])
+    lines.append("# EOF")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+class MetricsExporter:
+    """
+    최신 Snapshot 을 미리 직렬화해 두었다가 HTTP 요청에 그대로 돌려주는 익스포터입니다.
+    스크레이프 요청은 버퍼만 읽으므로 새 수집을 일으키지 않습니다.
+
+    /metrics        OpenMetrics 텍스트
+    /snapshot.json  최신 Snapshot JSON
+    /snapshots.jsonl 최근 Snapshot 들의 JSON lines (jsonl_history > 0 인 경우)
+    """
+    def __init__(self, static_info=None, jsonl_history=0):
+        self.static_info = static_info
+        self.lock = threading.Lock()
+        self.metrics_body = b"# EOF\n"
+        self.json_body = b"{}"
+        self.jsonl_lines = deque(maxlen=jsonl_history) if jsonl_history > 0 else None
+        self._jsonl_body = b""
+
+    def publish(self, snapshot):
+        """수집 스레드에서 호출합니다. 응답 본문을 한 번만 직렬화해 교체합니다."""
+        metrics_body = render_openmetrics(snapshot, self.static_info)
+        json_body = json.dumps(snapshot_to_dict(snapshot), ensure_ascii=False).encode("utf-8")
+        with self.lock:
+            self.metrics_body = metrics_body
+            self.json_body = json_body
+            if self.jsonl_lines is not None:
+                self.jsonl_lines.append(json_body)
+                self._jsonl_body = None
+
+    def jsonl_body(self):
+        with self.lock:
+            if self._jsonl_body is None:
+                self._jsonl_body = b"\n".join(self.jsonl_lines) + b"\n"
+            return self._jsonl_body
+
+    def handler_class(self):
+        """이 익스포터의 버퍼를 돌려주는 BaseHTTPRequestHandler 클래스를 만듭니다."""
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path in ("/", "/metrics"):
+                    body, content_type = exporter.metrics_body, OPENMETRICS_CONTENT_TYPE
+                elif path == "/snapshot.json":
+                    body, content_type = exporter.json_body, JSON_CONTENT_TYPE
+                elif path == "/snapshots.jsonl" and exporter.jsonl_lines is not None:
+                    body, content_type = exporter.jsonl_body(), JSONL_CONTENT_TYPE
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # 스크레이프마다 stderr 에 로그를 남기지 않습니다.
+                pass
+
+        return MetricsHandler
@@ -0,0 +1,59 @@
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from data.collector import Collector
+from data.exporter import MetricsExporter
+from data.history import HISTORY_COLUMNS
+from data.recording import SnapshotRecorder
+from data.ring_file import RingFile
+from data.system_monitor import SystemMonitor
+
+def run_headless(host="127.0.0.1", port=9100, sample_interval_ms=1000, display_interval_ms=None,
+                 history_path=None, jsonl_history=0, process_limit=0, record_path=None, monitor=None):
+    """
+    Qt 위젯 없이 수집만 실행하고, 최신 Snapshot 을 로컬 HTTP 포트로 제공합니다.
+    Ctrl+C 로 종료할 때까지 반환하지 않습니다. monitor 를 넘기면 SystemMonitor 대신 그 모니터로 수집합니다.
+    """
+    if monitor is None:
+        monitor = SystemMonitor()
+    static_info = monitor.get_static_system_info()
+    ring_file = RingFile(history_path, HISTORY_COLUMNS) if history_path else None
+    recorder = SnapshotRecorder(record_path) if record_path else None
+
+    collector = Collector(monitor, sample_interval_ms, display_interval_ms, ring_file, process_limit=process_limit,
+                          recorder=recorder)
+    collector.set_static_info(static_info)
+
+    exporter = MetricsExporter(static_info, jsonl_history)
+    server = ThreadingHTTPServer((host, port), exporter.handler_class())
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    print(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+
+    interval = collector.tick_interval_ms / 1000
+    deadline = time.monotonic()
+    collector.reset()
+    try:
+        while True:
+            snapshot = collector.tick()
+            if snapshot is not None:
+                exporter.publish(snapshot)
+
+            # 수집 시간만큼 밀리지 않도록 고정된 마감 시각을 기준으로 잠듭니다.
+            deadline += interval
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                deadline = time.monotonic()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        if ring_file is not None:
+            ring_file.close()
+        if recorder is not None:
+            recorder.close()
+    return 0
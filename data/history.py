@@ -0,0 +1,92 @@
+import numpy as np
+
+# 대시보드 그래프가 사용하는 시계열 열 순서
+HISTORY_COLUMNS = ("sent", "received", "cpu", "ram", "disk_read", "disk_write")
+
+def history_row(snapshot):
+    """
+    Snapshot 을 HISTORY_COLUMNS 순서의 한 행으로 변환합니다.
+    속도 열에는 구간 내 최대값(*_peak)을 사용해 짧은 버스트가 그래프에 남도록 합니다.
+    """
+    return (
+        snapshot.sent_peak, snapshot.received_peak, snapshot.cpu_average, snapshot.ram_percent,
+        snapshot.read_peak, snapshot.write_peak,
+    )
+
+class HistoryBuffer:
+    """
+    여러 시계열을 열(column) 단위로 저장하는 고정 크기 NumPy 링 버퍼입니다.
+
+    각 값을 pos 와 pos + capacity 두 곳에 기록하므로, 가장 오래된 값부터
+    최신 값까지가 항상 연속된 구간으로 존재합니다. 덕분에 view() 는 복사 없이
+    정렬된 배열을 돌려주고, append() 비용은 capacity 와 무관하게 열 개수에만 비례합니다.
+    """
+    def __init__(self, columns, capacity=100, dtype=np.float64):
+        self.columns = tuple(columns)
+        self.capacity = int(capacity)
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        self._buf = np.zeros((len(self.columns), 2 * self.capacity), dtype=dtype)
+        self._pos = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, values):
+        """columns 순서대로 한 행의 값을 추가합니다."""
+        pos = self._pos
+        self._buf[:, pos] = values
+        self._buf[:, pos + self.capacity] = values
+        self._pos = (pos + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def view(self, name):
+        """지정한 열을 오래된 순으로 정렬된 읽기 전용 뷰로 반환합니다."""
+        start = (self._pos - self._count) % self.capacity
+        view = self._buf[self._index[name], start:start + self._count]
+        view.flags.writeable = False
+        return view
+
+    def window(self):
+        """
+        모든 열을 (열 개수, 길이) 2차원 읽기 전용 뷰로 반환합니다. 시간 축은 오래된 순이며 복사하지 않습니다.
+        코어별 히스토리처럼 열 전체를 한 장의 이미지로 그릴 때 사용합니다.
+        """
+        start = (self._pos - self._count) % self.capacity
+        view = self._buf[:, start:start + self._count]
+        view.flags.writeable = False
+        return view
+
+    def last(self, name):
+        """지정한 열의 가장 최근 값을 반환합니다. 비어 있으면 None 입니다."""
+        if self._count == 0:
+            return None
+        return self._buf[self._index[name], (self._pos - 1) % self.capacity]
+
+    def replace_last(self, values):
+        """가장 최근 행을 덮어씁니다. 진행 중인 집계 구간을 갱신할 때 사용합니다."""
+        if self._count == 0:
+            self.append(values)
+            return
+        pos = (self._pos - 1) % self.capacity
+        self._buf[:, pos] = values
+        self._buf[:, pos + self.capacity] = values
+
+    def extend(self, rows):
+        """
+        (행 개수, 열 개수) 배열을 한 번에 추가합니다. 저장된 히스토리를 불러올 때 사용합니다.
+        """
+        rows = np.asarray(rows, dtype=self._buf.dtype)[-self.capacity:]
+        n = len(rows)
+        if n == 0:
+            return
+        positions = (self._pos + np.arange(n)) % self.capacity
+        self._buf[:, positions] = rows.T
+        self._buf[:, positions + self.capacity] = rows.T
+        self._pos = (self._pos + n) % self.capacity
+        self._count = min(self.capacity, self._count + n)
+
+    def clear(self):
+        self._pos = 0
+        self._count = 0
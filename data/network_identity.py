@@ -0,0 +1,139 @@
+import json
+import socket
+import time
+
+import psutil
+from PyQt6.QtCore import QObject, QTimer, QUrl, pyqtSignal
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+
+DEFAULT_EXTERNAL_IP_ENDPOINT = "https://api.ipify.org?format=json"
+
+class NetworkIdentityService(QObject):
+    """
+    내부/외부 IP 를 비동기로 조회하고 캐시하는 서비스입니다.
+
+    - 외부 IP 는 QNetworkAccessManager 로 조회하므로 GUI 스레드를 막지 않습니다.
+    - 성공한 결과는 ttl_seconds 동안 캐시하고, 실패하면 재시도 간격을 두 배씩 늘립니다.
+      갱신에 실패해도 마지막으로 받은 주소를 계속 보여 주고, 한 번도 받지 못했을 때만 실패 문구를 씁니다.
+    - 내부 IP 는 check_interval_ms 마다 인터페이스 주소 목록만 비교해 바뀐 경우에만 다시 구합니다.
+    - 결과는 identity_changed(internal_ip, external_ip) 시그널로 전달합니다.
+    """
+    identity_changed = pyqtSignal(str, str)
+
+    def __init__(self, endpoint=DEFAULT_EXTERNAL_IP_ENDPOINT, ttl_seconds=600, timeout_ms=3000,
+                 check_interval_ms=5000, min_backoff_seconds=15, max_backoff_seconds=600, parent=None):
+        super().__init__(parent)
+        self.endpoint = endpoint
+        self.ttl_seconds = ttl_seconds
+        self.timeout_ms = timeout_ms
+        self.min_backoff_seconds = min_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self.internal_ip = "127.0.0.1"
+        self.external_ip = "Fetching..."
+        self.last_external_ip = None
+        self.external_expires = 0.0
+        self.retry_at = 0.0
+        self.backoff_seconds = min_backoff_seconds
+        self.interface_signature = None
+        self.reply = None
+
+        self.manager = QNetworkAccessManager(self)
+        self.manager.finished.connect(self._on_reply)
+        self.check_timer = QTimer(self)
+        self.check_timer.timeout.connect(self.check)
+        self.check_interval_ms = check_interval_ms
+
+    def start(self):
+        """즉시 한 번 확인하고 주기적인 확인을 시작합니다. 네트워크 응답을 기다리지 않고 반환합니다."""
+        self.check()
+        self.check_timer.start(self.check_interval_ms)
+
+    def stop(self):
+        self.check_timer.stop()
+        if self.reply is not None:
+            self.reply.abort()
+
+    def check(self):
+        """인터페이스 변화를 확인하고, 필요하면 외부 IP 를 다시 조회합니다."""
+        signature = self._interface_signature()
+        if signature != self.interface_signature:
+            self.interface_signature = signature
+            self.internal_ip = self._lookup_internal_ip()
+            # 인터페이스가 바뀌면 외부 IP 도 바뀌었을 수 있으므로 캐시와 대기 시간을 무효화합니다.
+            self.external_expires = 0.0
+            self.retry_at = 0.0
+            self.backoff_seconds = self.min_backoff_seconds
+            self._emit()
+        self.refresh_external()
+
+    def refresh_external(self, force=False):
+        now = time.monotonic()
+        if self.reply is not None:
+            return
+        if not force and (now < self.external_expires or now < self.retry_at):
+            return
+        request = QNetworkRequest(QUrl(self.endpoint))
+        request.setTransferTimeout(self.timeout_ms)
+        self.reply = self.manager.get(request)
+
+    def _on_reply(self, reply):
+        self.reply = None
+        now = time.monotonic()
+        ip = None
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            ip = self._parse_ip(bytes(reply.readAll()))
+        reply.deleteLater()
+
+        if ip:
+            self.external_ip = self.last_external_ip = ip
+            self.external_expires = now + self.ttl_seconds
+            self.backoff_seconds = self.min_backoff_seconds
+        else:
+            # 실패하면 다음 시도까지 기다리는 시간을 늘려 매번 타임아웃을 기다리지 않게 합니다.
+            if self.last_external_ip is None:
+                self.external_ip = "Failed to fetch"
+            self.retry_at = now + self.backoff_seconds
+            self.backoff_seconds = min(self.max_backoff_seconds, self.backoff_seconds * 2)
+        self._emit()
+
+    def _emit(self):
+        self.identity_changed.emit(self.internal_ip, self.external_ip)
+
+    @staticmethod
+    def _parse_ip(body):
+        """{"ip": "..."} JSON 또는 IP 만 담긴 텍스트 응답에서 주소를 꺼냅니다."""
+        text = body.decode("utf-8", "replace").strip()
+        try:
+            value = json.loads(text)
+        except ValueError:
+            value = text
+        if isinstance(value, dict):
+            value = value.get("ip")
+        if not isinstance(value, str):
+            return None
+        try:
+            socket.inet_pton(socket.AF_INET6 if ":" in value else socket.AF_INET, value)
+        except OSError:
+            return None
+        return value
+
+    @staticmethod
+    def _interface_signature():
+        """IPv4/IPv6 인터페이스 주소 목록. 값이 바뀔 때만 내부 IP 를 다시 구합니다."""
+        return tuple(sorted(
+            (name, addr.address)
+            for name, addrs in psutil.net_if_addrs().items()
+            for addr in addrs
+            if addr.family in (socket.AF_INET, socket.AF_INET6)
+        ))
+
+    @staticmethod
+    def _lookup_internal_ip():
+        """기본 경로로 나가는 인터페이스의 주소를 구합니다. UDP connect 는 패킷을 보내지 않습니다."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(("8.8.8.8", 80))
+                return s.getsockname()[0]
+        except OSError:
+            return "127.0.0.1"
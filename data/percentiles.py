@@ -0,0 +1,138 @@
+import numpy as np
+
+# (창 길이 초, 하위 구간 수): 5분을 10초씩, 1시간을 2분씩, 24시간을 30분씩 나눕니다.
+DEFAULT_WINDOWS = ((300, 30), (3600, 30), (86400, 48))
+WINDOW_NAMES = {300: "5m", 3600: "1h", 86400: "24h"}
+QUANTILES = (0.50, 0.95, 0.99)
+
+# 값 구간(bin) 수. 백분율 열은 0~100 을 고르게, 속도 열은 1B/s~1TB/s 를 로그 간격으로 나눕니다.
+# 256 개면 백분율은 ±0.2%p, 속도는 ±6% 안쪽의 오차입니다.
+BINS = 256
+PERCENT_COLUMNS = ("cpu", "ram")
+RATE_LOG2_MAX = 40
+
+class SlidingHistogram:
+    """
+    최근 window 초 동안의 열별 값 분포입니다. 창을 slots 개의 하위 구간 히스토그램으로 나눈 링과,
+    그 합인 전체 히스토그램을 유지합니다.
+
+    - 샘플 하나는 현재 하위 구간과 전체 히스토그램의 칸을 하나씩 올리므로 O(열 수) 입니다.
+    - 하위 구간이 바뀔 때 가장 오래된 구간을 전체에서 빼고 비우므로, 원시 샘플을 보관하지 않고
+      메모리는 slots × 열 수 × bins 로 고정됩니다.
+    - 창 경계는 하위 구간 단위로 움직이므로 실제로 덮는 기간은 window - window/slots ~ window 초입니다.
+    """
+    def __init__(self, columns, window, slots, bins=BINS):
+        self.window = window
+        self.resolution = window / slots
+        self.rows = np.arange(columns)
+        self.slots = np.zeros((slots, columns, bins), dtype=np.uint32)
+        self.slot_buckets = np.full(slots, -1, dtype=np.int64)
+        self.total = np.zeros((columns, bins), dtype=np.int64)
+        self.bucket = None
+
+    def _advance(self, bucket):
+        # 새 하위 구간이 쓸 칸과, 창 밖으로 밀려난 구간을 전체에서 빼고 비웁니다.
+        expired = np.flatnonzero((self.slot_buckets >= 0) & (self.slot_buckets <= bucket - len(self.slots)))
+        for slot in expired:
+            self.total -= self.slots[slot]
+            self.slots[slot] = 0
+            self.slot_buckets[slot] = -1
+        self.slot_buckets[bucket % len(self.slots)] = bucket
+        self.bucket = bucket
+
+    def add(self, timestamp, bins):
+        """열마다 한 값의 구간 번호(bins)를 더합니다."""
+        bucket = int(timestamp // self.resolution)
+        if self.bucket is None or bucket > self.bucket:
+            self._advance(bucket)
+        # 시계가 뒤로 가면 현재 하위 구간에 넣습니다.
+        slot = self.bucket % len(self.slots)
+        self.slots[slot, self.rows, bins] += 1
+        self.total[self.rows, bins] += 1
+
+    def load(self, timestamps, bins, weight=1):
+        """
+        저장된 히스토리를 한 번에 채웁니다. timestamps 는 오름차순이고 bins 는 (행 수, 열 수) 입니다.
+        창에 들어가는 마지막 구간들만 더하며, 행 하나를 샘플 weight 개로 셉니다.
+        """
+        if len(timestamps) == 0:
+            return
+        buckets = (np.asarray(timestamps) // self.resolution).astype(np.int64)
+        last = int(buckets[-1])
+        if self.bucket is not None and last < self.bucket:
+            return
+        self._advance(last)
+        keep = buckets > last - len(self.slots)
+        buckets, bins = buckets[keep], np.asarray(bins)[keep]
+        slots = np.repeat(buckets % len(self.slots), bins.shape[1])
+        rows = np.tile(self.rows, len(buckets))
+        np.add.at(self.slots, (slots, rows, bins.ravel()), weight)
+        loaded = np.unique(buckets)
+        self.slot_buckets[loaded % len(self.slots)] = loaded
+        self.total[:] = self.slots.sum(axis=0)
+
+    def quantile_bins(self, quantiles):
+        """(열 수, 분위 수) 구간 번호 배열입니다. 샘플이 없는 열은 -1 입니다."""
+        cumulative = np.cumsum(self.total, axis=1)
+        counts = cumulative[:, -1:]
+        targets = np.asarray(quantiles)[None, :] * counts
+        # 누적 개수가 목표 순위 이상이 되는 첫 구간
+        found = (cumulative[:, :, None] >= np.maximum(targets, 1)[:, None, :]).argmax(axis=1)
+        return np.where(counts > 0, found, -1)
+
+class PercentileStore:
+    """
+    HISTORY_COLUMNS 의 각 열에 대해 5분/1시간/24시간 창의 p50/p95/p99 를 추정합니다.
+    값은 고정된 구간으로 나눠 세므로 분위값은 구간 대표값(가운데)이고, 메모리는 창과 열마다 고정입니다.
+    """
+    def __init__(self, columns, windows=DEFAULT_WINDOWS, bins=BINS):
+        self.columns = tuple(columns)
+        self.bins = bins
+        self.percent = np.array([name in PERCENT_COLUMNS for name in self.columns])
+        self.windows = {window: SlidingHistogram(len(self.columns), window, slots, bins) for window, slots in windows}
+        # 구간 번호 → 대표값 (열마다 백분율/속도 눈금 중 하나)
+        centers = np.arange(bins) + 0.5
+        percent_values = centers * 100 / bins
+        rate_values = np.exp2(centers * RATE_LOG2_MAX / bins)
+        self.values = np.where(self.percent[:, None], percent_values, rate_values)
+        # 속도의 첫 구간은 0~1B/s 이므로 0 으로 표시합니다.
+        self.values[~self.percent, 0] = 0.0
+
+    def to_bins(self, rows):
+        """(…, 열 수) 값 배열을 같은 모양의 구간 번호 배열로 바꿉니다."""
+        rows = np.asarray(rows, dtype=np.float64)
+        percent_bins = rows * (self.bins / 100)
+        with np.errstate(divide="ignore"):
+            rate_bins = np.log2(np.maximum(rows, 1.0)) * (self.bins / RATE_LOG2_MAX)
+        bins = np.where(self.percent, percent_bins, rate_bins)
+        return np.clip(bins, 0, self.bins - 1).astype(np.intp)
+
+    def add(self, timestamp, values):
+        bins = self.to_bins(values)
+        for histogram in self.windows.values():
+            histogram.add(timestamp, bins)
+
+    def load(self, timestamps, rows, weight=1):
+        """
+        저장된 히스토리를 채웁니다. 히스토리 한 행이 실시간 샘플 여러 개의 구간이면 weight 로 그 수를 줘서
+        불러온 기간과 이후 실시간 샘플이 같은 시간 비중을 갖게 합니다.
+        """
+        if len(timestamps) == 0:
+            return
+        bins = self.to_bins(rows)
+        for histogram in self.windows.values():
+            histogram.load(timestamps, bins, weight)
+
+    def quantiles(self, window, quantiles=QUANTILES):
+        """
+        {열 이름: (p50, p95, p99)} 입니다. 창에 샘플이 없으면 그 열은 None 입니다.
+        """
+        found = self.windows[window].quantile_bins(quantiles)
+        result = {}
+        for i, name in enumerate(self.columns):
+            result[name] = None if found[i, 0] < 0 else tuple(float(v) for v in self.values[i, found[i]])
+        return result
+
+    def summary(self, quantiles=QUANTILES):
+        """{창 길이: quantiles(창)} 입니다. 수집 쪽에서 만들어 화면에 그대로 넘기는 완성된 값입니다."""
+        return {window: self.quantiles(window, quantiles) for window in self.windows}
@@ -0,0 +1,134 @@
+import heapq
+import time
+from collections import namedtuple
+
+import psutil
+
+# 패널 한 줄. cpu_percent 는 top 과 같이 코어 하나를 100% 로 봅니다.
+ProcessInfo = namedtuple("ProcessInfo", ("pid", "name", "cmdline", "cpu_percent", "rss", "io_bytes", "io_rate"))
+
+PROCESS_SORT_KEYS = {
+    "cpu": lambda info: info.cpu_percent,
+    "rss": lambda info: info.rss,
+    "io": lambda info: info.io_rate,
+}
+
+class _ProcessEntry:
+    """PID 하나에 대해 캐시한 정적 정보와 직전 카운터 값입니다."""
+    __slots__ = ("create_time", "name", "cmdline", "cpu_time", "rss", "io_bytes", "io_rate", "io_denied",
+                 "refreshed", "seen")
+
+    def __init__(self, create_time, name, cmdline):
+        self.create_time = create_time
+        self.name = name
+        self.cmdline = cmdline
+        self.cpu_time = None
+        self.rss = 0
+        self.io_bytes = None
+        self.io_rate = 0.0
+        self.io_denied = False
+        self.refreshed = None
+        self.seen = 0
+
+class ProcessScanner:
+    """
+    프로세스 목록을 주기적으로 훑어 CPU, RSS, I/O 상위 N 개를 구하는 증분 스캐너입니다.
+
+    - 이름과 명령줄은 (PID, 생성 시각) 별로 처음 볼 때 한 번만 읽어 캐시합니다.
+    - 매 스캔에서는 psutil.process_iter(attrs=...) 로 CPU 시간만 읽습니다. (리눅스에서는 /proc/<pid>/stat 하나)
+    - RSS 와 I/O 카운터는 CPU 시간이 늘어난 프로세스만 매번 다시 읽고, 유휴 프로세스는
+      refresh_every 스캔마다 한 번씩 (PID 별로 분산해서) 읽습니다. 수천 개의 유휴 프로세스가 있어도
+      스캔 비용이 활성 프로세스 수에 비례합니다.
+    - I/O 카운터 접근이 거부된 프로세스는 다시 시도하지 않습니다.
+    - CPU 와 I/O 는 직전 값과의 차이로 계산하므로 cpu_percent(interval) 처럼 기다리지 않습니다.
+    - 사라진 PID 는 캐시에서 지우고, PID 가 재사용되면 생성 시각으로 구분합니다.
+    """
+    SCAN_ATTRS = ("create_time", "cpu_times")
+
+    def __init__(self, limit=10, sort_key="cpu", refresh_every=5):
+        self.limit = limit
+        self.sort_key = sort_key
+        self.refresh_every = refresh_every
+        self.entries = {}
+        self.generation = 0
+        self.last_scan = None
+        self.process_count = 0
+        self.refreshed_count = 0
+
+    def _static_entry(self, proc, create_time):
+        """처음 보는 프로세스의 이름과 명령줄을 읽습니다."""
+        try:
+            with proc.oneshot():
+                name = proc.name()
+                try:
+                    cmdline = " ".join(proc.cmdline())
+                except (psutil.AccessDenied, psutil.ZombieProcess):
+                    cmdline = ""
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            name, cmdline = str(proc.pid), ""
+        return _ProcessEntry(create_time, name or str(proc.pid), cmdline)
+
+    def _refresh_counters(self, proc, entry, now):
+        """RSS 와 I/O 카운터를 다시 읽습니다. I/O 속도는 마지막으로 읽은 시각과의 차이로 구합니다."""
+        try:
+            with proc.oneshot():
+                entry.rss = proc.memory_info().rss
+                if not entry.io_denied:
+                    try:
+                        counters = proc.io_counters()
+                    except (psutil.AccessDenied, AttributeError):
+                        # AttributeError: io_counters 를 지원하지 않는 플랫폼 (macOS)
+                        entry.io_denied = True
+                    else:
+                        io_bytes = counters.read_bytes + counters.write_bytes
+                        if entry.io_bytes is not None and entry.refreshed is not None and now > entry.refreshed:
+                            entry.io_rate = max(0, io_bytes - entry.io_bytes) / (now - entry.refreshed)
+                        entry.io_bytes = io_bytes
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return
+        entry.refreshed = now
+
+    def scan(self):
+        """모든 프로세스의 카운터를 갱신하고 sort_key 기준 상위 limit 개를 반환합니다."""
+        now = time.monotonic()
+        elapsed = now - self.last_scan if self.last_scan is not None else 0.0
+        self.last_scan = now
+        self.generation += 1
+        generation = self.generation
+        refresh_slot = generation % self.refresh_every
+        entries = self.entries
+        rows = []
+        refreshed = 0
+
+        for proc in psutil.process_iter(self.SCAN_ATTRS, ad_value=None):
+            info = proc.info
+            pid = proc.pid
+            entry = entries.get(pid)
+            if entry is None or entry.create_time != info["create_time"]:
+                entry = entries[pid] = self._static_entry(proc, info["create_time"])
+            entry.seen = generation
+
+            cpu_percent = 0.0
+            active = entry.refreshed is None
+            cpu_times = info["cpu_times"]
+            if cpu_times is not None:
+                cpu_time = cpu_times.user + cpu_times.system
+                if entry.cpu_time is not None and cpu_time != entry.cpu_time:
+                    active = True
+                    if elapsed > 0:
+                        cpu_percent = max(0.0, cpu_time - entry.cpu_time) / elapsed * 100
+                entry.cpu_time = cpu_time
+
+            if active or pid % self.refresh_every == refresh_slot:
+                self._refresh_counters(proc, entry, now)
+                refreshed += 1
+
+            rows.append(ProcessInfo(pid, entry.name, entry.cmdline, cpu_percent, entry.rss,
+                                    entry.io_bytes or 0, entry.io_rate))
+
+        # 이번 스캔에서 보이지 않은 PID 는 종료된 것이므로 캐시에서 지웁니다.
+        for pid in [pid for pid, entry in entries.items() if entry.seen != generation]:
+            del entries[pid]
+        self.process_count = len(rows)
+        self.refreshed_count = refreshed
+        return tuple(heapq.nlargest(self.limit, rows, key=PROCESS_SORT_KEYS[self.sort_key]))
@@ -0,0 +1,225 @@
+import json
+import selectors
+import socket
+import threading
+import time
+from collections import namedtuple
+
+from data.history import HISTORY_COLUMNS, HistoryBuffer, history_row
+from data.snapshot_codec import FORMAT_VERSION, SnapshotDecoder
+from data.wire import MAX_FRAME_BYTES, FrameReader
+
+# 화면이 읽는 호스트 상태의 복사본. Snapshot 은 만들어진 뒤 바뀌지 않으므로 참조만 복사합니다.
+HostStatus = namedtuple("HostStatus", ("name", "address", "snapshot", "last_seen", "frames", "connected"))
+
+class HostState:
+    """
+    수신기가 호스트 하나에 대해 보관하는 상태입니다. 최신 Snapshot 과 정적 정보, 고정 크기 히스토리만
+    두므로 호스트당 메모리는 실행 시간과 상관없이 일정합니다.
+    """
+    __slots__ = ("name", "address", "static_info", "snapshot", "history", "last_seen", "frames", "connected",
+                 "listeners")
+
+    def __init__(self, name, address, history_points):
+        self.name = name
+        self.address = address
+        self.static_info = None
+        self.snapshot = None
+        self.history = HistoryBuffer(HISTORY_COLUMNS, capacity=history_points)
+        self.last_seen = 0.0
+        self.frames = 0
+        self.connected = False
+        # (on_snapshot, on_static_info) 쌍. 수신 스레드에서 호출됩니다.
+        self.listeners = []
+
+class _Connection:
+    __slots__ = ("sock", "address", "reader", "decoder", "state")
+
+    def __init__(self, sock, address, max_frame_bytes):
+        self.sock = sock
+        self.address = address
+        self.reader = FrameReader(max_frame_bytes)
+        self.decoder = SnapshotDecoder()
+        self.state = None
+
+class HostReceiver:
+    """
+    에이전트(--agent)들이 보내는 스냅샷을 받는 TCP 수신기입니다.
+
+    - 스레드 하나에서 selectors 로 모든 연결을 다루므로 호스트 수만큼 스레드를 만들지 않습니다.
+    - 에이전트는 연결 직후 hello(호스트 이름)를 보내고, 이후 화면 주기마다 바이너리 스냅샷을 보냅니다.
+      정적 정보는 스냅샷 프레임에 바뀔 때만 실려 옵니다.
+    - 같은 이름으로 다시 연결하면 기존 상태(히스토리 포함)를 이어서 씁니다.
+    - 호스트 수는 max_hosts, 연결별 수신 버퍼는 max_frame_bytes 로 제한합니다.
+
+    화면은 statuses() 로 주기적으로 상태의 복사본을 읽고, 상세 화면은 subscribe() 로 해당 호스트의 스냅샷을 받습니다.
+    """
+    def __init__(self, host="0.0.0.0", port=9200, history_points=60, max_hosts=1024,
+                 max_frame_bytes=MAX_FRAME_BYTES):
+        self.address = (host, port)
+        self.history_points = history_points
+        self.max_hosts = max_hosts
+        self.max_frame_bytes = max_frame_bytes
+        self.lock = threading.Lock()
+        self.states = {}
+        self.selector = None
+        self.server = None
+        self.thread = None
+        self.running = False
+        self.frames = 0
+        self.rejected = 0
+
+    def start(self):
+        """소켓을 열고 수신 스레드를 시작합니다. 실제로 바인드된 (host, port) 를 반환합니다."""
+        self.server = socket.create_server(self.address)
+        self.server.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.server, selectors.EVENT_READ)
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="host-receiver", daemon=True)
+        self.thread.start()
+        return self.server.getsockname()[:2]
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        selector = self.selector
+        try:
+            while self.running:
+                for key, _ in selector.select(timeout=0.2):
+                    if key.data is None:
+                        self._accept()
+                    else:
+                        self._read(key.data)
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    self._close(key.data)
+            selector.close()
+            self.server.close()
+
+    def _accept(self):
+        try:
+            sock, address = self.server.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        self.selector.register(sock, selectors.EVENT_READ, _Connection(sock, address, self.max_frame_bytes))
+
+    def _close(self, connection):
+        self.selector.unregister(connection.sock)
+        connection.sock.close()
+        if connection.state is not None:
+            connection.state.connected = False
+
+    def _read(self, connection):
+        try:
+            data = connection.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close(connection)
+            return
+        try:
+            for payload in connection.reader.feed(data):
+                if connection.state is None:
+                    self._hello(connection, json.loads(payload))
+                else:
+                    self._frame(connection, payload)
+        except Exception as e:
+            # 형식이 맞지 않는 연결은 끊습니다. 어떤 예외든 이 연결만 끊고 수신 스레드와 다른 호스트는 계속 돕니다.
+            # 에이전트가 다시 연결하면 키프레임부터 다시 받습니다.
+            print(f"{connection.address[0]} 의 메시지를 처리하지 못해 연결을 끊습니다: {e}")
+            self._close(connection)
+
+    def _hello(self, connection, message):
+        if message["type"] != "hello" or message.get("format") != FORMAT_VERSION:
+            raise ValueError(f"unsupported agent hello: {message}")
+        name = str(message.get("host") or connection.address[0])
+        with self.lock:
+            state = self.states.get(name)
+            if state is None:
+                if len(self.states) >= self.max_hosts:
+                    self.rejected += 1
+                    raise ValueError(f"too many hosts ({self.max_hosts})")
+                state = self.states[name] = HostState(name, connection.address[0], self.history_points)
+            state.address = connection.address[0]
+            state.connected = True
+        connection.state = state
+
+    def _frame(self, connection, payload):
+        decoder = connection.decoder
+        snapshot = decoder.decode(payload)
+        state = connection.state
+        if decoder.static_changed:
+            # 다시 연결한 에이전트의 첫 키프레임은 새 디코더에는 바뀐 정보지만 이미 받아 둔 정보와 같을 수 있습니다.
+            # 내용이 달라졌을 때만 구독자에게 알립니다.
+            with self.lock:
+                changed = decoder.static_info != state.static_info
+                state.static_info = decoder.static_info
+                listeners = list(state.listeners) if changed else []
+            for _, on_static_info in listeners:
+                on_static_info(decoder.static_info)
+        self._snapshot(state, snapshot)
+
+    def _snapshot(self, state, snapshot):
+        with self.lock:
+            state.snapshot = snapshot
+            state.history.append(history_row(snapshot))
+            state.last_seen = time.monotonic()
+            state.frames += 1
+            self.frames += 1
+            listeners = list(state.listeners)
+        for on_snapshot, _ in listeners:
+            on_snapshot(snapshot)
+
+    def hosts(self):
+        """호스트 상태 목록(이름 순)입니다. 상태 객체는 공유되므로 값을 읽기만 해야 합니다."""
+        with self.lock:
+            return [self.states[name] for name in sorted(self.states)]
+
+    def statuses(self):
+        """호스트 상태의 복사본 목록(이름 순)입니다. 수신 스레드가 쓰는 중에도 한 호스트의 값끼리 어긋나지 않습니다."""
+        with self.lock:
+            return [
+                HostStatus(state.name, state.address, state.snapshot, state.last_seen, state.frames, state.connected)
+                for state in (self.states[name] for name in sorted(self.states))
+            ]
+
+    def history_rows(self, name, count=None):
+        """
+        호스트 히스토리를 오래된 순 (행 개수, 열 개수) 배열로 복사해 반환합니다. count 를 주면 마지막 count 행만 줍니다.
+        상세 화면을 열 때 그래프를 채우는 데 씁니다.
+        """
+        with self.lock:
+            rows = self.states[name].history.window().T
+            return rows[-count:].copy() if count else rows.copy()
+
+    def history(self, name, column):
+        """호스트 히스토리 한 열의 복사본입니다. 수신 스레드가 쓰는 중에도 안전하게 읽을 수 있습니다."""
+        with self.lock:
+            return self.states[name].history.view(column).copy()
+
+    def subscribe(self, name, on_snapshot, on_static_info):
+        """
+        호스트의 새 스냅샷과 정적 정보를 받을 콜백을 등록합니다. 콜백은 수신 스레드에서 호출되므로
+        Qt 시그널의 emit 처럼 스레드 사이로 안전하게 넘기는 함수여야 합니다.
+        호스트 목록에는 hello 를 받은 호스트만 있으므로, 받아 둔 정적 정보를 등록 즉시 한 번 전달합니다.
+        """
+        with self.lock:
+            state = self.states[name]
+            state.listeners.append((on_snapshot, on_static_info))
+            static_info = state.static_info
+        on_static_info(static_info)
+
+    def unsubscribe(self, name, on_snapshot):
+        with self.lock:
+            state = self.states.get(name)
+            if state is not None:
+                state.listeners = [pair for pair in state.listeners if pair[0] != on_snapshot]
@@ -0,0 +1,58 @@
+import struct
+
+from data.snapshot_codec import FORMAT_VERSION, SnapshotDecoder, SnapshotEncoder
+from data.wire import FRAME_HEADER, encode_frame
+
+# 녹화 파일 = 헤더(매직, 스냅샷 형식 버전) + 길이 접두 프레임들. 프레임은 exact=True 인 SnapshotEncoder 출력입니다.
+RECORDING_MAGIC = b"PCDREC"
+RECORDING_HEADER = struct.Struct("<6sH")
+
+class SnapshotRecorder:
+    """
+    Collector 가 화면에 보낸 Snapshot 을 그대로 파일에 기록합니다.
+    실수 배열을 float64 로 기록하므로 재생하면 같은 값이 복원되고, 프레임마다 flush 하므로
+    프로세스가 비정상 종료해도 마지막 프레임까지 읽을 수 있습니다.
+    static_info 를 지정하면 바뀐 뒤의 첫 프레임에 함께 기록됩니다.
+    """
+    def __init__(self, path, keyframe_interval=600):
+        self.path = path
+        self.encoder = SnapshotEncoder(keyframe_interval=keyframe_interval, exact=True)
+        self.static_info = None
+        self.frames = 0
+        self.file = open(path, "wb")
+        self.file.write(RECORDING_HEADER.pack(RECORDING_MAGIC, FORMAT_VERSION))
+
+    def write(self, snapshot):
+        self.file.write(encode_frame(self.encoder.encode(snapshot, self.static_info)))
+        self.file.flush()
+        self.frames += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+def read_recording(path):
+    """
+    녹화 파일의 (Snapshot, 정적 정보) 를 순서대로 돌려주는 제너레이터입니다.
+    정적 정보는 바뀐 프레임에서만 dict 이고 나머지는 None 입니다. 끝이 잘린 프레임은 무시합니다.
+    """
+    decoder = SnapshotDecoder()
+    with open(path, "rb") as f:
+        header = f.read(RECORDING_HEADER.size)
+        if len(header) < RECORDING_HEADER.size:
+            raise ValueError(f"{path}: not a recording")
+        magic, version = RECORDING_HEADER.unpack(header)
+        if magic != RECORDING_MAGIC:
+            raise ValueError(f"{path}: not a recording")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported snapshot format version {version}")
+        while True:
+            length_bytes = f.read(FRAME_HEADER.size)
+            if len(length_bytes) < FRAME_HEADER.size:
+                return
+            (length,) = FRAME_HEADER.unpack(length_bytes)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            snapshot = decoder.decode(payload)
+            yield snapshot, decoder.static_info if decoder.static_changed else None
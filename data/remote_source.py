@@ -0,0 +1,64 @@
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from data.history import HISTORY_COLUMNS, history_row
+from data.percentiles import PercentileStore
+
+class RemoteHostSource(QObject):
+    """
+    HostReceiver 가 받은 원격 호스트 하나의 스냅샷을 BackgroundSampler 와 같은 인터페이스로 제공합니다.
+    DashboardApp(source=...) 에 넘기면 기존 패널이 그대로 그 호스트를 보여 줍니다.
+    수신 스레드에서 시그널을 emit 하므로 슬롯은 큐 연결로 GUI 스레드에서 실행됩니다.
+    분위값 창도 수신 스레드에서 받은 스냅샷마다 갱신하고 완성된 값만 보냅니다.
+    """
+    snapshot_ready = pyqtSignal(object)
+    static_info_ready = pyqtSignal(object)
+    percentiles_ready = pyqtSignal(object)
+    # 원격 호스트의 히스토리는 링 파일이 아니라 수신기 메모리에 있습니다.
+    ring_file = None
+
+    def __init__(self, receiver, host_name, parent=None):
+        super().__init__(parent)
+        self.receiver = receiver
+        self.host_name = host_name
+        self.percentiles = PercentileStore(HISTORY_COLUMNS)
+
+    def connect(self, slot):
+        self.snapshot_ready.connect(slot, Qt.ConnectionType.QueuedConnection)
+
+    def connect_static_info(self, slot):
+        self.static_info_ready.connect(slot, Qt.ConnectionType.QueuedConnection)
+
+    def connect_percentiles(self, slot):
+        self.percentiles_ready.connect(slot, Qt.ConnectionType.QueuedConnection)
+
+    def describe(self):
+        """IP 라벨에 표시할 (주소, 호스트 이름) 입니다."""
+        for status in self.receiver.statuses():
+            if status.name == self.host_name:
+                return status.address, self.host_name
+        return "-", self.host_name
+
+    def history_rows(self, count):
+        """수신기가 이 호스트에 대해 모아 둔 히스토리의 마지막 count 행입니다. 상세 화면의 그래프를 채웁니다."""
+        return self.receiver.history_rows(self.host_name, count)
+
+    def set_slowdown(self, factor):
+        # 수집 주기는 에이전트가 정하므로 창이 가려져도 바꾸지 않습니다.
+        pass
+
+    def collector_stats(self):
+        return {}
+
+    def start(self):
+        self.receiver.subscribe(self.host_name, self._on_snapshot, self._on_static_info)
+
+    def stop(self):
+        self.receiver.unsubscribe(self.host_name, self._on_snapshot)
+
+    def _on_snapshot(self, snapshot):
+        self.snapshot_ready.emit(snapshot)
+        self.percentiles.add(snapshot.timestamp, history_row(snapshot))
+        self.percentiles_ready.emit(self.percentiles.summary())
+
+    def _on_static_info(self, info):
+        self.static_info_ready.emit(info)
@@ -0,0 +1,187 @@
+import math
+import os
+import time
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from data.history import HISTORY_COLUMNS, history_row
+from data.percentiles import PercentileStore
+from data.recording import read_recording
+
+def _percentiles_ms(samples):
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+
+    def at(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000
+    return {"p50": at(50), "p95": at(95), "p99": at(99), "max": ordered[-1] * 1000}
+
+class ReplaySource(QObject):
+    """
+    녹화 파일(SnapshotRecorder)을 BackgroundSampler 와 같은 인터페이스로 재생합니다.
+    DashboardApp(source=...) 에 넘기면 실제 수집 없이 녹화된 Snapshot 으로 화면이 갱신됩니다.
+
+    - speed 배속으로 녹화 시각 간격을 따라 재생합니다. 0 이면 기다리지 않고 최대한 빨리 재생합니다.
+    - GUI 스레드의 타이머로 보내고 슬롯을 직접 호출하므로, 보낸 뒤 반환까지가 한 틱의 UI 반영 시간입니다.
+    - 배속 재생에서 화면이 따라오지 못해 다음 프레임의 재생 시각까지 지난 경우 밀린 프레임은 건너뛰고
+      (frames dropped) 가장 최근 프레임만 보냅니다.
+    - 끝나면 finished 시그널로 report() 를 보냅니다. 손상된 프레임을 만나면 그 앞에서 끝내고 report() 의
+      error 에 위치를 남깁니다.
+    - 분위값 창에는 건너뛴 프레임까지 모두 더하고, 보낸 프레임마다 완성된 값을 percentiles_ready 로 보냅니다.
+    """
+    snapshot_ready = pyqtSignal(object)
+    static_info_ready = pyqtSignal(object)
+    percentiles_ready = pyqtSignal(object)
+    finished = pyqtSignal(object)
+    ring_file = None
+
+    def __init__(self, path, speed=1.0, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.speed = max(0.0, float(speed))
+        self.frames = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.play_next)
+        self.pending = None
+        self.origin = 0.0
+        self.started = 0.0
+        self.played = 0
+        self.dropped = 0
+        self.latencies = []
+        self.apply_times = []
+        self.recorded_seconds = 0.0
+        self.frames_read = 0
+        self.error = None
+        self.percentiles = PercentileStore(HISTORY_COLUMNS)
+
+    def connect(self, slot):
+        # 재생은 GUI 스레드에서 일어나므로 직접 연결로 호출 시간을 그대로 잽니다.
+        self.snapshot_ready.connect(slot, Qt.ConnectionType.DirectConnection)
+
+    def connect_static_info(self, slot):
+        self.static_info_ready.connect(slot, Qt.ConnectionType.QueuedConnection)
+
+    def connect_percentiles(self, slot):
+        self.percentiles_ready.connect(slot, Qt.ConnectionType.DirectConnection)
+
+    def describe(self):
+        return "replay", os.path.basename(self.path)
+
+    def history_rows(self, count):
+        # 재생은 녹화의 처음부터 그래프를 채웁니다.
+        return None
+
+    def set_slowdown(self, factor):
+        # 녹화된 시간축을 그대로 따르므로 창이 가려져도 재생 속도를 바꾸지 않습니다.
+        pass
+
+    def collector_stats(self):
+        return {}
+
+    def start(self):
+        self.frames = read_recording(self.path)
+        first = self.read_frame()
+        if first is None:
+            self.static_info_ready.emit(None)
+            self.finished.emit(self.report())
+            return
+        snapshot, static_info = first
+        self.static_info_ready.emit(static_info)
+        self.origin = snapshot.timestamp
+        self.pending = (snapshot, None)
+        # 호출한 쪽(DashboardApp.initialize_app)이 그래프를 다 붙인 뒤에 재생 시계를 시작합니다.
+        QTimer.singleShot(0, self.begin)
+
+    def begin(self):
+        if self.pending is None:
+            return
+        self.started = time.perf_counter()
+        self.pending = (self.pending[0], self.started)
+        self.schedule()
+
+    def stop(self):
+        self.timer.stop()
+        self.pending = None
+
+    def next_frame(self):
+        """다음 (Snapshot, 재생 시각) 입니다. 녹화 중간에 바뀐 정적 정보는 화면 구성을 바꾸지 않으므로 무시합니다."""
+        item = self.read_frame()
+        if item is None:
+            return None
+        snapshot = item[0]
+        self.recorded_seconds = snapshot.timestamp - self.origin
+        if self.speed == 0:
+            return snapshot, None
+        return snapshot, self.started + (snapshot.timestamp - self.origin) / self.speed
+
+    def read_frame(self):
+        """
+        녹화의 다음 (Snapshot, 정적 정보) 입니다. 손상된 프레임을 만나면 끝이 잘린 녹화처럼 None 을 돌려주어
+        재생을 거기서 끝내고, 어디서 멈췄는지 출력하고 report() 의 error 에 남깁니다.
+        """
+        try:
+            item = next(self.frames, None)
+        except ValueError as e:
+            self.timer.stop()
+            self.error = f"frame {self.frames_read + 1} ({self.recorded_seconds:.1f}s into the recording): {e}"
+            print(f"녹화의 {self.frames_read + 1}번째 프레임이 손상되어 재생을 멈춥니다 "
+                  f"({self.recorded_seconds:.1f}s 까지 재생): {e}")
+            return None
+        if item is not None:
+            self.frames_read += 1
+        return item
+
+    def schedule(self):
+        if self.pending is None:
+            self.finished.emit(self.report())
+            return
+        snapshot, due = self.pending
+        if due is None:
+            # 최대 속도 재생: 예약한 시각부터 반영까지(그 사이의 페인트 포함)를 지연으로 봅니다.
+            self.pending = (snapshot, time.perf_counter())
+            self.timer.start(0)
+            return
+        self.timer.start(max(0, math.ceil((due - time.perf_counter()) * 1000)))
+
+    def play_next(self):
+        if self.pending is None:
+            return
+        now = time.perf_counter()
+        snapshot, due = self.pending
+        percentiles = self.percentiles
+        following = self.next_frame()
+        if self.speed > 0:
+            while following is not None and following[1] <= now:
+                self.dropped += 1
+                percentiles.add(snapshot.timestamp, history_row(snapshot))
+                snapshot, due = following
+                following = self.next_frame()
+
+        self.snapshot_ready.emit(snapshot)
+        percentiles.add(snapshot.timestamp, history_row(snapshot))
+        self.percentiles_ready.emit(percentiles.summary())
+        done = time.perf_counter()
+        self.played += 1
+        self.latencies.append(done - due)
+        self.apply_times.append(done - now)
+        self.pending = following
+        self.schedule()
+
+    def report(self):
+        """재생 결과: 보낸/건너뛴 프레임 수, 예정 시각부터 반영 완료까지의 지연, UI 반영 시간(ms)."""
+        wall_seconds = time.perf_counter() - self.started if self.started else 0.0
+        return {
+            "path": self.path,
+            "speed": self.speed,
+            "frames_played": self.played,
+            "frames_dropped": self.dropped,
+            "recorded_seconds": self.recorded_seconds,
+            "wall_seconds": wall_seconds,
+            "effective_speed": self.recorded_seconds / wall_seconds if wall_seconds > 0 else 0.0,
+            "tick_latency_ms": _percentiles_ms(self.latencies),
+            "tick_apply_ms": _percentiles_ms(self.apply_times),
+            "error": self.error,
+        }
@@ -0,0 +1,123 @@
+import bisect
+import mmap
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"PCDR"
+VERSION = 1
+
+# magic, version, header_size, column 수, 예약, record_size, capacity, cursor, count
+_HEADER = struct.Struct("<4sHHHHIQQQ")
+_CURSOR_OFFSET = 24
+_NAME_SIZE = 16
+
+class RingFile:
+    """
+    고정 크기 레코드를 담는 메모리 맵 링 파일입니다.
+
+    파일 = 헤더(매직, 버전, 열 이름, 용량, 쓰기 커서) + capacity 개의 레코드.
+    각 레코드는 timestamp 와 columns 값을 float64 로 저장하며, 레코드 영역은
+    (capacity, 1 + len(columns)) 모양의 NumPy 배열로 그대로 매핑되므로 시작 시 파싱이 없습니다.
+    append() 는 한 행을 쓰고 커서만 갱신하는 O(1) 연산이며, 샘플마다 fsync 하지 않습니다.
+    """
+    def __init__(self, path, columns, capacity=86400):
+        self.path = path
+        self.columns = tuple(columns)
+        self.capacity = int(capacity)
+        self.record_width = 1 + len(self.columns)
+        self.record_size = 8 * self.record_width
+        self.header_size = self._align(_HEADER.size + _NAME_SIZE * len(self.columns))
+
+        size = self.header_size + self.record_size * self.capacity
+        if not self._header_matches(size):
+            self._create(size)
+
+        self._file = open(path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        self._records = np.ndarray(
+            (self.capacity, self.record_width), dtype="<f8", buffer=self._mm, offset=self.header_size
+        )
+        _, _, _, _, _, _, _, self.cursor, self.count = _HEADER.unpack_from(self._mm, 0)
+        if self.cursor >= self.capacity or self.count > self.capacity:
+            # 손상된 커서는 버리고 처음부터 다시 기록합니다.
+            self.cursor, self.count = 0, 0
+
+    @staticmethod
+    def _align(size, alignment=64):
+        return (size + alignment - 1) // alignment * alignment
+
+    def _header_bytes(self, cursor=0, count=0):
+        header = _HEADER.pack(
+            MAGIC, VERSION, self.header_size, len(self.columns), 0,
+            self.record_size, self.capacity, cursor, count,
+        )
+        names = b"".join(name.encode("utf-8")[:_NAME_SIZE].ljust(_NAME_SIZE, b"\0") for name in self.columns)
+        return (header + names).ljust(self.header_size, b"\0")
+
+    def _header_matches(self, size):
+        """기존 파일이 같은 형식(열, 용량)으로 만들어졌는지 확인합니다."""
+        try:
+            if os.path.getsize(self.path) != size:
+                return False
+            with open(self.path, "rb") as f:
+                existing = f.read(self.header_size)
+        except OSError:
+            return False
+        expected = self._header_bytes()
+        # 커서와 개수를 제외한 부분이 같으면 그대로 이어서 씁니다.
+        return existing[:_CURSOR_OFFSET] == expected[:_CURSOR_OFFSET] and \
+            existing[_HEADER.size:] == expected[_HEADER.size:]
+
+    def _create(self, size):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, "wb") as f:
+            f.write(self._header_bytes())
+            f.truncate(size)
+
+    def __len__(self):
+        return self.count
+
+    def append(self, timestamp, values):
+        """레코드 한 개를 쓰고 커서를 한 칸 옮깁니다."""
+        row = self._records[self.cursor]
+        row[0] = timestamp
+        row[1:] = values
+        self.cursor = (self.cursor + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        struct.pack_into("<QQ", self._mm, _CURSOR_OFFSET, self.cursor, self.count)
+
+    def tail(self, n):
+        """
+        가장 최근 n 개 레코드를 오래된 순서로 반환합니다.
+        반환값은 (timestamps, values) 복사본이며 values 의 열 순서는 columns 와 같습니다.
+        """
+        n = min(int(n), self.count)
+        start = (self.cursor - n) % self.capacity
+        if start + n <= self.capacity:
+            rows = self._records[start:start + n].copy()
+        else:
+            rows = np.concatenate((self._records[start:], self._records[:self.cursor]))
+        return rows[:, 0], rows[:, 1:]
+
+    def since(self, timestamp):
+        """
+        timestamp 이후에 기록된 레코드를 오래된 순서로 반환합니다. (tail() 과 같은 형식)
+        시작 위치는 링 위에서 이진 탐색하므로 파일 전체가 아니라 돌려줄 레코드만 복사합니다.
+        """
+        records, capacity = self._records, self.capacity
+        start = (self.cursor - self.count) % capacity
+        first = bisect.bisect_left(range(self.count), timestamp, key=lambda i: records[(start + i) % capacity, 0])
+        return self.tail(self.count - first)
+
+    def close(self):
+        if self._mm is None:
+            return
+        self._records = None
+        self._mm.flush()
+        self._mm.close()
+        self._file.close()
+        self._mm = None
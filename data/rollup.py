@@ -0,0 +1,129 @@
+import numpy as np
+
+from data.history import HistoryBuffer
+
+# (구간 길이 초, 보관할 구간 수): 1초 x 1시간, 10초 x 1일, 1분 x 1주, 1시간 x 1년
+DEFAULT_TIERS = ((1, 3600), (10, 8640), (60, 10080), (3600, 8760))
+
+ROLLUP_STATS = ("min", "max", "mean", "last")
+
+class RollupTier:
+    """
+    하나의 해상도(resolution 초)로 묶은 집계 버퍼입니다.
+    구간마다 min / max / mean / last 를 HistoryBuffer 에 보관하고,
+    샘플이 들어올 때마다 현재 구간 값만 갱신하므로 재계산이 없습니다.
+    """
+    def __init__(self, columns, resolution, capacity):
+        self.columns = tuple(columns)
+        self.resolution = resolution
+        self.capacity = capacity
+        self.times = HistoryBuffer(("time",), capacity)
+        self.stats = {stat: HistoryBuffer(self.columns, capacity) for stat in ROLLUP_STATS}
+        self.bucket = None
+        self.samples = 0
+        self._min = None
+        self._max = None
+        self._mean = None
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def span(self):
+        """이 계층이 보관할 수 있는 최대 시간 범위(초)입니다."""
+        return self.resolution * self.capacity
+
+    def add(self, timestamp, values):
+        bucket = int(timestamp // self.resolution)
+        if bucket != self.bucket:
+            # 새 구간 시작
+            self.bucket = bucket
+            self.samples = 1
+            self._min = values.copy()
+            self._max = values.copy()
+            self._mean = values.copy()
+            self.times.append((bucket * self.resolution,))
+            for stat in ROLLUP_STATS:
+                self.stats[stat].append(values)
+            return
+
+        # 진행 중인 구간 갱신
+        self.samples += 1
+        np.minimum(self._min, values, out=self._min)
+        np.maximum(self._max, values, out=self._max)
+        self._mean += (values - self._mean) / self.samples
+        self.stats["min"].replace_last(self._min)
+        self.stats["max"].replace_last(self._max)
+        self.stats["mean"].replace_last(self._mean)
+        self.stats["last"].replace_last(values)
+
+    def load(self, timestamps, rows):
+        """
+        저장된 원시 히스토리를 한 번에 집계해 채웁니다. (시작 시 링 파일에서 불러올 때 사용)
+        timestamps 는 오름차순이어야 합니다.
+        """
+        if len(timestamps) == 0:
+            return
+        buckets = (np.asarray(timestamps) // self.resolution).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(buckets)]
+        counts = (ends - starts)[:, None]
+
+        self.times.extend((buckets[starts] * self.resolution)[:, None])
+        self.stats["min"].extend(np.minimum.reduceat(rows, starts, axis=0))
+        self.stats["max"].extend(np.maximum.reduceat(rows, starts, axis=0))
+        self.stats["mean"].extend(np.add.reduceat(rows, starts, axis=0) / counts)
+        self.stats["last"].extend(rows[ends - 1])
+
+        # 마지막 구간은 이후 샘플로 계속 갱신할 수 있도록 상태를 복원합니다.
+        last = slice(starts[-1], ends[-1])
+        self.bucket = int(buckets[-1])
+        self.samples = int(ends[-1] - starts[-1])
+        self._min = rows[last].min(axis=0)
+        self._max = rows[last].max(axis=0)
+        self._mean = rows[last].mean(axis=0)
+
+    def view(self, name, stat="mean", count=None):
+        """지정한 열과 통계의 최근 count 개 구간을 오래된 순서로 반환합니다."""
+        data = self.stats[stat].view(name)
+        return data if count is None else data[-count:]
+
+class RollupStore:
+    """
+    원시 히스토리 옆에서 여러 해상도의 집계 계층을 함께 유지합니다.
+    차트는 select() 로 표시 구간과 픽셀 폭에 맞는 가장 거친 계층을 골라 그리므로,
+    하루나 일주일 범위도 지금의 100 포인트 차트와 비슷한 비용으로 그릴 수 있습니다.
+    """
+    def __init__(self, columns, tiers=DEFAULT_TIERS):
+        self.columns = tuple(columns)
+        self.tiers = [RollupTier(self.columns, resolution, capacity) for resolution, capacity in tiers]
+
+    def add(self, timestamp, values):
+        values = np.asarray(values, dtype=np.float64)
+        for tier in self.tiers:
+            tier.add(timestamp, values)
+
+    def load(self, timestamps, rows):
+        rows = np.asarray(rows, dtype=np.float64)
+        for tier in self.tiers:
+            tier.load(timestamps, rows)
+
+    def select(self, window_seconds, pixel_width):
+        """
+        window_seconds 범위를 pixel_width 픽셀에 그릴 때 사용할 계층을 고릅니다.
+        구간 수가 픽셀 폭 이상인 계층 중 가장 거친 것을 고르고, 없으면 범위를 덮는 가장 세밀한 계층을 씁니다.
+        """
+        pixel_width = max(1, int(pixel_width))
+        # 범위를 모두 덮을 수 있는 계층만 후보로 삼습니다. (세밀한 것부터 거친 순서)
+        candidates = [tier for tier in self.tiers if tier.span >= window_seconds] or [self.tiers[-1]]
+        chosen = candidates[0]
+        for tier in candidates:
+            if window_seconds / tier.resolution >= pixel_width:
+                chosen = tier
+        return chosen
+
+    def series(self, name, window_seconds, pixel_width, stat="mean"):
+        """표시 구간에 해당하는 집계 값을 반환합니다."""
+        tier = self.select(window_seconds, pixel_width)
+        count = max(1, int(np.ceil(window_seconds / tier.resolution)))
+        return tier.view(name, stat, count)
@@ -0,0 +1,139 @@
+from PyQt6.QtCore import Q_ARG, QMetaObject, QObject, QThread, QTimer, Qt, pyqtSignal, pyqtSlot
+
+from data.collector import Collector
+from data.history import HISTORY_COLUMNS
+from data.percentiles import PercentileStore
+from data.recording import SnapshotRecorder
+from data.ring_file import RingFile
+from data.system_monitor import SystemMonitor
+
+class SamplerWorker(QObject):
+    """
+    백그라운드 스레드에서 Collector.tick() 을 주기적으로 호출하는 워커입니다.
+    지표별 주기는 Collector 의 스케줄러가 관리하고, display_interval_ms 마다
+    그 사이의 샘플을 합친 Snapshot 을 snapshot_ready 시그널로 보냅니다.
+    분위값 창은 이 스레드에서 매 샘플 갱신하고, 화면 주기마다 완성된 p50/p95/p99 만 percentiles_ready 로 보냅니다.
+    """
+    snapshot_ready = pyqtSignal(object)
+    static_info_ready = pyqtSignal(object)
+    percentiles_ready = pyqtSignal(object)
+
+    def __init__(self, monitor, sample_interval_ms=1000, display_interval_ms=None, ring_file=None,
+                 process_limit=0, recorder=None):
+        super().__init__()
+        self.monitor = monitor
+        self.collector = Collector(monitor, sample_interval_ms, display_interval_ms, ring_file,
+                                   process_limit=process_limit, recorder=recorder,
+                                   percentiles=PercentileStore(HISTORY_COLUMNS))
+        self.timer = None
+
+    @pyqtSlot()
+    def start(self):
+        # 타이머는 반드시 워커 스레드 안에서 만들어야 워커 스레드에서 timeout 이 발생합니다.
+        self.timer = QTimer(self)
+        if self.collector.tick_interval_ms < 1000:
+            self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.collect)
+        self.timer.start(int(self.collector.tick_interval_ms * self.collector.slowdown))
+        self.collector.reset()
+        # 24시간 창을 채우도록 링 파일을 읽는 일도 GUI 스레드가 아니라 여기서 합니다.
+        self.collector.load_percentiles()
+        self.percentiles_ready.emit(self.collector.percentiles.summary())
+        self.load_static_info()
+
+    @pyqtSlot()
+    def load_static_info(self):
+        """
+        정적 정보(WMI 등 수백 ms 이상 걸릴 수 있음)를 워커 스레드에서 읽어 static_info_ready 로 보냅니다.
+        디스크 목록은 여기서 바로 수집 대상으로 지정합니다.
+        """
+        info = self.monitor.get_static_system_info()
+        self.collector.set_static_info(info)
+        self.static_info_ready.emit(info)
+
+    @pyqtSlot(float)
+    def set_slowdown(self, factor):
+        self.collector.set_slowdown(factor)
+        if self.timer is not None:
+            self.timer.setInterval(int(self.collector.tick_interval_ms * self.collector.slowdown))
+
+    @pyqtSlot()
+    def stop(self):
+        if self.timer is not None:
+            self.timer.stop()
+
+    @pyqtSlot()
+    def collect(self):
+        snapshot = self.collector.tick()
+        if snapshot is not None:
+            self.snapshot_ready.emit(snapshot)
+            self.percentiles_ready.emit(self.collector.percentiles.summary())
+
+class BackgroundSampler:
+    """
+    SystemMonitor 인스턴스를 소유하고 전용 QThread 에서 수집을 실행합니다.
+    GUI 스레드는 snapshot_ready 에 연결한 슬롯에서 값만 반영하면 됩니다.
+    history_path 를 지정하면 화면에 보낸 Snapshot 을 메모리 맵 링 파일에도 기록합니다.
+    process_limit 가 0 보다 크면 상위 프로세스 목록도 함께 수집합니다.
+    record_path 를 지정하면 화면에 보낸 Snapshot 을 재생용 녹화 파일로도 남깁니다.
+    monitor 를 넘기면 SystemMonitor 대신 그 모니터(예: SyntheticMonitor)로 수집합니다.
+    """
+    def __init__(self, sample_interval_ms=1000, display_interval_ms=None, history_path=None,
+                 history_capacity=86400, process_limit=0, record_path=None, monitor=None):
+        self.monitor = SystemMonitor() if monitor is None else monitor
+        self.ring_file = None
+        if history_path:
+            self.ring_file = RingFile(history_path, HISTORY_COLUMNS, history_capacity)
+        self.recorder = SnapshotRecorder(record_path) if record_path else None
+        self.thread = QThread()
+        self.worker = SamplerWorker(self.monitor, sample_interval_ms, display_interval_ms, self.ring_file,
+                                    process_limit, self.recorder)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.start)
+
+    def connect(self, slot):
+        """스냅샷을 받을 슬롯을 큐 연결로 등록합니다."""
+        self.worker.snapshot_ready.connect(slot, Qt.ConnectionType.QueuedConnection)
+
+    def connect_static_info(self, slot):
+        """샘플러 스레드가 정적 정보를 읽으면 호출될 슬롯을 등록합니다. 실패하면 None 이 전달됩니다."""
+        self.worker.static_info_ready.connect(slot, Qt.ConnectionType.QueuedConnection)
+
+    def connect_percentiles(self, slot):
+        """화면 주기마다 PercentileStore.summary() 값을 받을 슬롯을 등록합니다."""
+        self.worker.percentiles_ready.connect(slot, Qt.ConnectionType.QueuedConnection)
+
+    def history_rows(self, count):
+        """링 파일에 저장된 히스토리의 마지막 count 행입니다. 메모리 맵에서 바로 읽으므로 파싱 없이 즉시 표시됩니다."""
+        if self.ring_file is None:
+            return None
+        return self.ring_file.tail(count)[1]
+
+    def set_slowdown(self, factor):
+        """
+        수집 주기 배율을 워커 스레드에 전달합니다. 창이 보이지 않을 때 수집 빈도를 낮추는 데 씁니다.
+        """
+        if self.thread.isRunning():
+            QMetaObject.invokeMethod(
+                self.worker, "set_slowdown", Qt.ConnectionType.QueuedConnection, Q_ARG(float, float(factor))
+            )
+        else:
+            self.worker.collector.set_slowdown(factor)
+
+    def collector_stats(self):
+        """지표별 수집 비용. 워커 스레드가 갱신하는 값을 읽기만 하므로 대략적인 값입니다."""
+        return self.worker.collector.stats()
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        # 타이머는 자신을 만든 스레드에서만 멈출 수 있으므로 워커 스레드에 정지를 요청합니다.
+        if self.thread.isRunning():
+            QMetaObject.invokeMethod(self.worker, "stop", Qt.ConnectionType.BlockingQueuedConnection)
+        self.thread.quit()
+        self.thread.wait()
+        if self.ring_file is not None:
+            self.ring_file.close()
+        if self.recorder is not None:
+            self.recorder.close()
@@ -0,0 +1,95 @@
+import time
+
+class ScheduledCollector:
+    """
+    스케줄러에 등록된 수집 함수 하나와 그 주기, 최근 값, 실제 수집 비용을 담습니다.
+    """
+    __slots__ = ("name", "func", "cadence", "budget", "next_due", "value", "runs", "total_ns", "last_ns")
+
+    def __init__(self, name, func, cadence, budget=None):
+        self.name = name
+        self.func = func
+        self.cadence = cadence
+        self.budget = budget
+        self.next_due = 0.0
+        self.value = None
+        self.runs = 0
+        self.total_ns = 0
+        self.last_ns = 0
+
+class CollectorScheduler:
+    """
+    수집 함수마다 자신의 주기(cadence 초)를 두고, 기한이 된 것만 실행하는 스케줄러입니다.
+    CPU 처럼 빠르게 변하는 값은 자주, 디스크 용량처럼 천천히 변하는 값은 드물게 읽습니다.
+
+    slowdown 배율을 올리면 모든 주기가 그만큼 늘어나므로, 창이 최소화되거나 가려졌을 때
+    수집 빈도를 자동으로 낮출 수 있습니다.
+    """
+    def __init__(self):
+        self.collectors = {}
+        self.slowdown = 1.0
+        self.started = time.monotonic()
+
+    def add(self, name, func, cadence, budget=None):
+        """
+        수집 함수를 등록합니다. budget(0~1)을 주면 한 번 실행에 걸린 시간이 주기의 budget 비율을
+        넘지 않도록 다음 주기를 늘립니다. (프로세스 목록처럼 비용이 호스트에 따라 크게 달라지는 수집용)
+        """
+        self.collectors[name] = ScheduledCollector(name, func, cadence, budget)
+
+    def value(self, name):
+        return self.collectors[name].value
+
+    def values(self):
+        return {name: collector.value for name, collector in self.collectors.items()}
+
+    def set_slowdown(self, factor):
+        """모든 주기에 곱할 배율을 바꿉니다. 이미 잡힌 다음 기한도 새 배율에 맞게 조정합니다."""
+        factor = max(1.0, float(factor))
+        if factor == self.slowdown:
+            return
+        now = time.monotonic()
+        for collector in self.collectors.values():
+            if collector.runs:
+                collector.next_due = now + (collector.next_due - now) * factor / self.slowdown
+        self.slowdown = factor
+
+    def run_due(self, now=None, tolerance=0.0):
+        """
+        기한이 된 수집 함수를 실행하고 실행한 이름 목록을 반환합니다.
+        타이머 오차로 살짝 일찍 불려도 놓치지 않도록 tolerance 초만큼 앞당겨 판단합니다.
+        """
+        now = time.monotonic() if now is None else now
+        ran = []
+        for collector in self.collectors.values():
+            if now + tolerance < collector.next_due:
+                continue
+            start = time.perf_counter_ns()
+            collector.value = collector.func()
+            elapsed = time.perf_counter_ns() - start
+            collector.runs += 1
+            collector.total_ns += elapsed
+            collector.last_ns = elapsed
+            # 기한 기준으로 다음 기한을 잡아 주기가 밀리지 않게 하되, 크게 밀렸으면 지금부터 다시 셉니다.
+            period = collector.cadence * self.slowdown
+            if collector.budget:
+                period = max(period, elapsed / 1e9 / collector.budget)
+            collector.next_due += period
+            if collector.next_due <= now:
+                collector.next_due = now + period
+            ran.append(collector.name)
+        return ran
+
+    def stats(self):
+        """수집 함수별 주기, 실행 횟수, 실제 비용(ms)과 시간 대비 점유율을 반환합니다."""
+        elapsed = max(1e-9, time.monotonic() - self.started)
+        return {
+            name: {
+                "cadence_s": collector.cadence * self.slowdown,
+                "runs": collector.runs,
+                "last_ms": collector.last_ns / 1e6,
+                "mean_ms": collector.total_ns / collector.runs / 1e6 if collector.runs else 0.0,
+                "share": collector.total_ns / 1e9 / elapsed,
+            }
+            for name, collector in self.collectors.items()
+        }
@@ -0,0 +1,340 @@
+import json
+import struct
+
+import numpy as np
+
+from data.processes import ProcessInfo
+from data.system_monitor import Snapshot
+
+# 바이너리 스냅샷 형식
+#
+#   헤더      "<4sBBI"  매직 b"PCSN", 버전, 플래그, 일련번호
+#   [STATIC]  varint 길이 + 정적 정보 JSON
+#   [LAYOUT]  장치 이름 목록 3개 (disk_usage, nic_rates, disk_rates 순서). 목록 = varint 개수 + 문자열들
+#   시각      "<3d"     timestamp, interval, uptime_seconds
+#   게이지    "<10d"    cpu_average, ram_percent, 속도 4개, 피크 4개
+#   카운터    zigzag varint 로 직전 프레임과의 차이: sent_total, received_total
+#   CPU       varint 코어 수 + 실수 배열
+#   디스크    LAYOUT 순서로 (used, total) 차이 varint 쌍 + 사용률 배열
+#   장치 속도 NIC (sent, received) 배열, 디스크 (read, write) 배열
+#   프로세스  varint 개수 + pid(u4) 배열 + rss(u8) 배열 + io_bytes(u8) 배열 + cpu_percent 배열 + io_rate 배열
+#             + varint 새 이름 수 + (varint 순번, 문자열) 쌍. 같은 PID 로 이미 보낸 이름은 다시 보내지 않습니다.
+#
+# 문자열 = varint 바이트 길이 + UTF-8.
+# 실수 배열은 기본이 float32 이고, FLAG_FLOAT64 프레임은 float64 입니다.
+MAGIC = b"PCSN"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBI")
+TIMES = struct.Struct("<3d")
+GAUGES = struct.Struct("<10d")
+GAUGE_FIELDS = (
+    "cpu_average", "ram_percent", "sent_rate", "received_rate", "read_speed", "write_speed",
+    "sent_peak", "received_peak", "read_peak", "write_peak",
+)
+
+FLAG_KEYFRAME = 0x01   # 카운터가 절대값이고 디코더 상태를 초기화합니다.
+FLAG_STATIC = 0x02     # 정적 정보 블록이 있습니다.
+FLAG_LAYOUT = 0x04     # 장치 이름 목록 블록이 있습니다.
+FLAG_FLOAT64 = 0x08    # 실수 배열이 float64 입니다.
+
+# 이 개수보다 많은 PID 의 이름을 기억하게 되면 키프레임으로 양쪽 캐시를 비웁니다.
+NAME_CACHE_LIMIT = 4096
+# 64비트 값을 넘는 varint 는 손상된 프레임으로 봅니다.
+VARINT_MAX_BITS = 64
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _write_signed(out, value):
+    _write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+def _write_str(out, text):
+    data = text.encode("utf-8")
+    _write_varint(out, len(data))
+    out += data
+
+class _Reader:
+    """
+    바이트 배열을 앞에서부터 읽는 커서입니다. 프레임이 잘려 있거나 값이 프레임과 맞지 않으면
+    (너무 긴 varint, 남은 바이트로 담을 수 없는 개수, UTF-8 이 아닌 문자열) ValueError 를 냅니다.
+    """
+    __slots__ = ("data", "offset", "dtype")
+
+    def __init__(self, data, offset, dtype):
+        self.data = data
+        self.offset = offset
+        self.dtype = dtype
+
+    def varint(self):
+        data = self.data
+        result = shift = 0
+        while True:
+            if self.offset >= len(data):
+                raise ValueError("truncated snapshot frame")
+            byte = data[self.offset]
+            self.offset += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+            if shift >= VARINT_MAX_BITS:
+                raise ValueError("varint too long in snapshot frame")
+
+    def signed(self):
+        value = self.varint()
+        return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+    def raw(self, size):
+        end = self.offset + size
+        if end > len(self.data):
+            raise ValueError("truncated snapshot frame")
+        chunk = self.data[self.offset:end]
+        self.offset = end
+        return chunk
+
+    def count(self, item_size=1):
+        """
+        뒤따르는 항목 개수를 읽습니다. 항목 하나가 최소 item_size 바이트이므로,
+        남은 바이트로 담을 수 없는 개수면 실제로 읽기 전에 거부합니다.
+        """
+        value = self.varint()
+        if value * item_size > len(self.data) - self.offset:
+            raise ValueError(f"snapshot frame count {value} exceeds frame size")
+        return value
+
+    def text(self):
+        try:
+            return bytes(self.raw(self.varint())).decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"invalid text in snapshot frame: {e}") from None
+
+    def unpack(self, layout):
+        return layout.unpack(self.raw(layout.size))
+
+    def array(self, dtype, count):
+        dtype = np.dtype(dtype)
+        return np.frombuffer(self.raw(count * dtype.itemsize), dtype=dtype).tolist()
+
+    def floats(self, count):
+        return self.array(self.dtype, count)
+
+def _layout(snapshot):
+    return tuple(snapshot.disk_usage), tuple(snapshot.nic_rates), tuple(snapshot.disk_rates)
+
+class SnapshotEncoder:
+    """
+    Snapshot 을 바이너리 프레임으로 바꾸는 인코더입니다. 연결(또는 파일) 하나에 인코더 하나를 씁니다.
+
+    - 누적 카운터(네트워크 총량, 디스크 사용량)는 직전 프레임과의 차이만 varint 로 보냅니다.
+    - 정적 정보와 장치 이름 목록은 바뀐 프레임에만 넣습니다.
+    - keyframe_interval 프레임마다(또는 request_keyframe() 후) 모든 값을 절대값으로 보내므로,
+      디코더는 키프레임부터 읽기 시작할 수 있습니다.
+    - exact=True 이면 실수 배열을 float64 로 보내 값이 그대로 복원됩니다. 기본값 float32 는
+      표시용으로 충분한 유효숫자 7자리를 유지합니다.
+    """
+    def __init__(self, keyframe_interval=100, exact=False):
+        self.keyframe_interval = keyframe_interval
+        self.dtype = np.dtype("<f8" if exact else "<f4")
+        self.sequence = 0
+        self.force_keyframe = True
+        self.static_info = None
+        self.layout = None
+        self.counters = (0, 0)
+        self.disk_counters = {}
+        self.process_names = {}
+
+    def request_keyframe(self):
+        self.force_keyframe = True
+
+    def encode(self, snapshot, static_info=None):
+        """
+        스냅샷 하나를 프레임으로 인코딩합니다. static_info 는 지난번과 다를 때만 프레임에 들어가며,
+        None 이면 정적 정보를 보내지 않습니다.
+        """
+        keyframe = (self.force_keyframe or self.sequence % self.keyframe_interval == 0
+                    or len(self.process_names) > NAME_CACHE_LIMIT)
+        flags = FLAG_KEYFRAME if keyframe else 0
+        if keyframe:
+            self.force_keyframe = False
+            self.counters = (0, 0)
+            self.disk_counters = {}
+            self.process_names = {}
+        if static_info is not None and (keyframe or static_info != self.static_info):
+            flags |= FLAG_STATIC
+            self.static_info = static_info
+        layout = _layout(snapshot)
+        if keyframe or layout != self.layout:
+            flags |= FLAG_LAYOUT
+            self.layout = layout
+        if self.dtype.itemsize == 8:
+            flags |= FLAG_FLOAT64
+
+        out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, flags, self.sequence))
+        self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+        if flags & FLAG_STATIC:
+            payload = json.dumps(static_info, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            _write_varint(out, len(payload))
+            out += payload
+        if flags & FLAG_LAYOUT:
+            for names in layout:
+                _write_varint(out, len(names))
+                for name in names:
+                    _write_str(out, name)
+
+        out += TIMES.pack(snapshot.timestamp, snapshot.interval, snapshot.uptime_seconds)
+        out += GAUGES.pack(snapshot.cpu_average, snapshot.ram_percent, snapshot.sent_rate, snapshot.received_rate,
+                           snapshot.read_speed, snapshot.write_speed, snapshot.sent_peak, snapshot.received_peak,
+                           snapshot.read_peak, snapshot.write_peak)
+        sent_total, received_total = int(snapshot.sent_total), int(snapshot.received_total)
+        _write_signed(out, sent_total - self.counters[0])
+        _write_signed(out, received_total - self.counters[1])
+        self.counters = (sent_total, received_total)
+
+        dtype = self.dtype
+        _write_varint(out, len(snapshot.cpu_percents))
+        out += np.asarray(snapshot.cpu_percents, dtype=dtype).tobytes()
+
+        disk_counters = self.disk_counters
+        percents = []
+        for device_id, (used, total, percent) in snapshot.disk_usage.items():
+            used, total = int(used), int(total)
+            previous_used, previous_total = disk_counters.get(device_id, (0, 0))
+            _write_signed(out, used - previous_used)
+            _write_signed(out, total - previous_total)
+            disk_counters[device_id] = (used, total)
+            percents.append(percent)
+        out += np.asarray(percents, dtype=dtype).tobytes()
+        out += np.asarray(list(snapshot.nic_rates.values()), dtype=dtype).tobytes()
+        out += np.asarray(list(snapshot.disk_rates.values()), dtype=dtype).tobytes()
+
+        processes = snapshot.processes
+        names = self.process_names
+        _write_varint(out, len(processes))
+        out += np.fromiter((process.pid for process in processes), dtype="<u4", count=len(processes)).tobytes()
+        out += np.fromiter((process.rss for process in processes), dtype="<u8", count=len(processes)).tobytes()
+        out += np.fromiter((process.io_bytes for process in processes), dtype="<u8", count=len(processes)).tobytes()
+        out += np.asarray([process.cpu_percent for process in processes], dtype=dtype).tobytes()
+        out += np.asarray([process.io_rate for process in processes], dtype=dtype).tobytes()
+        new_names = [(i, process) for i, process in enumerate(processes) if names.get(process.pid) != process.name]
+        _write_varint(out, len(new_names))
+        for i, process in new_names:
+            _write_varint(out, i)
+            _write_str(out, process.name)
+            names[process.pid] = process.name
+        return bytes(out)
+
+class SnapshotDecoder:
+    """
+    SnapshotEncoder 가 만든 프레임을 Snapshot 으로 되돌립니다. 인코더 하나의 프레임을 순서대로 받아야 하며,
+    키프레임 전의 프레임이나 일련번호가 건너뛴 프레임은 ValueError 로 거부합니다.
+    마지막 decode() 에서 정적 정보가 이전과 달라졌으면 static_changed 가 True 입니다. 키프레임에 같은 정적 정보가
+    다시 실려 와도 False 입니다.
+    """
+    def __init__(self):
+        self.sequence = None
+        self.static_info = None
+        self.static_changed = False
+        self.layout = None
+        self.counters = (0, 0)
+        self.disk_counters = {}
+        self.process_names = {}
+
+    def decode(self, data):
+        """
+        프레임 하나를 Snapshot 으로 바꿉니다. 잘렸거나 손상된 프레임은 어떤 경우든 ValueError 입니다.
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("truncated snapshot frame")
+        magic, version, flags, sequence = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a snapshot frame")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported snapshot format version {version}")
+        if flags & FLAG_KEYFRAME:
+            self.counters = (0, 0)
+            self.disk_counters = {}
+            self.process_names = {}
+        elif self.sequence is None or sequence != (self.sequence + 1) & 0xFFFFFFFF:
+            raise ValueError("snapshot frame out of sequence; waiting for a keyframe")
+        self.sequence = sequence
+
+        reader = _Reader(data, HEADER.size, np.dtype("<f8" if flags & FLAG_FLOAT64 else "<f4"))
+        self.static_changed = False
+        if flags & FLAG_STATIC:
+            try:
+                static_info = json.loads(bytes(reader.raw(reader.varint())))
+            except UnicodeDecodeError as e:
+                raise ValueError(f"invalid static info in snapshot frame: {e}") from None
+            if not isinstance(static_info, dict):
+                raise ValueError("static info in snapshot frame is not an object")
+            # 인코더는 키프레임마다 정적 정보를 다시 싣습니다. 내용이 같으면 바뀐 것으로 보지 않습니다.
+            self.static_changed = static_info != self.static_info
+            self.static_info = static_info
+        if flags & FLAG_LAYOUT:
+            self.layout = tuple(
+                tuple(reader.text() for _ in range(reader.count())) for _ in range(3)
+            )
+        if self.layout is None:
+            raise ValueError("snapshot frame without a device layout")
+        disk_ids, nic_names, disk_names = self.layout
+
+        timestamp, interval, uptime_seconds = reader.unpack(TIMES)
+        gauges = dict(zip(GAUGE_FIELDS, reader.unpack(GAUGES)))
+        sent_total = self.counters[0] + reader.signed()
+        received_total = self.counters[1] + reader.signed()
+        self.counters = (sent_total, received_total)
+
+        cpu_percents = tuple(reader.floats(reader.count(reader.dtype.itemsize)))
+
+        disk_counters = self.disk_counters
+        usage = []
+        for device_id in disk_ids:
+            previous_used, previous_total = disk_counters.get(device_id, (0, 0))
+            used = previous_used + reader.signed()
+            total = previous_total + reader.signed()
+            disk_counters[device_id] = (used, total)
+            usage.append((used, total))
+        percents = reader.floats(len(disk_ids))
+        disk_usage = {
+            device_id: (used, total, percent)
+            for device_id, (used, total), percent in zip(disk_ids, usage, percents)
+        }
+        nic_values = reader.floats(2 * len(nic_names))
+        nic_rates = {name: tuple(nic_values[2 * i:2 * i + 2]) for i, name in enumerate(nic_names)}
+        disk_values = reader.floats(2 * len(disk_names))
+        disk_rates = {name: tuple(disk_values[2 * i:2 * i + 2]) for i, name in enumerate(disk_names)}
+
+        # pid, rss, io_bytes 와 실수 두 개
+        count = reader.count(20 + 2 * reader.dtype.itemsize)
+        pids = reader.array("<u4", count)
+        rss = reader.array("<u8", count)
+        io_bytes = reader.array("<u8", count)
+        cpu = reader.floats(count)
+        io_rates = reader.floats(count)
+        names = self.process_names
+        for _ in range(reader.count(2)):
+            index = reader.varint()
+            if index >= count:
+                raise ValueError(f"process index {index} out of range in snapshot frame")
+            names[pids[index]] = reader.text()
+        processes = tuple(
+            ProcessInfo(pid, names.get(pid, str(pid)), "", cpu_percent, process_rss, process_io, io_rate)
+            for pid, process_rss, process_io, cpu_percent, io_rate in zip(pids, rss, io_bytes, cpu, io_rates)
+        )
+
+        return Snapshot(
+            timestamp=timestamp,
+            uptime_seconds=uptime_seconds,
+            cpu_percents=cpu_percents,
+            sent_total=sent_total,
+            received_total=received_total,
+            interval=interval,
+            disk_usage=disk_usage,
+            processes=processes,
+            nic_rates=nic_rates,
+            disk_rates=disk_rates,
+            **gauges,
+        )
@@ -0,0 +1,228 @@
+import os
+import platform
+import re
+
+# PCI 벤더 ID -> 이름. pci.ids 데이터베이스 없이 GPU 제조사 정도만 표시합니다.
+PCI_VENDORS = {
+    "0x10de": "NVIDIA",
+    "0x1002": "AMD",
+    "0x8086": "Intel",
+    "0x1a03": "ASPEED",
+    "0x102b": "Matrox",
+    "0x15ad": "VMware",
+    "0x1234": "QEMU",
+    "0x1af4": "Virtio",
+    "0x1414": "Microsoft",
+}
+
+# 디스크 목록에서 제외할 가상 블록 장치 접두어
+VIRTUAL_BLOCK_PREFIXES = ("loop", "ram", "zram", "sr", "fd", "nbd")
+
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+def _read(path, default=""):
+    """작은 sysfs/procfs 파일을 한 번에 읽어 앞뒤 공백을 제거해 반환합니다."""
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", "replace").strip()
+    except OSError:
+        return default
+
+def _unescape_mount_path(path):
+    """mountinfo 에서 \\040 처럼 8진수로 이스케이프된 경로를 복원합니다."""
+    return _OCTAL_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), path)
+
+class WindowsStaticInfo:
+    """
+    WMI 를 사용하여 Windows 의 정적 시스템 정보를 수집합니다.
+    """
+    def collect(self):
+        import pythoncom
+        import wmi
+
+        # 샘플러 스레드처럼 GUI 스레드가 아닌 곳에서도 부를 수 있도록 스레드마다 COM 을 초기화합니다.
+        pythoncom.CoInitialize()
+        try:
+            return self._collect(wmi.WMI())
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _collect(self, wmi_obj):
+        os_info = wmi_obj.Win32_OperatingSystem()[0]
+        proc_info = wmi_obj.Win32_Processor()[0]
+        gpu_info = wmi_obj.Win32_VideoController()[0]
+        board_info = wmi_obj.Win32_BaseBoard()[0]
+
+        os_name = os_info.Name.encode('utf-8').split(b'|')[0].decode('utf-8').strip()
+        os_version = f"{os_info.Version} ({os_info.BuildNumber})"
+
+        disks = []
+        for i, disk in enumerate(wmi_obj.Win32_DiskDrive()):
+            disk_name = disk.Model.strip()
+            partitions = [p for p in disk.associators("Win32_DiskDriveToDiskPartition")]
+            for partition in partitions:
+                if partition:
+                    logical_disks = [ld for ld in partition.associators("Win32_LogicalDiskToPartition")]
+                    for ld in logical_disks:
+                        if ld.DriveType == 3: # 3은 로컬 디스크를 의미
+                            disks.append({
+                                "name": f"DISK{i} - {disk_name}",
+                                "device_id": ld.DeviceID
+                            })
+
+        return {
+            "os": f"OS | {os_name} {os_version}",
+            "cpu": f"CPU | {proc_info.Name}",
+            "gpu": f"GPU | {gpu_info.Name}",
+            "board": f"BOARD | {board_info.Product}",
+            "disks": disks
+        }
+
+class LinuxStaticInfo:
+    """
+    /etc/os-release, /proc, /sys 파일만 읽어 Linux 의 정적 시스템 정보를 수집합니다.
+    하위 프로세스를 실행하지 않으므로 수 밀리초 안에 끝납니다.
+    """
+    def collect(self):
+        return {
+            "os": f"OS | {self.os_name()}",
+            "cpu": f"CPU | {self.cpu_name()}",
+            "gpu": f"GPU | {self.gpu_name()}",
+            "board": f"BOARD | {self.board_name()}",
+            "disks": self.disks(),
+        }
+
+    def os_name(self):
+        release = {}
+        for line in _read("/etc/os-release").splitlines():
+            key, sep, value = line.partition("=")
+            if sep:
+                release[key] = value.strip().strip('"')
+        name = release.get("PRETTY_NAME") or release.get("NAME") or platform.system()
+        kernel = _read("/proc/sys/kernel/osrelease") or platform.release()
+        return f"{name} ({kernel})"
+
+    def cpu_name(self):
+        # 첫 번째 프로세서 블록만 필요하므로 코어 수가 많아도 앞부분만 읽습니다.
+        try:
+            with open("/proc/cpuinfo", "rb") as f:
+                head = f.read(16384).decode("utf-8", "replace")
+        except OSError:
+            head = ""
+        for key in ("model name", "Hardware", "cpu model", "Processor"):
+            for line in head.splitlines():
+                name, sep, value = line.partition(":")
+                if sep and name.strip() == key and value.strip():
+                    return value.strip()
+        return platform.processor() or platform.machine()
+
+    def gpu_name(self):
+        names = []
+        try:
+            cards = sorted(entry for entry in os.listdir("/sys/class/drm") if re.fullmatch(r"card\d+", entry))
+        except OSError:
+            cards = []
+        for card in cards:
+            device_dir = f"/sys/class/drm/{card}/device"
+            vendor = _read(f"{device_dir}/vendor")
+            device = _read(f"{device_dir}/device")
+            if not vendor:
+                continue
+            label = PCI_VENDORS.get(vendor, vendor)
+            names.append(f"{label} [{vendor[2:]}:{device[2:]}]")
+        return ", ".join(names) if names else "Unknown"
+
+    def board_name(self):
+        dmi = "/sys/class/dmi/id"
+        vendor = _read(f"{dmi}/board_vendor")
+        product = _read(f"{dmi}/board_name") or _read(f"{dmi}/product_name")
+        name = f"{vendor} {product}".strip()
+        return name or "Unknown"
+
+    def disks(self):
+        """
+        /proc/self/mountinfo 의 블록 장치 마운트를 물리 디스크 단위로 묶어 반환합니다.
+        device_id 에는 psutil.disk_usage 에 바로 넘길 수 있는 마운트 경로가 들어갑니다.
+        """
+        try:
+            physical = sorted(
+                name for name in os.listdir("/sys/block")
+                if not name.startswith(VIRTUAL_BLOCK_PREFIXES) and not name.startswith("dm-")
+            )
+        except OSError:
+            physical = []
+        disk_index = {name: i for i, name in enumerate(physical)}
+        models = {}
+
+        disks = []
+        for dev_number, mount_point in self.mounted_devices(_read("/proc/self/mountinfo")):
+            disk = self._parent_disk(dev_number)
+            if disk not in disk_index:
+                continue
+
+            if disk not in models:
+                models[disk] = _read(f"/sys/block/{disk}/device/model") or disk
+            disks.append({
+                "name": f"DISK{disk_index[disk]} - {models[disk]} ({mount_point})",
+                "device_id": mount_point
+            })
+        return disks
+
+    def mounted_devices(self, mountinfo):
+        """
+        mountinfo 내용에서 블록 장치마다 처음 마운트된 (major:minor, 마운트 경로) 를 반환합니다.
+        major 0 은 보통 proc, tmpfs, overlay 같은 가상 파일시스템이지만, btrfs 는 실제 디스크 위에서도
+        익명 장치 번호(0:N)를 받으므로 마운트 원본(/dev/nvme0n1p3 등)으로 실제 블록 장치를 찾습니다.
+        """
+        devices = []
+        seen_devices = set()
+        for line in mountinfo.splitlines():
+            fields = line.split()
+            # 선택 필드 개수가 정해져 있지 않으므로 "-" 구분자 뒤에서 파일시스템 종류와 마운트 원본을 읽습니다.
+            if "-" not in fields[6:]:
+                continue
+            separator = fields.index("-", 6)
+            if len(fields) < separator + 3:
+                continue
+            dev_number, mount_point = fields[2], _unescape_mount_path(fields[4])
+            if dev_number.startswith("0:"):
+                source = _unescape_mount_path(fields[separator + 2])
+                if not source.startswith("/dev/"):
+                    continue
+                dev_number = self._block_dev_number(source)
+            if not dev_number or dev_number in seen_devices:
+                continue
+            seen_devices.add(dev_number)
+            devices.append((dev_number, mount_point))
+        return devices
+
+    def _block_dev_number(self, path):
+        """/dev 아래 장치 파일 경로의 major:minor 번호입니다. /dev/mapper 같은 링크도 따라갑니다."""
+        name = os.path.basename(os.path.realpath(path))
+        return _read(f"/sys/class/block/{name}/dev")
+
+    def _parent_disk(self, dev_number, depth=0):
+        """major:minor 번호를 파티션/device-mapper 를 거슬러 올라가 물리 디스크 이름으로 변환합니다."""
+        sys_path = os.path.realpath(f"/sys/dev/block/{dev_number}")
+        name = os.path.basename(sys_path)
+        if os.path.exists(f"{sys_path}/partition"):
+            return os.path.basename(os.path.dirname(sys_path))
+        if depth < 4:
+            try:
+                slaves = sorted(os.listdir(f"{sys_path}/slaves"))
+            except OSError:
+                slaves = []
+            if slaves:
+                slave_dev = _read(f"/sys/class/block/{slaves[0]}/dev")
+                if slave_dev:
+                    return self._parent_disk(slave_dev, depth + 1)
+        return name
+
+def get_static_info_backend(system=None):
+    """현재 플랫폼에 맞는 정적 정보 수집 백엔드를 반환합니다."""
+    system = system or platform.system()
+    if system == "Windows":
+        return WindowsStaticInfo()
+    if system == "Linux":
+        return LinuxStaticInfo()
+    raise NotImplementedError(f"No static info backend for {system}")
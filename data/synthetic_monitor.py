@@ -0,0 +1,146 @@
+import math
+import time
+
+import numpy as np
+
+from data.system_monitor import SystemMonitor
+
+PATTERNS = ("sine", "burst", "random_walk")
+
+def _always(name):
+    """가상 NIC/디스크는 모두 수집하고 화면에도 보입니다."""
+    return True
+
+class LoadPattern:
+    """
+    채널 count 개의 부하를 시각 t(초)에 대한 0~1 값 배열로 만듭니다. 채널마다 위상이 달라 값이 고르게 퍼집니다.
+
+    - sine: period 초 주기의 사인파
+    - burst: 대부분 낮다가 주기마다 잠깐(duty 비율) 거의 100% 로 치솟는 부하
+    - random_walk: period 초 동안 평균적으로 전체 범위의 절반쯤 움직이는 무작위 보행
+    """
+    def __init__(self, kind, count, period=30.0, seed=0, duty=0.15):
+        if kind not in PATTERNS:
+            raise ValueError(f"unknown load pattern: {kind} (choose from {', '.join(PATTERNS)})")
+        self.kind = kind
+        self.count = count
+        self.period = float(period)
+        self.duty = duty
+        self.rng = np.random.default_rng(seed)
+        self.phase = self.rng.random(count)
+        self.state = self.rng.uniform(0.2, 0.8, count)
+        self.last_t = None
+
+    def values(self, t):
+        if self.kind == "sine":
+            return 0.5 + 0.45 * np.sin(2 * math.pi * (t / self.period + self.phase))
+        noise = self.rng.random(self.count)
+        if self.kind == "burst":
+            high = (t / self.period + self.phase) % 1.0 < self.duty
+            return np.where(high, 0.9 + 0.1 * noise, 0.02 + 0.08 * noise)
+
+        elapsed = 0.0 if self.last_t is None else max(0.0, t - self.last_t)
+        self.last_t = t
+        self.state += self.rng.normal(0.0, 0.5 * math.sqrt(elapsed / self.period), self.count)
+        # 경계에서 반사시켜 값이 한쪽 끝에 붙어 있지 않게 합니다.
+        np.abs(self.state, out=self.state)
+        self.state = 1.0 - np.abs(1.0 - self.state)
+        np.clip(self.state, 0.0, 1.0, out=self.state)
+        return self.state
+
+def parse_spec(text):
+    """
+    "cores=256,disks=64,nics=32,pattern=burst" 형식의 문자열을 SyntheticMonitor 인자 dict 로 바꿉니다.
+    빈 문자열이면 기본값을 씁니다.
+    """
+    kwargs = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        key, sep, value = item.partition("=")
+        if not sep or key not in ("cores", "disks", "nics", "pattern", "period", "seed"):
+            raise ValueError(f"invalid synthetic monitor option: {item}")
+        if key == "pattern":
+            kwargs[key] = value
+        elif key == "period":
+            kwargs[key] = float(value)
+        else:
+            kwargs[key] = int(value)
+    return kwargs
+
+class SyntheticMonitor(SystemMonitor):
+    """
+    실제 장치를 읽지 않고 코어/디스크/NIC 수와 부하 패턴을 지정해 값을 만들어 내는 SystemMonitor 입니다.
+    256 스레드 서버처럼 개발 PC 에 없는 규모에서 화면과 수집 경로를 시험하는 데 씁니다.
+
+    NIC/디스크 속도는 누적 카운터를 시간에 따라 늘려 만들므로 SystemMonitor 의 속도 계산을 그대로 거칩니다.
+    상위 프로세스 목록(ProcessScanner)은 이 모니터와 무관하게 실제 프로세스를 읽습니다.
+    """
+    NIC_FILTERS = (_always, _always)
+    DISK_FILTERS = (_always, _always)
+    NIC_MAX_RATE = 1.25e9       # 10GbE
+    DISK_MAX_RATE = 3.0e9       # NVMe
+    DISK_TOTAL = 2 * 1024 ** 4
+
+    def __init__(self, cores=8, disks=2, nics=2, pattern="sine", period=30.0, seed=0):
+        self.cores = cores
+        self.nic_names = [f"eth{i}" for i in range(nics)]
+        self.block_names = [f"nvme{i}n1" for i in range(disks)]
+        self.mounts = [f"/data{i:02d}" for i in range(disks)]
+        self.pattern = pattern
+        self.cpu_load = LoadPattern(pattern, cores, period, seed)
+        self.ram_load = LoadPattern(pattern, 1, period * 4, seed + 1)
+        self.nic_load = LoadPattern(pattern, nics * 2, period, seed + 2)
+        self.disk_load = LoadPattern(pattern, disks * 2, period, seed + 3)
+        # 사용량은 천천히 움직이도록 주기를 길게 잡습니다.
+        self.usage_load = LoadPattern("sine", disks, period * 20, seed + 4)
+        self.usage_index = {mount: i for i, mount in enumerate(self.mounts)}
+        self.usage = None
+        self.usage_time = 0.0
+        self.nic_counts = np.zeros((nics, 2))
+        self.disk_counts = np.zeros((disks, 2))
+        self.last_counter_time = {}
+        super().__init__()
+
+    def _advance(self, key, counts, load, max_rate):
+        now = time.monotonic()
+        elapsed = now - self.last_counter_time.get(key, now)
+        self.last_counter_time[key] = now
+        counts += load.values(now).reshape(counts.shape) * max_rate * elapsed
+        return counts
+
+    def read_boot_time(self):
+        return time.time() - 3 * 86400
+
+    def read_nic_counters(self):
+        counts = self._advance("nic", self.nic_counts, self.nic_load, self.NIC_MAX_RATE)
+        return dict(zip(self.nic_names, counts.tolist()))
+
+    def read_disk_counters(self):
+        counts = self._advance("disk", self.disk_counts, self.disk_load, self.DISK_MAX_RATE)
+        return {name: (0, 0, read, write) for name, (read, write) in zip(self.block_names, counts.tolist())}
+
+    def get_static_system_info(self):
+        return {
+            "os": "OS | Synthetic",
+            "cpu": f"CPU | Synthetic {self.cores}-thread processor ({self.pattern})",
+            "gpu": "GPU | Synthetic",
+            "board": "BOARD | Synthetic",
+            "disks": [{"name": f"{mount} (Synthetic)", "device_id": mount} for mount in self.mounts],
+        }
+
+    def get_cpu_usage(self):
+        return (self.cpu_load.values(time.monotonic()) * 100).tolist()
+
+    def get_ram_usage(self):
+        return float(self.ram_load.values(time.monotonic())[0] * 100)
+
+    def get_disk_usage(self, device_id):
+        index = self.usage_index.get(device_id)
+        if index is None:
+            return 0, 0, 0
+        # 수집 한 번에 디스크마다 부르므로 모든 디스크 값을 한꺼번에 만들어 잠시 재사용합니다.
+        now = time.monotonic()
+        if self.usage is None or now - self.usage_time > 0.01:
+            self.usage = 0.2 + 0.75 * self.usage_load.values(now)
+            self.usage_time = now
+        used = int(self.usage[index] * self.DISK_TOTAL)
+        return used, self.DISK_TOTAL, used / self.DISK_TOTAL * 100
@@ -1,52 +1,107 @@
 import psutil
-import wmi
-import requests
-import socket
+import os
 import platform
+import sys
 import time
 
+from data.device_counters import DeviceCounterTable
+from data.static_info import VIRTUAL_BLOCK_PREFIXES, get_static_info_backend
+from utils.helpers import format_uptime
+
+def _always(name):
+    return True
+
+def _is_physical_nic(name):
+    """루프백을 뺀 NIC 만 화면에 보입니다."""
+    return name not in ("lo", "lo0") and not name.startswith("Loopback")
+
+def _is_whole_disk(name):
+    """
+    리눅스의 perdisk 결과에는 파티션도 들어 있으므로 /sys/block 에 있는 디스크만 합계에 넣습니다.
+    다른 플랫폼은 물리 디스크 단위로만 돌려줍니다.
+    """
+    if sys.platform.startswith("linux"):
+        return os.path.exists(f"/sys/block/{name.replace('/', '!')}")
+    return True
+
+def _is_physical_disk(name):
+    return _is_whole_disk(name) and not name.startswith(VIRTUAL_BLOCK_PREFIXES)
+
+class Snapshot:
+    """
+    한 번의 수집 결과를 담는 변경 불가능한 레코드입니다.
+    __slots__ 를 사용해 인스턴스마다 dict 를 만들지 않으며, 모든 소비자가 같은 객체를 공유합니다.
+    """
+    __slots__ = (
+        "timestamp",
+        "uptime_seconds",
+        "cpu_percents",
+        "cpu_average",
+        "ram_percent",
+        "sent_rate",
+        "received_rate",
+        "sent_total",
+        "received_total",
+        "read_speed",
+        "write_speed",
+        "sent_peak",
+        "received_peak",
+        "read_peak",
+        "write_peak",
+        "interval",
+        "disk_usage",
+        "processes",
+        "nic_rates",
+        "disk_rates",
+    )
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Snapshot is immutable")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Snapshot({fields})"
+
 class SystemMonitor:
+    # (합계에 넣을 장치, 화면/스냅샷에 보일 장치) 필터입니다. 하위 클래스가 바꿀 수 있습니다.
+    NIC_FILTERS = (_always, _is_physical_nic)
+    DISK_FILTERS = (_is_whole_disk, _is_physical_disk)
+
     def __init__(self):
-        # 네트워크 속도 계산을 위한 초기값 설정
-        self.last_net_stats = psutil.net_io_counters()
-        self.last_disk_stats = psutil.disk_io_counters()
-        self.boot_time = psutil.boot_time()
+        # 네트워크 속도 계산을 위한 초기값 설정 (속도는 monotonic 시각 차이로 정규화합니다)
+        # NIC/디스크별 카운터는 장치 표에 두고 속도를 벡터 연산으로 계산합니다.
+        now = time.monotonic()
+        self.nic_table = DeviceCounterTable((0, 1))    # bytes_sent, bytes_recv
+        self.disk_table = DeviceCounterTable((2, 3))   # read_bytes, write_bytes
+        self._mask_cache = {}
+        self.nic_table.update(self.read_nic_counters(), 0)
+        self.last_net_time = now
+        self.disk_table.update(self.read_disk_counters(), 0)
+        self.last_disk_time = now
+        self.last_sample_time = now
+        self.boot_time = self.read_boot_time()
+
+    def read_boot_time(self):
+        return psutil.boot_time()
+
+    def read_nic_counters(self):
+        """NIC 이름 → 카운터 (bytes_sent, bytes_recv 가 0, 1 번째) dict 입니다."""
+        return psutil.net_io_counters(pernic=True)
+
+    def read_disk_counters(self):
+        """디스크 이름 → 카운터 (read_bytes, write_bytes 가 2, 3 번째) dict 입니다."""
+        return psutil.disk_io_counters(perdisk=True) or {}
 
     def get_static_system_info(self):
         """OS, CPU, GPU, BOARD 등 정적 시스템 정보를 반환합니다."""
         try:
-            wmi_obj = wmi.WMI()
-            os_info = wmi_obj.Win32_OperatingSystem()[0]
-            proc_info = wmi_obj.Win32_Processor()[0]
-            gpu_info = wmi_obj.Win32_VideoController()[0]
-            board_info = wmi_obj.Win32_BaseBoard()[0]
-            
-            os_name = os_info.Name.encode('utf-8').split(b'|')[0].decode('utf-8').strip()
-            os_version = f"{os_info.Version} ({os_info.BuildNumber})"
-            
-            disks = []
-            for i, disk in enumerate(wmi_obj.Win32_DiskDrive()):
-                disk_name = disk.Model.strip()
-                partitions = [p for p in disk.associators("Win32_DiskDriveToDiskPartition")]
-                for partition in partitions:
-                    if partition:
-                        logical_disks = [ld for ld in partition.associators("Win32_LogicalDiskToPartition")]
-                        for ld in logical_disks:
-                            if ld.DriveType == 3: # 3은 로컬 디스크를 의미
-                                disks.append({
-                                    "name": f"DISK{i} - {disk_name}",
-                                    "device_id": ld.DeviceID
-                                })
-            
-            return {
-                "os": f"OS | {os_name} {os_version}",
-                "cpu": f"CPU | {proc_info.Name}",
-                "gpu": f"GPU | {gpu_info.Name}",
-                "board": f"BOARD | {board_info.Product}",
-                "disks": disks
-            }
+            return get_static_info_backend().collect()
         except Exception as e:
-            print(f"Failed to get WMI info: {e}")
+            print(f"Failed to get static system info: {e}")
             return None
 
     def get_cpu_usage(self):
@@ -67,48 +122,91 @@ class SystemMonitor:
     
     def get_uptime(self):
         """시스템 부팅 후 경과 시간을 문자열로 반환합니다."""
-        uptime_seconds = int(time.time() - self.boot_time)
-        days = uptime_seconds // (24 * 3600)
-        hours = (uptime_seconds % (24 * 3600)) // 3600
-        minutes = (uptime_seconds % 3600) // 60
-        seconds = uptime_seconds % 60
-        return f"{days} day{'s' if days != 1 else ''}, {hours:02d}:{minutes:02d}:{seconds:02d}"
+        return format_uptime(time.time() - self.boot_time)
+
+    def _masks(self, table, counted, shown):
+        """
+        합계에 넣을 장치와 화면/스냅샷에 보일 장치의 행 마스크입니다.
+        장치 목록이 바뀔 때만 다시 만듭니다.
+        """
+        cached = self._mask_cache.get(id(table))
+        if cached is None or cached[0] != table.version:
+            cached = (table.version, table.mask(counted), table.mask(shown))
+            self._mask_cache[id(table)] = cached
+        return cached[1], cached[2]
 
     def get_network_stats(self):
-        """네트워크 업로드/다운로드 속도를 바이트 단위로 반환하고, 총량을 업데이트합니다."""
-        current_net_stats = psutil.net_io_counters()
-        sent = current_net_stats.bytes_sent - self.last_net_stats.bytes_sent
-        recv = current_net_stats.bytes_recv - self.last_net_stats.bytes_recv
-        self.last_net_stats = current_net_stats
-        return sent, recv, current_net_stats.bytes_sent, current_net_stats.bytes_recv
-    
+        """
+        네트워크 업로드/다운로드 속도(바이트/초)와 총량, NIC 별 (업로드, 다운로드) 속도 dict 를 반환합니다.
+        """
+        per_nic = self.read_nic_counters()
+        now = time.monotonic()
+        self.nic_table.update(per_nic, now - self.last_net_time)
+        self.last_net_time = now
+        counted, shown = self._masks(self.nic_table, *self.NIC_FILTERS)
+        sent_total, received_total = self.nic_table.totals(counted)
+        sent, received = self.nic_table.rate_totals(counted)
+        return float(sent), float(received), int(sent_total), int(received_total), self.nic_table.as_dict(shown)
+
     def get_disk_io(self):
-        """디스크 I/O를 바이트 단위로 반환하고, 총량을 업데이트합니다."""
-        new_disk_stats = psutil.disk_io_counters()
-        read_speed = new_disk_stats.read_bytes - self.last_disk_stats.read_bytes
-        write_speed = new_disk_stats.write_bytes - self.last_disk_stats.write_bytes
-        self.last_disk_stats = new_disk_stats
-        return read_speed, write_speed
-    
-    def get_ips(self):
-        """내부/외부 IP 주소를 반환합니다."""
-        internal_ip = "127.0.0.1"
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            internal_ip = s.getsockname()[0]
-            s.close()
-        except Exception:
-            pass
-            
-        external_ip = "Fetching..."
-        try:
-            response = requests.get('https://api.ipify.org?format=json', timeout=5)
-            response.raise_for_status()
-            external_ip = response.json().get('ip')
-        except requests.exceptions.RequestException:
-            external_ip = "Failed to fetch"
-        except Exception:
-            external_ip = "Error"
-        
-        return internal_ip, external_ip
+        """
+        디스크 읽기/쓰기 속도(바이트/초)와 디스크별 (읽기, 쓰기) 속도 dict 를 반환합니다.
+        합계는 psutil 의 전체 카운터와 같이 파티션을 빼고 디스크 단위로만 더합니다.
+        """
+        per_disk = self.read_disk_counters()
+        now = time.monotonic()
+        self.disk_table.update(per_disk, now - self.last_disk_time)
+        self.last_disk_time = now
+        counted, shown = self._masks(self.disk_table, *self.DISK_FILTERS)
+        read_speed, write_speed = self.disk_table.rate_totals(counted)
+        return float(read_speed), float(write_speed), self.disk_table.as_dict(shown)
+
+    def sample(self, disk_ids=()):
+        """
+        모든 동적 지표를 정확히 한 번씩 읽어 하나의 Snapshot 으로 반환합니다.
+        cpu_percent 를 여러 번 호출하면 psutil 의 측정 구간이 초기화되므로 틱당 한 번만 호출합니다.
+        """
+        sample_time = time.monotonic()
+        interval = sample_time - self.last_sample_time
+        self.last_sample_time = sample_time
+        return self.make_snapshot(
+            cpu_percents=tuple(self.get_cpu_usage()),
+            ram_percent=self.get_ram_usage(),
+            network=self.get_network_stats(),
+            disk_io=self.get_disk_io(),
+            disk_usage={device_id: self.get_disk_usage(device_id) for device_id in disk_ids},
+            interval=interval,
+        )
+
+    def make_snapshot(self, cpu_percents, ram_percent, network, disk_io, disk_usage, interval, processes=()):
+        """
+        각 수집 함수의 결과를 Snapshot 으로 묶습니다.
+        network 는 get_network_stats(), disk_io 는 get_disk_io() 의 반환값 형식이고,
+        두 값의 마지막 항목인 장치별 속도 dict 는 nic_rates / disk_rates 로 들어갑니다.
+        processes 는 ProcessScanner.scan() 이 반환한 상위 프로세스 목록입니다.
+        """
+        sent_rate, received_rate, sent_total, received_total, nic_rates = network
+        read_speed, write_speed, disk_rates = disk_io
+        now = time.time()
+        return Snapshot(
+            timestamp=now,
+            uptime_seconds=now - self.boot_time,
+            cpu_percents=cpu_percents,
+            cpu_average=sum(cpu_percents) / len(cpu_percents) if cpu_percents else 0,
+            ram_percent=ram_percent,
+            sent_rate=sent_rate,
+            received_rate=received_rate,
+            sent_total=sent_total,
+            received_total=received_total,
+            read_speed=read_speed,
+            write_speed=write_speed,
+            sent_peak=sent_rate,
+            received_peak=received_rate,
+            read_peak=read_speed,
+            write_peak=write_speed,
+            interval=interval,
+            disk_usage=disk_usage,
+            processes=processes,
+            nic_rates=nic_rates,
+            disk_rates=disk_rates,
+        )
@@ -0,0 +1,45 @@
+import json
+import struct
+
+# 프레임 = 4바이트 빅엔디언 길이 + 본문.
+# 연결의 첫 프레임은 hello JSON 객체이고, 이후 프레임은 SnapshotEncoder 가 만든 바이너리 스냅샷입니다.
+FRAME_HEADER = struct.Struct("!I")
+# 이보다 긴 프레임을 보내는 연결은 끊습니다. 수신 측 연결별 버퍼 크기의 상한이기도 합니다.
+MAX_FRAME_BYTES = 1 << 20
+
+def encode_frame(payload):
+    """본문 앞에 길이를 붙입니다."""
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+def encode_message(message):
+    """메시지 dict 하나를 공백 없는 JSON 프레임으로 만듭니다."""
+    return encode_frame(json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+class FrameReader:
+    """
+    TCP 로 조각나서 들어오는 바이트를 프레임 단위로 자릅니다.
+    완성되지 않은 프레임만 버퍼에 남기므로 연결당 메모리는 max_frame_bytes 를 넘지 않습니다.
+    """
+    def __init__(self, max_frame_bytes=MAX_FRAME_BYTES):
+        self.max_frame_bytes = max_frame_bytes
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """받은 바이트를 추가하고 완성된 프레임 본문 목록을 반환합니다. 프레임이 너무 길면 ValueError 입니다."""
+        buffer = self.buffer
+        buffer += data
+        frames = []
+        offset = 0
+        header_size = FRAME_HEADER.size
+        while len(buffer) - offset >= header_size:
+            (length,) = FRAME_HEADER.unpack_from(buffer, offset)
+            if length > self.max_frame_bytes:
+                raise ValueError(f"frame too large: {length} bytes")
+            end = offset + header_size + length
+            if end > len(buffer):
+                break
+            frames.append(bytes(buffer[offset + header_size:end]))
+            offset = end
+        if offset:
+            del buffer[:offset]
+        return frames
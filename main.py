@@ -1,11 +1,175 @@
+import time
+
+# 첫 화면까지 걸린 시간을 재기 위해 다른 모듈을 불러오기 전에 시작 시각을 기록합니다.
+STARTED_AT = time.perf_counter()
+
+import argparse
 import sys
-from PyQt6.QtWidgets import QApplication
-from ui.dashboard_app import DashboardApp
 
-# 프로그램의 시작점
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    dashboard = DashboardApp()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="PC Dashboard")
+    parser.add_argument("--headless", action="store_true",
+                        help="Qt 화면 없이 수집만 하고 메트릭을 HTTP 로 제공합니다.")
+    parser.add_argument("--agent", metavar="HOST:PORT",
+                        help="Qt 화면 없이 수집하고 스냅샷을 HOST:PORT 의 수신기(--listen)로 보냅니다.")
+    parser.add_argument("--agent-name", metavar="NAME", help="에이전트가 수신기에 알릴 호스트 이름 (기본: hostname)")
+    parser.add_argument("--listen", metavar="[HOST:]PORT",
+                        help="에이전트들의 스냅샷을 받아 여러 호스트를 타일로 보여 주는 화면을 띄웁니다.")
+    parser.add_argument("--host", default="127.0.0.1", help="헤드리스 모드 HTTP 바인드 주소")
+    parser.add_argument("--port", type=int, default=9100, help="헤드리스 모드 HTTP 포트")
+    parser.add_argument("--jsonl", type=int, default=0, metavar="N",
+                        help="최근 N 개 스냅샷을 /snapshots.jsonl 로 제공합니다. (헤드리스 모드)")
+    parser.add_argument("--sample-interval", type=int, default=1000, metavar="MS", help="수집 주기 (ms)")
+    parser.add_argument("--display-interval", type=int, default=1000, metavar="MS", help="화면/내보내기 주기 (ms)")
+    parser.add_argument("--history", metavar="PATH", help="히스토리를 기록할 링 파일 경로")
+    parser.add_argument("--history-points", type=int, default=100, metavar="N",
+                        help="그래프에 표시할 최근 샘플 수 (메모리 히스토리 크기)")
+    parser.add_argument("--history-window", type=int, metavar="SECONDS",
+                        help="그래프에 표시할 기간 (초). 지정하면 집계 계층에서 그립니다.")
+    parser.add_argument("--top-processes", type=int, default=None, metavar="N",
+                        help="상위 N 개 프로세스를 수집합니다. (기본: 화면 8, 헤드리스 0, 0 이면 끔)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="화면/내보내기로 보내는 스냅샷을 재생용 녹화 파일로 남깁니다. (화면, 헤드리스, 에이전트 모드)")
+    parser.add_argument("--replay", metavar="PATH", help="수집 대신 녹화 파일을 재생해 화면을 갱신합니다.")
+    parser.add_argument("--replay-speed", type=float, default=1.0, metavar="X",
+                        help="재생 배속 (1, 10 ...). 0 이면 기다리지 않고 최대한 빨리 재생합니다.")
+    parser.add_argument("--replay-report", metavar="PATH",
+                        help="재생이 끝나면 틱 지연, 건너뛴 프레임, 페인트 시간을 JSON 으로 저장하고 종료합니다.")
+    parser.add_argument("--synthetic", metavar="SPEC",
+                        help="실제 장치 대신 가상 부하로 수집합니다. 예: \"cores=256,disks=64,nics=32,pattern=burst\" "
+                             "(pattern: sine, burst, random_walk)")
+    parser.add_argument("--alert", action="append", metavar="RULE",
+                        help="경보 규칙. 여러 번 줄 수 있습니다. 예: \"cpu avg > 85%% for 30s\", \"disk C: > 95%%\", "
+                             "\"net recv ewma > 100MB/s => 명령\"")
+    parser.add_argument("--alerts", metavar="PATH", help="한 줄에 규칙 하나인 경보 규칙 파일")
+    parser.add_argument("--ip-endpoint", default="https://api.ipify.org?format=json",
+                        help="외부 IP 를 조회할 HTTP 주소 ({\"ip\": ...} JSON 또는 텍스트 응답)")
+    # Qt 가 사용하는 인자(-platform 등)는 QApplication 에 그대로 넘깁니다.
+    return parser.parse_known_args(argv)
+
+def make_monitor(args):
+    """--synthetic 이 있으면 SyntheticMonitor 를, 없으면 None(기본 SystemMonitor)을 돌려줍니다."""
+    if args.synthetic is None:
+        return None
+    from data.synthetic_monitor import SyntheticMonitor, parse_spec
+    return SyntheticMonitor(**parse_spec(args.synthetic))
+
+def load_alert_rules(args):
+    """--alerts 파일과 --alert 규칙을 읽습니다. 형식이 틀리면 이유를 출력하고 종료합니다."""
+    if not (args.alerts or args.alert):
+        return ()
+    from data.alerts import load_rules, parse_rule
+    try:
+        rules = load_rules(args.alerts) if args.alerts else []
+        rules.extend(parse_rule(text) for text in args.alert or ())
+    except (OSError, ValueError) as e:
+        print(f"경보 규칙을 읽지 못했습니다: {e}")
+        sys.exit(2)
+    return rules
+
+def run_dashboard(args, qt_argv):
+    from PyQt6.QtWidgets import QApplication
+    from ui.dashboard_app import DashboardApp
+
+    app = QApplication(qt_argv)
+    dashboard = DashboardApp(
+        sample_interval_ms=args.sample_interval,
+        display_interval_ms=args.display_interval,
+        history_path=args.history,
+        history_window_seconds=args.history_window,
+        history_points=args.history_points,
+        ip_endpoint=args.ip_endpoint,
+        process_limit=8 if args.top_processes is None else args.top_processes,
+        started_at=STARTED_AT,
+        record_path=args.record,
+        monitor=make_monitor(args),
+        alert_rules=load_alert_rules(args),
+    )
     dashboard.show()
-    sys.exit(app.exec())
+    return app.exec()
+
+def run_replay(args, qt_argv):
+    import json
+    from PyQt6.QtWidgets import QApplication
+    from data.replay import ReplaySource
+    from ui.dashboard_app import DashboardApp
 
+    app = QApplication(qt_argv)
+    source = ReplaySource(args.replay, args.replay_speed)
+    dashboard = DashboardApp(
+        history_window_seconds=args.history_window,
+        history_points=args.history_points,
+        process_limit=8 if args.top_processes is None else args.top_processes,
+        started_at=STARTED_AT,
+        source=source,
+        alert_rules=load_alert_rules(args),
+    )
+    # 재생 결과에 섹션별 반영 시간과 페인트 시간을 함께 남깁니다.
+    dashboard.profiler.enabled = True
+
+    def finish(report):
+        report["profile"] = dashboard.profiler.to_dict()
+        print(json.dumps(report, indent=2))
+        if args.replay_report:
+            with open(args.replay_report, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            dashboard.close()
+            app.quit()
+
+    source.finished.connect(finish)
+    dashboard.show()
+    return app.exec()
+
+def run_multi_host(args, qt_argv):
+    from PyQt6.QtWidgets import QApplication
+    from data.agent import parse_address
+    from data.receiver import HostReceiver
+    from ui.multi_host import MultiHostView
+
+    app = QApplication(qt_argv)
+    # --listen 9200 처럼 포트만 주면 모든 인터페이스에서 받습니다.
+    host, port = parse_address(args.listen if ":" in args.listen else f"0.0.0.0:{args.listen}")
+    receiver = HostReceiver(host, port, history_points=args.history_points)
+    bound_host, bound_port = receiver.start()
+    print(f"에이전트 수신 대기 중: {bound_host}:{bound_port}")
+    view = MultiHostView(
+        receiver,
+        process_limit=8 if args.top_processes is None else args.top_processes,
+        history_points=args.history_points,
+    )
+    view.resize(1280, 800)
+    view.show()
+    return app.exec()
+
+# 프로그램의 시작점
+if __name__ == "__main__":
+    args, qt_args = parse_args()
+    if args.headless:
+        from data.headless import run_headless
+        sys.exit(run_headless(
+            host=args.host,
+            port=args.port,
+            sample_interval_ms=args.sample_interval,
+            display_interval_ms=args.display_interval,
+            history_path=args.history,
+            jsonl_history=args.jsonl,
+            process_limit=args.top_processes or 0,
+            record_path=args.record,
+            monitor=make_monitor(args),
+        ))
+    if args.agent:
+        from data.agent import run_agent
+        sys.exit(run_agent(
+            args.agent,
+            host_name=args.agent_name,
+            sample_interval_ms=args.sample_interval,
+            display_interval_ms=args.display_interval,
+            process_limit=args.top_processes or 0,
+            record_path=args.record,
+            monitor=make_monitor(args),
+        ))
+    if args.replay:
+        sys.exit(run_replay(args, sys.argv[:1] + qt_args))
+    if args.listen:
+        sys.exit(run_multi_host(args, sys.argv[:1] + qt_args))
+    sys.exit(run_dashboard(args, sys.argv[:1] + qt_args))
@@ -0,0 +1,309 @@
+"""
+SystemMonitor 수집 함수, 포맷 함수, 경보 규칙 평가, DashboardApp.update_all_data 한 틱의 비용을 측정합니다.
+
+    python tests/benchmark.py --output bench.json
+    python tests/benchmark.py --baseline bench.json
+
+각 항목의 p50/p99 지연(µs)과 호출당 할당량(tracemalloc 최대 바이트, 남은 블록 수)을 출력하고
+JSON 으로 저장합니다. --baseline 을 주면 이전 결과와 p50 을 비교해 허용 비율을 넘으면 1 로 종료합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from data.alerts import AlertEngine, parse_rule
+from data.downsample import minmax_downsample
+from data.processes import ProcessInfo, ProcessScanner
+from data.system_monitor import Snapshot, SystemMonitor
+from utils.helpers import format_bytes, format_network_speed
+
+class FakeMonitor:
+    """
+    실제 시스템을 읽지 않고 정해진 패턴의 Snapshot 을 만들어 UI 틱만 측정하기 위한 모니터입니다.
+    """
+    def __init__(self, cores=16, disks=("C:", "D:"), nics=("Ethernet", "Wi-Fi"),
+                 physical_disks=("PhysicalDrive0", "PhysicalDrive1")):
+        self.cores = cores
+        self.disks = tuple(disks)
+        self.nics = tuple(nics)
+        self.physical_disks = tuple(physical_disks)
+        self.tick = 0
+
+    def sample(self, disk_ids=()):
+        self.tick += 1
+        t = self.tick
+        cpu_percents = tuple(float((t * 7 + core * 13) % 100) for core in range(self.cores))
+        rate = float((t * 104729) % (50 * 1024 * 1024))
+        return Snapshot(
+            timestamp=time.time(),
+            uptime_seconds=3600.0 + t,
+            cpu_percents=cpu_percents,
+            cpu_average=sum(cpu_percents) / len(cpu_percents),
+            ram_percent=float(40 + t % 20),
+            sent_rate=rate,
+            received_rate=rate * 2,
+            sent_total=int(rate * t),
+            received_total=int(rate * t * 2),
+            read_speed=rate / 2,
+            write_speed=rate / 3,
+            sent_peak=rate,
+            received_peak=rate * 2,
+            read_peak=rate / 2,
+            write_peak=rate / 3,
+            interval=1.0,
+            disk_usage={
+                device_id: (500 * 1024 ** 3 + t * 4096, 1024 ** 4, 48.8 + (t % 10) / 10)
+                for device_id in (disk_ids or self.disks)
+            },
+            processes=tuple(
+                ProcessInfo(1000 + i, f"process-{i}", "", float((t * 3 + i * 17) % 400), (i + 1) * 64 * 1024 ** 2,
+                            int(rate * i), rate / (i + 1))
+                for i in range(10)
+            ),
+            nic_rates={nic: (rate / (i + 1), rate * 2 / (i + 1)) for i, nic in enumerate(self.nics)},
+            disk_rates={disk: (rate / (i + 2), rate / (i + 3)) for i, disk in enumerate(self.physical_disks)},
+        )
+
+def measure(func, iterations, warmup=5):
+    """func 를 반복 호출해 지연 시간 분포와 호출당 할당량을 측정합니다."""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+
+    # 할당 측정은 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 따로 실행합니다.
+    alloc_iterations = max(1, min(iterations, 200))
+    tracemalloc.start()
+    peak_bytes = 0
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(alloc_iterations):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        peak_bytes += tracemalloc.get_traced_memory()[1] - current
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+
+    def percentile(p):
+        return samples[min(len(samples) - 1, int(len(samples) * p / 100))] / 1000
+
+    return {
+        "iterations": iterations,
+        "p50_us": percentile(50),
+        "p99_us": percentile(99),
+        "mean_us": statistics.fmean(samples) / 1000,
+        "alloc_bytes_per_call": peak_bytes / alloc_iterations,
+        "retained_blocks_per_call": (blocks_after - blocks_before) / alloc_iterations,
+    }
+
+def collector_benchmarks(iterations):
+    monitor = SystemMonitor()
+    info = monitor.get_static_system_info()
+    disk_ids = tuple(disk["device_id"] for disk in info["disks"]) if info else ()
+    disk_id = disk_ids[0] if disk_ids else os.path.abspath(os.sep)
+
+    yield "monitor.get_cpu_usage", monitor.get_cpu_usage, iterations
+    yield "monitor.get_ram_usage", monitor.get_ram_usage, iterations
+    yield "monitor.get_disk_usage", lambda: monitor.get_disk_usage(disk_id), iterations
+    yield "monitor.get_uptime", monitor.get_uptime, iterations
+    yield "monitor.get_network_stats", monitor.get_network_stats, iterations
+    yield "monitor.get_disk_io", monitor.get_disk_io, iterations
+    yield "monitor.sample", lambda: monitor.sample(disk_ids), iterations
+    yield "monitor.get_static_system_info", monitor.get_static_system_info, max(1, iterations // 100)
+    scanner = ProcessScanner()
+    yield "process_scanner.scan", scanner.scan, max(1, iterations // 100)
+
+def formatter_benchmarks(iterations):
+    values = [0, 512, 1536, 10 * 1024 ** 2, 3 * 1024 ** 4, 7 * 1024 ** 5]
+    yield "helpers.format_bytes", lambda: [format_bytes(v) for v in values], iterations
+    yield "helpers.format_network_speed", lambda: [format_network_speed(v) for v in values], iterations
+
+def alert_benchmarks(iterations):
+    """지표와 집계 방식을 섞은 규칙 수백 개를 스냅샷 하나에 평가하는 비용입니다."""
+    monitor = FakeMonitor()
+    metrics = ["cpu avg", "cpu max", "ram", "net sent", "net recv", "disk read", "disk write"]
+    metrics += [f"disk {device_id}" for device_id in monitor.disks]
+    aggregates = ["", "ewma 10s ", "mean 30s ", "max 30s "]
+    snapshots = [monitor.sample() for _ in range(100)]
+    for count in (10, 500):
+        engine = AlertEngine(
+            parse_rule(f"{metrics[i % len(metrics)]} {aggregates[i % 4]}> {(i * 37) % 100} for {i % 5}s")
+            for i in range(count)
+        )
+        position = [0]
+
+        def evaluate(engine=engine):
+            engine.evaluate(snapshots[position[0] % len(snapshots)])
+            position[0] += 1
+
+        yield f"alerts.evaluate.{count}", evaluate, iterations
+
+class IdleSource:
+    """
+    스냅샷을 보내지 않는 DashboardApp 소스입니다. 기본 BackgroundSampler 는 실제 SystemMonitor 를 읽는 스레드를
+    시작하므로, 틱 측정에 실제 수집 비용과 스냅샷이 섞이지 않도록 이 소스를 넘깁니다.
+    """
+    ring_file = None
+
+    def connect(self, slot):
+        pass
+
+    def connect_static_info(self, slot):
+        pass
+
+    def connect_percentiles(self, slot):
+        pass
+
+    def describe(self):
+        return "-", "benchmark"
+
+    def history_rows(self, count):
+        return None
+
+    def set_slowdown(self, factor):
+        pass
+
+    def collector_stats(self):
+        return {}
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+def dashboard_benchmarks(iterations):
+    from PyQt6.QtWidgets import QApplication
+    from ui.dashboard_app import DashboardApp
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    dashboard = DashboardApp(source=IdleSource(), fullscreen=False)
+    monitor = FakeMonitor()
+    try:
+        # 첫 화면 이후의 초기화(그래프 준비)를 미리 끝내 측정 중에 타이머로 실행되지 않게 합니다.
+        dashboard.initialize_app()
+        dashboard.apply_static_info({
+            "os": "OS | Benchmark", "cpu": "CPU | Benchmark", "gpu": "GPU | Benchmark", "board": "Board | Benchmark",
+            "disks": [{"name": f"DISK - {device_id}", "device_id": device_id} for device_id in monitor.disks],
+        })
+
+        def tick():
+            dashboard.update_all_data(monitor.sample())
+            app.processEvents()
+
+        # 히스토리가 가득 찬 상태에서 측정합니다.
+        for _ in range(dashboard.max_history):
+            dashboard.update_all_data(monitor.sample())
+        yield "dashboard.update_all_data", tick, iterations
+    finally:
+        dashboard.close()
+        dashboard.deleteLater()
+        app.processEvents()
+
+def chart_benchmarks(iterations):
+    """
+    히스토리 길이별로 그래프 한 번 갱신(setData + 다시 그리기) 비용을 잽니다.
+    downsampled 는 대시보드와 같은 최소/최대 축약 경로이고, raw 는 모든 점을 그대로 넘기는 경우입니다.
+    """
+    from PyQt6.QtWidgets import QApplication
+    import pyqtgraph as pg
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    widget = pg.PlotWidget()
+    widget.resize(800, 120)
+    item = widget.plot(pen=pg.mkPen(color='#0000FF', width=2), clipToView=True)
+    widget.show()
+    app.processEvents()
+    pixel_width = int(item.getViewBox().width())
+
+    rng = np.random.default_rng(0)
+    for count in (100, 10_000, 1_000_000):
+        series = np.abs(np.cumsum(rng.standard_normal(count)))
+
+        def downsampled(series=series):
+            x, y = minmax_downsample(series, pixel_width)
+            item.setData(x, y)
+            widget.repaint()
+
+        def raw(series=series):
+            item.setData(series)
+            widget.repaint()
+
+        yield f"chart.downsampled.{count}", downsampled, iterations
+        yield f"chart.raw.{count}", raw, max(1, iterations // (100 if count >= 1_000_000 else 1))
+    widget.close()
+
+def run(iterations, groups):
+    results = {}
+    for group in groups:
+        for name, func, count in group(iterations):
+            results[name] = measure(func, count)
+            stats = results[name]
+            print(f"{name:34s} p50 {stats['p50_us']:10.1f}us  p99 {stats['p99_us']:10.1f}us  "
+                  f"alloc {stats['alloc_bytes_per_call']:10.0f}B")
+    return {
+        "meta": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+        },
+        "results": results,
+    }
+
+def compare(report, baseline, max_ratio):
+    """p50 을 기준 결과와 비교하고, 허용 비율을 넘은 항목 수를 반환합니다."""
+    regressions = 0
+    print(f"\n{'benchmark':34s} {'baseline':>12s} {'current':>12s} {'ratio':>7s}")
+    for name, stats in report["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            continue
+        ratio = stats["p50_us"] / base["p50_us"] if base["p50_us"] else float("inf")
+        mark = "  <-- regression" if ratio > max_ratio else ""
+        regressions += ratio > max_ratio
+        print(f"{name:34s} {base['p50_us']:10.1f}us {stats['p50_us']:10.1f}us {ratio:7.2f}{mark}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PC Dashboard benchmark")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-ratio", type=float, default=1.5, help="허용하는 p50 증가 비율")
+    parser.add_argument("--skip-ui", action="store_true", help="DashboardApp 틱 측정을 생략합니다.")
+    args = parser.parse_args(argv)
+
+    groups = [collector_benchmarks, formatter_benchmarks, alert_benchmarks]
+    if not args.skip_ui:
+        groups.append(dashboard_benchmarks)
+        groups.append(chart_benchmarks)
+    report = run(args.iterations, groups)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.max_ratio):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
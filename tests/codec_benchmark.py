@@ -0,0 +1,113 @@
+"""
+바이너리 스냅샷 형식(data/snapshot_codec.py)과 JSON 의 스냅샷당 크기와 인코딩/디코딩 시간을 비교합니다.
+
+    python tests/codec_benchmark.py --cores 16 128 --frames 600
+
+FakeMonitor 로 연속된 스냅샷을 만들어 같은 순서로 인코딩합니다. JSON 은 익스포터와 같은 snapshot_to_dict 에
+정적 정보를 함께 넣은 것이고(에이전트 초기 형식), binary 는 기본 float32, binary-exact 는 float64 배열입니다.
+디코딩 시간은 Snapshot 객체를 다시 만드는 데까지 포함합니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import FakeMonitor
+from data.exporter import snapshot_to_dict
+from data.processes import ProcessInfo
+from data.snapshot_codec import SnapshotDecoder, SnapshotEncoder
+from data.system_monitor import Snapshot
+
+def snapshot_from_dict(values):
+    """snapshot_to_dict() 의 역변환입니다. 내보내지 않는 프로세스 명령줄은 빈 문자열이 됩니다."""
+    fields = dict(values)
+    fields["cpu_percents"] = tuple(values["cpu_percents"])
+    fields["disk_usage"] = {
+        device_id: (usage["used"], usage["total"], usage["percent"])
+        for device_id, usage in values["disk_usage"].items()
+    }
+    fields["nic_rates"] = {nic: (rates["sent"], rates["received"]) for nic, rates in values["nic_rates"].items()}
+    fields["disk_rates"] = {disk: (rates["read"], rates["write"]) for disk, rates in values["disk_rates"].items()}
+    fields["processes"] = tuple(
+        ProcessInfo(process["pid"], process["name"], process.get("cmdline", ""), process["cpu_percent"],
+                    process["rss"], process["io_bytes"], process["io_rate"])
+        for process in values["processes"]
+    )
+    return Snapshot(**fields)
+
+def static_info_for(cores, disks):
+    return {
+        "os": "OS | Windows 11 Pro",
+        "cpu": f"CPU | Synthetic {cores}-thread processor",
+        "gpu": "GPU | NVIDIA GeForce RTX 4090",
+        "board": "Board | Synthetic Board",
+        "disks": [{"name": f"{disk} (Local Disk)", "device_id": disk} for disk in disks],
+    }
+
+def json_codec(static_info):
+    def encode(snapshot):
+        values = snapshot_to_dict(snapshot)
+        values["static"] = static_info
+        return json.dumps(values, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def decode(data):
+        values = json.loads(data)
+        del values["static"]
+        return snapshot_from_dict(values)
+    return encode, decode
+
+def binary_codec(static_info, exact):
+    encoder, decoder = SnapshotEncoder(exact=exact), SnapshotDecoder()
+    return (lambda snapshot: encoder.encode(snapshot, static_info)), decoder.decode
+
+def bench(snapshots, encode, decode):
+    encode_ns, decode_ns, sizes = [], [], []
+    for snapshot in snapshots:
+        start = time.perf_counter_ns()
+        data = encode(snapshot)
+        encode_ns.append(time.perf_counter_ns() - start)
+        start = time.perf_counter_ns()
+        decode(data)
+        decode_ns.append(time.perf_counter_ns() - start)
+        sizes.append(len(data))
+    return {
+        "bytes_mean": statistics.fmean(sizes),
+        "bytes_first": sizes[0],
+        "encode_p50_us": statistics.median(encode_ns) / 1000,
+        "decode_p50_us": statistics.median(decode_ns) / 1000,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스냅샷 바이너리 형식 대 JSON 벤치마크")
+    parser.add_argument("--cores", type=int, nargs="+", default=[16, 128], help="코어 수 목록")
+    parser.add_argument("--disks", type=int, default=4, help="디스크 수")
+    parser.add_argument("--frames", type=int, default=600, help="스냅샷 수 (10 Hz 로 1분이면 600)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for cores in args.cores:
+        disks = tuple(f"{chr(ord('C') + i)}:" for i in range(args.disks))
+        monitor = FakeMonitor(cores=cores, disks=disks)
+        snapshots = [monitor.sample() for _ in range(args.frames)]
+        static_info = static_info_for(cores, disks)
+        for name, (encode, decode) in (
+            ("json", json_codec(static_info)),
+            ("binary", binary_codec(static_info, exact=False)),
+            ("binary-exact", binary_codec(static_info, exact=True)),
+        ):
+            stats = results[f"{cores}cores.{name}"] = bench(snapshots, encode, decode)
+            print(f"{cores:4d} cores {name:13s} {stats['bytes_mean']:8.0f} B/snapshot (first {stats['bytes_first']:5d})"
+                  f"  encode {stats['encode_p50_us']:7.1f}us  decode {stats['decode_p50_us']:7.1f}us")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+여러 에이전트를 루프백으로 HostReceiver 에 붙여 수신기 비용과 호스트별 메모리를 확인합니다.
+
+    python tests/multi_host_loopback.py --hosts 100 --real-agents 3 --seconds 10
+
+--hosts 개의 가상 에이전트(FakeMonitor 스냅샷, 실제 AgentConnection 사용)를 자식 프로세스 하나에서 돌리고,
+--real-agents 개의 `main.py --agent` 프로세스를 함께 띄웁니다. 이 프로세스에서는 수신 스레드만 일하므로
+프로세스 CPU 시간이 곧 수신기 비용입니다. 모든 호스트가 도착했는지, 수신기가 코어 하나의 --max-cpu
+비율 이내인지, 처음 몇 초 이후 RSS 가 늘지 않았는지를 확인하고, 어긋나면 1 로 종료합니다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmark import FakeMonitor
+from data.agent import AgentConnection
+from data.receiver import HostReceiver
+
+def simulate(port, hosts, seconds, rate):
+    """가상 에이전트 hosts 개가 1/rate 초마다 스냅샷을 보냅니다. 보내는 시각은 호스트별로 분산합니다."""
+    static_info = {"os": "OS | Simulated", "cpu": "CPU | Simulated", "gpu": "GPU | -", "board": "Board | -",
+                   "disks": [{"name": "C:", "device_id": "C:"}]}
+    agents = [
+        (AgentConnection(("127.0.0.1", port), f"sim-{i:03d}", static_info), FakeMonitor(cores=16))
+        for i in range(hosts)
+    ]
+    period = 1.0 / rate
+    start = time.monotonic()
+    tick = 0
+    while time.monotonic() - start < seconds:
+        for i, (connection, monitor) in enumerate(agents):
+            due = start + tick * period + period * i / hosts
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            connection.send(monitor.sample(("C:",)))
+        tick += 1
+    for connection, _ in agents:
+        connection.close()
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="다중 호스트 수신기 루프백 테스트")
+    parser.add_argument("--hosts", type=int, default=100, help="가상 에이전트 수")
+    parser.add_argument("--real-agents", type=int, default=3, help="함께 띄울 main.py --agent 프로세스 수")
+    parser.add_argument("--seconds", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--rate", type=float, default=1.0, help="에이전트당 초당 스냅샷 수")
+    parser.add_argument("--max-cpu", type=float, default=0.5, help="허용할 수신기 CPU 사용률 (코어 하나 = 1.0)")
+    parser.add_argument("--max-rss-growth", type=int, default=16 * 1024 * 1024, metavar="BYTES",
+                        help="준비 시간 이후 허용할 RSS 증가량")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    parser.add_argument("--simulate", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.simulate:
+        return simulate(args.simulate, args.hosts, args.seconds, args.rate)
+
+    receiver = HostReceiver("127.0.0.1", 0, history_points=600)
+    _, port = receiver.start()
+    children = [subprocess.Popen([sys.executable, os.path.abspath(__file__), "--simulate", str(port),
+                                  "--hosts", str(args.hosts), "--seconds", str(args.seconds),
+                                  "--rate", str(args.rate)], stdout=subprocess.DEVNULL)]
+    for i in range(args.real_agents):
+        children.append(subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "main.py"), "--agent", f"127.0.0.1:{port}",
+             "--agent-name", f"agent-{i}"],
+            stdout=subprocess.DEVNULL,
+        ))
+
+    process = psutil.Process()
+    # 연결과 히스토리 버퍼가 자리 잡을 때까지 기다린 뒤 측정을 시작합니다.
+    warmup = min(3.0, args.seconds / 3)
+    time.sleep(warmup)
+    rss_start = process.memory_info().rss
+    cpu_start = sum(process.cpu_times()[:2])
+    frames_start = receiver.frames
+    wall_start = time.monotonic()
+    time.sleep(args.seconds - warmup)
+    cpu = sum(process.cpu_times()[:2]) - cpu_start
+    wall = time.monotonic() - wall_start
+    frames = receiver.frames - frames_start
+    rss_growth = process.memory_info().rss - rss_start
+
+    children[0].wait()
+    for child in children[1:]:
+        child.terminate()
+        child.wait()
+    receiver.stop()
+
+    states = receiver.hosts()
+    expected = args.hosts + args.real_agents
+    min_frames = int(args.seconds * args.rate * 0.8)
+    missing = [state.name for state in states
+               if state.frames < (min_frames if state.name.startswith("sim-") else 1)]
+    results = {
+        "hosts": len(states),
+        "frames_per_second": frames / wall,
+        "receiver_cpu_share": cpu / wall,
+        "cpu_us_per_frame": cpu / frames * 1e6 if frames else None,
+        "history_bytes_per_host": states[0].history._buf.nbytes if states else 0,
+        "rss_growth_bytes": rss_growth,
+        "hosts_missing_frames": missing,
+    }
+    for name, value in results.items():
+        print(f"{name:24s} {value}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    failed = False
+    if len(states) != expected or missing:
+        print(f"FAIL: {expected} 개 호스트 중 {len(states) - len(missing)} 개만 정상 수신")
+        failed = True
+    if results["receiver_cpu_share"] > args.max_cpu:
+        print(f"FAIL: 수신기 CPU {results['receiver_cpu_share']:.2f} > {args.max_cpu}")
+        failed = True
+    if rss_growth > args.max_rss_growth:
+        print(f"FAIL: RSS 가 {rss_growth} 바이트 늘었습니다 (> {args.max_rss_growth})")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
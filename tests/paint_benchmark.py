@@ -0,0 +1,164 @@
+"""
+CircularProgressBar 와 PieChartSpinner 의 페인트 한 번 비용을 캐시 전/후로 비교합니다.
+
+    QT_QPA_PLATFORM=offscreen python tests/paint_benchmark.py --rings 48
+
+legacy 는 캐시 도입 전의 paintEvent(매번 QPen 생성, 배경 원 안티에일리어싱)를 그대로 옮긴 것이고,
+cached 는 현재 위젯입니다. 값이 매번 바뀌는 경우의 페인트당 비용과, 소수점 아래만 바뀌어
+페인트가 생략되는 경우의 실제 페인트 횟수를 출력합니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPainter, QPen
+from PyQt6.QtWidgets import QApplication, QGridLayout, QWidget
+
+from ui.custom_widgets import CircularProgressBar
+from ui.dashboard_app import PieChartSpinner
+
+class LegacyCircularProgressBar(QWidget):
+    """캐시 도입 전의 CircularProgressBar. 비교 기준으로만 사용합니다."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.used_percent = 0
+        self.bar_color = QColor("#00ffb4")
+        self.background_color = QColor("#334444")
+        self.setMinimumSize(80, 80)
+
+    def set_value(self, percent):
+        if percent == self.used_percent:
+            return
+        self.used_percent = percent
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen_width = 8
+        rect = self.rect().adjusted(pen_width, pen_width, -pen_width, -pen_width)
+        pen_bg = QPen(self.background_color, pen_width)
+        pen_bg.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen_bg)
+        painter.drawEllipse(rect)
+        pen_progress = QPen(self.bar_color, pen_width)
+        pen_progress.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen_progress)
+        painter.drawArc(rect, 90 * 16, -int(self.used_percent * 3.6 * 16))
+
+class LegacyPieChartSpinner(QWidget):
+    """캐시 도입 전의 PieChartSpinner 페인트."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(100, 100)
+        self.angle = 0
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(100, 100, 100), 8))
+        rect = self.rect().adjusted(10, 10, -10, -10)
+        painter.drawEllipse(rect)
+        painter.setPen(QPen(QColor("#00ffb4"), 8))
+        painter.drawArc(rect, 90 * 16, -self.angle * 16)
+
+def count_paints(widget_class):
+    """paintEvent 호출 횟수를 세는 하위 클래스를 만듭니다."""
+    class Counted(widget_class):
+        paints = 0
+
+        def paintEvent(self, event):
+            type(self).paints += 1
+            super().paintEvent(event)
+    return Counted
+
+def ring_grid(ring_class, count, size):
+    container = QWidget()
+    layout = QGridLayout(container)
+    columns = max(1, int(count ** 0.5))
+    rings = []
+    for i in range(count):
+        ring = ring_class()
+        ring.setFixedSize(size, size)
+        layout.addWidget(ring, i // columns, i % columns)
+        rings.append(ring)
+    container.show()
+    QApplication.processEvents()
+    return container, rings
+
+def bench_rings(app, ring_class, count, size, frames):
+    """모든 링의 값을 바꾸고 즉시 다시 그리는 것을 frames 번 반복해 링 하나의 페인트 비용을 구합니다."""
+    ring_class = count_paints(ring_class)
+    container, rings = ring_grid(ring_class, count, size)
+    samples = []
+    for frame in range(frames):
+        for i, ring in enumerate(rings):
+            ring.set_value((frame * 7 + i * 13) % 100 + 0.5)
+        start = time.perf_counter_ns()
+        container.repaint()
+        samples.append((time.perf_counter_ns() - start) / count)
+
+    # 정수 퍼센트는 그대로이고 소수점 아래만 바뀌는 갱신: 캐시 위젯은 다시 그리지 않아야 합니다.
+    ring_class.paints = 0
+    for frame in range(frames):
+        for ring in rings:
+            ring.set_value(int(ring.used_percent) + (frame % 9) / 10)
+        app.processEvents()
+    skipped_paints = ring_class.paints
+    container.close()
+    return {
+        "paint_p50_us": statistics.median(samples) / 1000,
+        "paint_mean_us": statistics.fmean(samples) / 1000,
+        "paints_on_fractional_updates": skipped_paints,
+    }
+
+def bench_spinner(spinner_class, frames):
+    spinner = spinner_class()
+    spinner.show()
+    QApplication.processEvents()
+    if hasattr(spinner, "timer"):
+        # 측정 중에는 타이머 대신 직접 각도를 바꿉니다.
+        spinner.timer.stop()
+    samples = []
+    for frame in range(frames):
+        spinner.angle = (frame * 6) % 360
+        start = time.perf_counter_ns()
+        spinner.repaint()
+        samples.append(time.perf_counter_ns() - start)
+    spinner.close()
+    return {"paint_p50_us": statistics.median(samples) / 1000, "paint_mean_us": statistics.fmean(samples) / 1000}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="원형 위젯 페인트 마이크로 벤치마크")
+    parser.add_argument("--rings", type=int, default=48, help="화면에 올릴 디스크 링 개수")
+    parser.add_argument("--size", type=int, default=60, help="링 크기 (px)")
+    parser.add_argument("--frames", type=int, default=200, help="측정 프레임 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results = {
+        "ring.legacy": bench_rings(app, LegacyCircularProgressBar, args.rings, args.size, args.frames),
+        "ring.cached": bench_rings(app, CircularProgressBar, args.rings, args.size, args.frames),
+        "spinner.legacy": bench_spinner(LegacyPieChartSpinner, args.frames),
+        "spinner.cached": bench_spinner(PieChartSpinner, args.frames),
+    }
+    for name, stats in results.items():
+        extra = ""
+        if "paints_on_fractional_updates" in stats:
+            extra = f"  paints on fractional updates {stats['paints_on_fractional_updates']:6d}"
+        print(f"{name:16s} p50 {stats['paint_p50_us']:8.2f}us  mean {stats['paint_mean_us']:8.2f}us{extra}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
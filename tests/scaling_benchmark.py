@@ -0,0 +1,145 @@
+"""
+코어/디스크/NIC 수를 늘려 가며 대시보드의 틱 시간, 페인트 시간, 메모리를 재고,
+규모에 대해 선형보다 빠르게 늘어나는 항목이 있으면 1 로 종료합니다.
+
+    QT_QPA_PLATFORM=offscreen python tests/scaling_benchmark.py
+    QT_QPA_PLATFORM=offscreen python tests/scaling_benchmark.py --scales 1 2 4 8 --pattern burst --output scaling.json
+
+배율 s 에서 코어 32s, 디스크 8s, NIC 4s 개(기본값, 8 배에서 256/64/32)의 SyntheticMonitor 로 DashboardApp 을 띄웁니다.
+각 배율은 새 프로세스에서 실행해 메모리가 서로 섞이지 않게 하고, 샘플러가 정적 정보로 디스크 위젯을 만든 뒤
+샘플러를 멈추고 같은 모니터의 Snapshot 을 직접 반영합니다.
+
+- sample: SyntheticMonitor.sample() 한 번 (수집 경로의 배열 처리 비용, 가상 값 생성 포함)
+- tick: update_all_data() 한 번
+- paint: 그 틱 뒤에 일어난 페인트 시간의 합 (TickProfiler 의 paint 구간이 잰 시간)
+- memory: pyqtgraph 까지 불러온 뒤부터 히스토리를 채운 뒤까지 늘어난 RSS
+
+각 항목은 틱마다 perf_counter_ns 로 잰 원시 값의 중앙값입니다. 판정은 이 중앙값을 배율에 대해
+로그-로그 직선으로 맞춘 기울기로 합니다. 기울기 1 이 선형이고, 고정 비용이 있으면 1 보다 작습니다. 기울기가 1 + tolerance 를 넘으면 선형보다 나쁜 것으로 봅니다.
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+METRICS = ("sample_ms", "tick_ms", "paint_ms", "memory_mb")
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import psutil
+import pyqtgraph
+from PyQt6.QtWidgets import QApplication
+from data.synthetic_monitor import SyntheticMonitor
+from ui.dashboard_app import DashboardApp
+from ui.profiler import TickProfiler
+
+app = QApplication(sys.argv[:1])
+process = psutil.Process()
+rss_before = process.memory_info().rss
+monitor = SyntheticMonitor(cores={cores}, disks={disks}, nics={nics}, pattern={pattern!r})
+dashboard = DashboardApp(monitor=monitor, fullscreen=False, process_limit=0)
+dashboard.resize(1080, 1920)
+dashboard.show()
+deadline = time.monotonic() + 30
+while not (dashboard.charts_ready and len(dashboard.disk_widgets) == {disks}):
+    if time.monotonic() > deadline:
+        raise SystemExit("dashboard did not initialize")
+    app.processEvents()
+    time.sleep(0.005)
+dashboard.sampler.stop()
+disk_ids = tuple(dashboard.disk_widgets)
+
+def tick():
+    dashboard.update_all_data(monitor.sample(disk_ids))
+    app.processEvents()
+
+profiler = dashboard.profiler
+profiler.enabled = True
+for _ in range(dashboard.max_history):
+    tick()
+rss_after = process.memory_info().rss
+paint = profiler.sections[TickProfiler.PAINT]
+samples, ticks, paints = [], [], []
+for _ in range({ticks}):
+    start = time.perf_counter_ns()
+    snapshot = monitor.sample(disk_ids)
+    sampled = time.perf_counter_ns()
+    dashboard.update_all_data(snapshot)
+    ticked = time.perf_counter_ns()
+    painted_before = paint.total_ns
+    app.processEvents()
+    samples.append(sampled - start)
+    ticks.append(ticked - sampled)
+    paints.append(paint.total_ns - painted_before)
+
+def median_ms(values):
+    values = sorted(values)
+    return values[len(values) // 2] / 1e6
+
+print(json.dumps({{
+    "sample_ms": median_ms(samples),
+    "tick_ms": median_ms(ticks),
+    "paint_ms": median_ms(paints),
+    "memory_mb": (rss_after - rss_before) / 1024 ** 2,
+}}), flush=True)
+dashboard.close()
+"""
+
+def measure_scale(scale, args):
+    dims = {"cores": args.cores * scale, "disks": args.disks * scale, "nics": args.nics * scale}
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(root=ROOT, pattern=args.pattern, ticks=args.ticks, **dims)],
+        capture_output=True, text=True, timeout=args.timeout, cwd=ROOT,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("{"):
+            return dict(dims, **json.loads(line))
+    raise RuntimeError(f"배율 {scale} 측정 결과를 읽지 못했습니다 (exit {result.returncode}):\n{result.stderr}")
+
+def loglog_slope(scales, values):
+    """log(value) 를 log(scale) 에 최소제곱으로 맞춘 기울기입니다."""
+    xs = [math.log(s) for s in scales]
+    ys = [math.log(max(v, 1e-9)) for v in values]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum((x - mean_x) ** 2 for x in xs)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="코어/디스크/NIC 수에 대한 대시보드 규모 확장성 검사")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8], help="기본 규모에 곱할 배율 목록")
+    parser.add_argument("--cores", type=int, default=32, help="배율 1 의 코어 수")
+    parser.add_argument("--disks", type=int, default=8, help="배율 1 의 디스크 수")
+    parser.add_argument("--nics", type=int, default=4, help="배율 1 의 NIC 수")
+    parser.add_argument("--pattern", default="sine", help="부하 패턴 (sine, burst, random_walk)")
+    parser.add_argument("--ticks", type=int, default=200, help="배율마다 측정할 틱 수")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 로그-로그 기울기 초과분 (1 + tolerance)")
+    parser.add_argument("--timeout", type=float, default=300.0, help="배율 하나의 제한 시간 (초)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+    if len(args.scales) < 2:
+        parser.error("--scales 는 두 개 이상이어야 합니다.")
+
+    rows = []
+    for scale in args.scales:
+        row = measure_scale(scale, args)
+        rows.append(row)
+        print(f"x{scale:<3d} {row['cores']:4d} cores {row['disks']:3d} disks {row['nics']:3d} nics  "
+              f"sample {row['sample_ms']:7.2f}ms  tick {row['tick_ms']:7.2f}ms  paint {row['paint_ms']:7.2f}ms  "
+              f"memory {row['memory_mb']:7.1f}MB")
+
+    limit = 1 + args.tolerance
+    slopes = {metric: loglog_slope(args.scales, [row[metric] for row in rows]) for metric in METRICS}
+    failed = [metric for metric, slope in slopes.items() if slope > limit]
+    for metric, slope in slopes.items():
+        print(f"{metric:10s} slope {slope:5.2f} (limit {limit:.2f}) -> {'SUPERLINEAR' if metric in failed else 'OK'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"scales": args.scales, "results": rows, "slopes": slopes, "limit": limit}, f, indent=2)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+대시보드의 첫 화면까지 걸린 시간(time-to-first-frame)을 새 프로세스에서 여러 번 재고,
+중앙값이 기준을 넘으면 1 로 종료합니다.
+
+    python tests/startup_regression.py
+    python tests/startup_regression.py --runs 5 --max-ms 300 --output startup.json
+
+매 측정은 모듈 캐시가 없는 새 인터프리터에서 실행하며, 시간은 main.py 와 같이
+첫 import 전에 기록한 시각부터 첫 페인트가 끝날 때까지입니다.
+화면이 없는 환경에서는 QT_QPA_PLATFORM=offscreen 으로 실행하면 됩니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import time
+STARTED_AT = time.perf_counter()
+import json, sys
+sys.path.insert(0, {root!r})
+from PyQt6.QtWidgets import QApplication
+from ui.dashboard_app import DashboardApp
+
+app = QApplication(sys.argv[:1])
+dashboard = DashboardApp(started_at=STARTED_AT)
+
+def done(ms):
+    print(json.dumps({{"time_to_first_frame_ms": ms}}), flush=True)
+    dashboard.close()
+    app.quit()
+
+dashboard.first_frame_shown.connect(done)
+sys.exit(app.exec())
+"""
+
+def measure_once(timeout):
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(root=ROOT)],
+        capture_output=True, text=True, timeout=timeout, cwd=ROOT,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("{"):
+            return json.loads(line)["time_to_first_frame_ms"]
+    raise RuntimeError(f"첫 화면 시간을 읽지 못했습니다 (exit {result.returncode}):\n{result.stderr}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="time-to-first-frame 회귀 검사")
+    parser.add_argument("--runs", type=int, default=3, help="측정 횟수 (중앙값으로 판정)")
+    parser.add_argument("--max-ms", type=float, default=300.0, help="허용하는 첫 화면 시간 중앙값 (ms)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="측정 한 번의 제한 시간 (초)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+
+    samples = []
+    for run in range(args.runs):
+        ms = measure_once(args.timeout)
+        samples.append(ms)
+        print(f"run {run + 1}: {ms:7.1f} ms")
+    median = statistics.median(samples)
+    passed = median <= args.max_ms
+    print(f"median {median:7.1f} ms (limit {args.max_ms:.0f} ms) -> {'OK' if passed else 'REGRESSION'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"samples_ms": samples, "median_ms": median, "max_ms": args.max_ms}, f, indent=2)
+    return 0 if passed else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
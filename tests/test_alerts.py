@@ -0,0 +1,120 @@
+"""
+경보 규칙 파서가 지표 이름과 집계를 올바르게 나누는지, AlertEngine 이 시각이 있는 스냅샷에서
+유지 시간과 집계 구간에 맞춰 규칙을 발생/해제하는지 확인합니다.
+
+    python -m pytest tests/test_alerts.py
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import FakeMonitor
+from data.alerts import METRICS, AlertEngine, Ewma, WindowMax, WindowMean, parse_rule
+from data.system_monitor import Snapshot
+
+@pytest.mark.parametrize("metric", sorted(METRICS))
+def test_every_metric_parses_to_itself(metric):
+    rule = parse_rule(f"{metric} > 90")
+    assert rule.metric == metric
+    assert rule.section == METRICS[metric][1]
+    assert rule.aggregate is None
+    assert rule.threshold == 90.0
+
+@pytest.mark.parametrize("metric", sorted(METRICS))
+@pytest.mark.parametrize("aggregate, kind", [("ewma", Ewma), ("mean", WindowMean), ("max", WindowMax)])
+def test_every_metric_parses_with_aggregate(metric, aggregate, kind):
+    rule = parse_rule(f"{metric.upper()} {aggregate} 10s >= 5MB/s for 2s")
+    assert rule.metric == metric
+    assert rule.section == METRICS[metric][1]
+    assert isinstance(rule.aggregate, kind)
+    assert rule.aggregate.span == 10.0
+    assert rule.threshold == 5 * 1024 ** 2
+    assert rule.hold == 2.0
+
+def test_cpu_max_is_the_per_core_metric_not_an_aggregate():
+    rule = parse_rule("cpu max > 90")
+    assert rule.metric == "cpu max"
+    assert rule.section == "cpu_cores"
+    assert rule.aggregate is None
+
+def test_cpu_with_max_aggregate_and_span():
+    rule = parse_rule("cpu max 10s > 90")
+    assert rule.metric == "cpu"
+    assert isinstance(rule.aggregate, WindowMax)
+    assert rule.aggregate.span == 10.0
+
+def test_disk_device_metric_and_command():
+    rule = parse_rule("disk C: max > 95% => echo full")
+    assert rule.metric == "disk C:"
+    assert rule.section == "disk_usage"
+    assert isinstance(rule.aggregate, WindowMax)
+    assert rule.command == "echo full"
+    assert rule.text == "disk C: max > 95%"
+
+@pytest.mark.parametrize("text", ["cpux > 5", "gpu > 5", "cpu >", "cpu max", "net sent > 50%",
+                                  "net recv ewma 10s > 5 %", "disk read > 5%", "disk write max > 1% for 2s"])
+def test_invalid_rules_raise_value_error(text):
+    with pytest.raises(ValueError):
+        parse_rule(text)
+
+BASE = FakeMonitor(cores=4).sample(("C:",))
+
+def snapshot(timestamp, **values):
+    """1초 간격 스냅샷입니다. 주지 않은 값은 BASE 를 그대로 씁니다."""
+    fields = {name: getattr(BASE, name) for name in Snapshot.__slots__}
+    fields.update(timestamp=float(timestamp), interval=1.0, **values)
+    return Snapshot(**fields)
+
+def run(rule_text, values, field="cpu_average"):
+    """
+    t=0, 1, 2, ... 초에 field 를 values 로 바꿔 가며 평가하고, 상태가 바뀐 순간만 (시각, 발생 여부) 로 돌려줍니다.
+    """
+    engine = AlertEngine([parse_rule(rule_text)])
+    events = []
+    for t, value in enumerate(values):
+        for rule in engine.evaluate(snapshot(t, **{field: value})):
+            events.append((t, rule.firing))
+    return events
+
+def test_rule_without_hold_fires_and_clears_immediately():
+    assert run("cpu avg > 50", [10, 60, 70, 40, 60]) == [(1, True), (3, False), (4, True)]
+
+def test_hold_requires_condition_for_the_whole_duration():
+    values = [60, 60, 60, 60, 60, 40, 60, 60, 40, 60, 60, 60, 60]
+    # 0초부터 참이면 3초에 발생하고 5초에 해제됩니다. 6~7초는 3초를 채우기 전에 거짓이 되어 발생하지 않습니다.
+    assert run("cpu avg > 50 for 3s", values) == [(3, True), (5, False), (12, True)]
+
+def test_ewma_follows_the_time_constant():
+    # 0 에서 100 으로 계단처럼 오르면 EWMA 는 100 * (1 - e^(-n/10)) 입니다.
+    # n >= 10 ln 2 ≈ 6.93 이어야 하므로 100 이 된 뒤 7번째 샘플(첫 샘플은 n=1)에서 50 을 넘습니다.
+    values = [0] * 5 + [100] * 10 + [0] * 10
+    events = run("cpu avg ewma 10s > 50", values)
+    assert events[0] == (5 + 6, True)
+    # 내려갈 때는 (10 샘플 뒤 값에서) 다시 50 아래로 떨어질 때 해제됩니다.
+    assert events[1][1] is False and 15 < events[1][0] < 25
+
+def test_window_mean_counts_only_samples_inside_the_span():
+    # 5초 구간 안의 샘플은 5개입니다. 100 이 3개가 되면 평균이 50 을 넘고, 0 이 3개가 되면 다시 내려갑니다.
+    values = [0] * 10 + [100] * 5 + [0] * 5
+    assert run("cpu avg mean 5s > 50", values) == [(12, True), (17, False)]
+
+def test_window_max_keeps_a_spike_for_the_span():
+    values = [0] * 10 + [100] + [0] * 10
+    assert run("cpu avg max 5s > 90", values) == [(10, True), (15, False)]
+
+def test_rate_metric_with_byte_unit_and_hold():
+    mb = 1024 ** 2
+    values = [1 * mb, 6 * mb, 6 * mb, 6 * mb, 4 * mb]
+    assert run("net sent > 5MB/s for 1s", values, field="sent_rate") == [(2, True), (4, False)]
+
+def test_missing_metric_value_keeps_rule_state():
+    engine = AlertEngine([parse_rule("disk C: > 90%")])
+    full = {"C:": (95, 100, 95.0)}
+    assert [rule.firing for rule in engine.evaluate(snapshot(0, disk_usage=full))] == [True]
+    # 디스크 값이 없는 틱은 해제하지도, 다시 발생시키지도 않습니다.
+    assert engine.evaluate(snapshot(1, disk_usage={})) == []
+    assert [rule.text for rule in engine.firing("disk_usage")] == ["disk C: > 90%"]
+    assert [rule.firing for rule in engine.evaluate(snapshot(2, disk_usage={"C:": (50, 100, 50.0)}))] == [False]
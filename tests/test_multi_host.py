@@ -0,0 +1,80 @@
+"""
+원격 호스트 상세 화면(DashboardApp + RemoteHostSource)이 키프레임마다 다시 오는 정적 정보에도
+위젯을 한 벌만 유지하는지 확인합니다.
+
+    QT_QPA_PLATFORM=offscreen python -m pytest tests/test_multi_host.py
+"""
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from benchmark import FakeMonitor
+from data.receiver import HostReceiver
+from data.remote_source import RemoteHostSource
+from data.snapshot_codec import FORMAT_VERSION, SnapshotEncoder
+from data.wire import encode_frame, encode_message
+from ui.dashboard_app import DashboardApp
+
+STATIC_INFO = {
+    "os": "OS | Test", "cpu": "CPU | Test", "gpu": "GPU | Test", "board": "Board | Test",
+    "disks": [{"name": "DISK - C:", "device_id": "C:"}],
+}
+
+def wait_for(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.01)
+    return True
+
+def test_drill_down_keeps_one_set_of_static_widgets_across_keyframes():
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    receiver = HostReceiver(host="127.0.0.1", port=0)
+    address = receiver.start()
+    sock = socket.create_connection(address, timeout=5.0)
+    sock.sendall(encode_message({"type": "hello", "host": "host", "format": FORMAT_VERSION}))
+    monitor = FakeMonitor(cores=4, disks=("C:", "D:"))
+    encoder = SnapshotEncoder(keyframe_interval=5)
+    dashboard = None
+    try:
+        sock.sendall(encode_frame(encoder.encode(monitor.sample(("C:",)), STATIC_INFO)))
+        assert wait_for(app, lambda: [status.frames for status in receiver.statuses()] == [1])
+
+        source = RemoteHostSource(receiver, "host")
+        notified = []
+        source.static_info_ready.connect(notified.append)
+        dashboard = DashboardApp(source=source, fullscreen=False, history_points=20)
+        dashboard.initialize_app()
+
+        # 키프레임(5, 10, 15번째 프레임)마다 같은 정적 정보가 다시 실려 옵니다.
+        for _ in range(15):
+            sock.sendall(encode_frame(encoder.encode(monitor.sample(("C:",)), STATIC_INFO)))
+        assert wait_for(app, lambda: len(dashboard.history) == 16)
+        assert notified == [STATIC_INFO]
+        assert dashboard.static_info_spinner is None
+        assert dashboard.system_info_layout.count() == 1 + 4
+        assert dashboard.disk_usage_layout.count() == 1 + 1
+        assert list(dashboard.disk_widgets) == ["C:"]
+
+        # 정적 정보가 실제로 바뀌면 라벨과 디스크 위젯을 바꿔 끼웁니다.
+        updated = dict(STATIC_INFO, disks=STATIC_INFO["disks"] + [{"name": "DISK - D:", "device_id": "D:"}])
+        for _ in range(3):
+            sock.sendall(encode_frame(encoder.encode(monitor.sample(("C:", "D:")), updated)))
+        assert wait_for(app, lambda: len(dashboard.history) == 19)
+        assert notified == [STATIC_INFO, updated]
+        assert dashboard.system_info_layout.count() == 1 + 4
+        assert dashboard.disk_usage_layout.count() == 1 + 2
+        assert list(dashboard.disk_widgets) == ["C:", "D:"]
+    finally:
+        if dashboard is not None:
+            dashboard.close()
+        sock.close()
+        receiver.stop()
@@ -0,0 +1,89 @@
+"""
+NetworkIdentityService 가 외부 IP 를 받아 오고, 갱신에 실패해도 마지막으로 받은 주소를 유지하는지
+로컬 HTTP 서버를 엔드포인트로 써서 확인합니다.
+
+    python -m pytest tests/test_network_identity.py
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication
+
+from data.network_identity import NetworkIdentityService
+
+class IpHandler(BaseHTTPRequestHandler):
+    """server.response 에 둔 (상태 코드, 본문) 으로 응답합니다. 테스트가 응답을 바꿔 가며 씁니다."""
+    def do_GET(self):
+        status, body = self.server.response
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), IpHandler)
+    server.response = (200, b'{"ip": "203.0.113.7"}')
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def make_service(server):
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    service = NetworkIdentityService(f"http://127.0.0.1:{server.server_address[1]}/ip", timeout_ms=2000)
+    emitted = []
+    service.identity_changed.connect(lambda internal_ip, external_ip: emitted.append(external_ip))
+    return app, service, emitted
+
+def fetch(app, service, emitted, timeout=5.0):
+    """외부 IP 를 한 번 조회하고 응답이 처리될 때까지 이벤트 루프를 돌린 뒤 보낸 값을 돌려줍니다."""
+    count = len(emitted)
+    service.refresh_external(force=True)
+    deadline = time.monotonic() + timeout
+    while len(emitted) == count:
+        assert time.monotonic() < deadline, "no reply from the local endpoint"
+        app.processEvents()
+        time.sleep(0.005)
+    return emitted[-1]
+
+def test_fetches_external_ip_and_keeps_it_when_refresh_fails(server):
+    app, service, emitted = make_service(server)
+    assert fetch(app, service, emitted) == "203.0.113.7"
+    assert service.last_external_ip == "203.0.113.7"
+    assert service.external_expires > time.monotonic()
+
+    # 서버 오류와 IP 가 아닌 응답은 실패로 보고 재시도를 미루지만, 표시는 마지막 주소를 유지합니다.
+    for response in ((503, b"unavailable"), (200, b'{"ip": "not an address"}')):
+        server.response = response
+        backoff = service.backoff_seconds
+        assert fetch(app, service, emitted) == "203.0.113.7"
+        assert service.retry_at > time.monotonic()
+        assert service.backoff_seconds == min(service.max_backoff_seconds, backoff * 2)
+
+    # 다시 성공하면 새 주소로 바뀌고 재시도 간격이 처음으로 돌아갑니다. 텍스트 응답도 받습니다.
+    server.response = (200, b"2001:db8::1\n")
+    assert fetch(app, service, emitted) == "2001:db8::1"
+    assert service.backoff_seconds == service.min_backoff_seconds
+    service.stop()
+
+def test_reports_failure_until_an_address_was_ever_fetched(server):
+    server.response = (500, b"")
+    app, service, emitted = make_service(server)
+    assert fetch(app, service, emitted) == "Failed to fetch"
+    assert service.last_external_ip is None
+    service.stop()
@@ -0,0 +1,55 @@
+"""
+SpanStats 의 히스토그램 백분위수가 알려진 분포에서 정해진 오차 안에 드는지 확인합니다.
+
+    python -m pytest tests/test_profiler.py
+"""
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.profiler import SpanStats
+
+# 하위 구간 폭이 값의 1/16 이하이므로 상대 오차 6.25% 이내여야 합니다.
+MAX_RELATIVE_ERROR = 1 / 16
+
+def recorded(values):
+    stats = SpanStats()
+    for value in values:
+        stats.record(int(value))
+    return stats
+
+@pytest.mark.parametrize("distribution", ["uniform", "lognormal", "bimodal"])
+def test_percentiles_within_stated_error(distribution):
+    rng = random.Random(7)
+    if distribution == "uniform":
+        values = [rng.randint(1_000_000, 80_000_000) for _ in range(20000)]
+    elif distribution == "lognormal":
+        values = [int(rng.lognormvariate(15, 1.2)) + 1 for _ in range(20000)]
+    else:
+        values = [rng.choice((rng.gauss(2e6, 1e5), rng.gauss(6e7, 3e6))) for _ in range(20000)]
+        values = [max(1, int(value)) for value in values]
+    stats = recorded(values)
+    for p in (1, 10, 50, 90, 95, 99, 99.9):
+        expected = np.percentile(values, p)
+        assert abs(stats.percentile_ns(p) - expected) <= expected * MAX_RELATIVE_ERROR, p
+
+def test_doubling_values_are_not_collapsed_to_powers_of_two():
+    # 8.39ms/16.78ms 처럼 2의 거듭제곱으로 뭉개지지 않아야 합니다.
+    for value in (10_000_000, 12_000_000, 15_000_000, 20_000_000, 30_000_000, 61_000_000):
+        stats = recorded([value] * 100)
+        assert abs(stats.percentile_ns(50) - value) <= value * MAX_RELATIVE_ERROR
+
+def test_small_values_are_exact_and_empty_is_zero():
+    assert SpanStats().percentile_ns(50) == 0
+    stats = recorded(range(10))
+    assert stats.percentile_ns(100) == 9
+    assert stats.percentile_ns(0) == 0
+
+def test_values_beyond_range_are_capped_by_max():
+    stats = recorded([1 << 45] * 10)
+    assert stats.percentile_ns(50) <= 1 << 45
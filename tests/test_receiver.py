@@ -0,0 +1,151 @@
+"""
+손상된 스냅샷 프레임이 HostReceiver 의 수신 스레드를 멈추지 않는지 확인합니다.
+
+    python -m pytest tests/test_receiver.py
+"""
+import os
+import random
+import socket
+import sys
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import FakeMonitor
+from data.history import HISTORY_COLUMNS
+from data.receiver import HostReceiver
+from data.snapshot_codec import FORMAT_VERSION, HEADER, SnapshotDecoder, SnapshotEncoder
+from data.wire import encode_frame, encode_message
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def connect(address, host_name):
+    sock = socket.create_connection(address, timeout=5.0)
+    sock.sendall(encode_message({"type": "hello", "host": host_name, "format": FORMAT_VERSION}))
+    return sock
+
+def frames(count, static_info=None):
+    monitor = FakeMonitor(cores=4)
+    encoder = SnapshotEncoder()
+    return [encoder.encode(monitor.sample(("C:",)), static_info) for _ in range(count)]
+
+def with_bad_process_index(frame):
+    """마지막 "새 이름" 항목의 순번을 프로세스 수(10)보다 크게 바꾼 프레임입니다."""
+    # 프레임 끝은 varint 순번 9 + varint 길이 9 + "process-9" 입니다.
+    assert frame.endswith(b"\x09\x09process-9")
+    start = len(frame) - len(b"process-9") - 2
+    return frame[:start] + b"\x7f" + frame[start + 1:]
+
+def corrupt_frames():
+    keyframe = frames(1, {"os": "OS | Test"})[0]
+    truncated_header = keyframe[:HEADER.size - 1]
+    bad_unicode = keyframe[:HEADER.size] + b"\x04\xff\xfe\xfd\xfc" + keyframe[HEADER.size:]
+    huge_count = keyframe[:HEADER.size] + b"\xff" * 12
+    not_object = bytearray(HEADER.pack(b"PCSN", FORMAT_VERSION, 0x03, 0)) + b"\x02[]"
+    return [with_bad_process_index(keyframe), truncated_header, bad_unicode, huge_count, bytes(not_object)]
+
+@pytest.mark.parametrize("frame", corrupt_frames())
+def test_decoder_rejects_corrupt_frame_with_value_error(frame):
+    with pytest.raises(ValueError):
+        SnapshotDecoder().decode(frame)
+
+def test_decoder_random_corruption_only_raises_value_error():
+    clean = frames(20, {"os": "OS | Test"})
+    rng = random.Random(1234)
+    for i in range(3000):
+        frame = bytearray(clean[i % len(clean)])
+        for _ in range(rng.randint(1, 8)):
+            frame[rng.randrange(HEADER.size, len(frame))] = rng.randrange(256)
+        decoder = SnapshotDecoder()
+        decoder.decode(clean[0])
+        try:
+            decoder.decode(bytes(frame))
+        except ValueError:
+            pass
+
+def test_bad_frame_drops_only_its_connection():
+    receiver = HostReceiver(host="127.0.0.1", port=0)
+    address = receiver.start()
+    good = connect(address, "good")
+    bad = connect(address, "bad")
+    try:
+        good_frames = frames(3)
+        good.sendall(encode_frame(good_frames[0]))
+        bad.sendall(encode_frame(with_bad_process_index(frames(1)[0])))
+
+        # 손상된 프레임을 보낸 연결만 끊깁니다.
+        bad.settimeout(5.0)
+        assert bad.recv(1) == b""
+        assert receiver.thread.is_alive()
+
+        # 다른 호스트는 계속 갱신됩니다.
+        for payload in good_frames[1:]:
+            good.sendall(encode_frame(payload))
+        assert wait_for(lambda: len(receiver.hosts()) == 2)
+        states = {state.name: state for state in receiver.hosts()}
+        assert wait_for(lambda: states["good"].frames == 3)
+        assert states["good"].connected
+        assert not states["bad"].connected
+
+        # 끊긴 호스트도 다시 연결하면 키프레임부터 받습니다.
+        bad.close()
+        bad = connect(address, "bad")
+        bad.sendall(encode_frame(frames(1)[0]))
+        assert wait_for(lambda: states["bad"].frames == 1)
+    finally:
+        good.close()
+        bad.close()
+        receiver.stop()
+
+def test_hello_that_is_not_an_object_drops_connection():
+    receiver = HostReceiver(host="127.0.0.1", port=0)
+    address = receiver.start()
+    sock = socket.create_connection(address, timeout=5.0)
+    try:
+        sock.sendall(encode_frame(b"[1, 2]"))
+        assert sock.recv(1) == b""
+        assert receiver.thread.is_alive()
+    finally:
+        sock.close()
+        receiver.stop()
+
+def test_statuses_and_history_rows_are_copies():
+    receiver = HostReceiver(host="127.0.0.1", port=0, history_points=4)
+    address = receiver.start()
+    sock = connect(address, "host")
+    try:
+        payloads = frames(6)
+        for payload in payloads[:3]:
+            sock.sendall(encode_frame(payload))
+        assert wait_for(lambda: [status.frames for status in receiver.statuses()] == [3])
+        status = receiver.statuses()[0]
+        rows = receiver.history_rows("host")
+        assert status.name == "host" and status.connected
+        assert rows.shape == (3, len(HISTORY_COLUMNS))
+        for i, name in enumerate(HISTORY_COLUMNS):
+            np.testing.assert_array_equal(rows[:, i], receiver.history("host", name))
+
+        # 수신 스레드가 이후 프레임을 받아도 이미 받은 복사본은 바뀌지 않습니다.
+        before = rows.copy()
+        for payload in payloads[3:]:
+            sock.sendall(encode_frame(payload))
+        assert wait_for(lambda: receiver.statuses()[0].frames == 6)
+        assert status.frames == 3
+        np.testing.assert_array_equal(rows, before)
+
+        # 히스토리는 history_points 개까지만 남고, count 를 주면 최근 행만 돌려줍니다.
+        assert receiver.history_rows("host").shape[0] == 4
+        latest = receiver.history_rows("host", 2)
+        np.testing.assert_array_equal(latest, receiver.history_rows("host")[-2:])
+    finally:
+        sock.close()
+        receiver.stop()
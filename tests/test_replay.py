@@ -0,0 +1,65 @@
+"""
+녹화 중간의 손상된 프레임에서 ReplaySource 가 멈추지 않고 재생을 끝내며 위치를 보고하는지 확인합니다.
+
+    python -m pytest tests/test_replay.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication
+
+from benchmark import FakeMonitor
+from data.recording import SnapshotRecorder
+from data.replay import ReplaySource
+
+def record(path, count):
+    monitor = FakeMonitor(cores=4)
+    recorder = SnapshotRecorder(path)
+    recorder.static_info = {"os": "OS | Test", "disks": []}
+    for _ in range(count):
+        recorder.write(monitor.sample(("C:",)))
+    recorder.close()
+
+def replay(path, timeout=5.0):
+    """최대 속도로 재생하고 (보낸 스냅샷 수, finished 로 받은 report) 를 돌려줍니다."""
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    source = ReplaySource(path, speed=0)
+    played = []
+    reports = []
+    source.connect(played.append)
+    source.finished.connect(reports.append)
+    source.start()
+    deadline = time.monotonic() + timeout
+    while not reports:
+        assert time.monotonic() < deadline, "replay stalled"
+        app.processEvents()
+        time.sleep(0.001)
+    assert not source.timer.isActive()
+    return len(played), reports[0]
+
+def test_corrupt_frame_ends_replay_with_its_position(tmp_path):
+    path = tmp_path / "corrupt.rec"
+    record(path, 6)
+    data = bytearray(path.read_bytes())
+    # 네 번째 프레임의 매직을 바꿉니다. 길이는 그대로이므로 끝이 잘린 녹화가 아니라 손상된 프레임입니다.
+    position = -1
+    for _ in range(4):
+        position = data.index(b"PCSN", position + 1)
+    data[position:position + 4] = b"XXXX"
+    path.write_bytes(bytes(data))
+
+    count, report = replay(str(path))
+    assert count == 3
+    assert report["frames_played"] == 3
+    assert report["error"].startswith("frame 4 ")
+
+def test_clean_recording_reports_no_error(tmp_path):
+    path = tmp_path / "clean.rec"
+    record(path, 6)
+    count, report = replay(str(path))
+    assert count == 6
+    assert report["error"] is None
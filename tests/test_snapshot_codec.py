@@ -0,0 +1,45 @@
+"""
+SnapshotDecoder 가 키프레임마다 다시 실려 오는 정적 정보를 바뀐 것으로 보지 않는지 확인합니다.
+
+    python -m pytest tests/test_snapshot_codec.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import FakeMonitor
+from data.snapshot_codec import FLAG_KEYFRAME, FLAG_STATIC, HEADER, SnapshotDecoder, SnapshotEncoder
+
+STATIC_INFO = {"os": "OS | Test", "disks": [{"device_id": "C:"}]}
+
+def flags(frame):
+    return HEADER.unpack_from(frame, 0)[2]
+
+def test_same_static_info_on_next_keyframe_is_not_a_change():
+    monitor = FakeMonitor(cores=4)
+    encoder = SnapshotEncoder(keyframe_interval=3)
+    decoder = SnapshotDecoder()
+    changes = []
+    for _ in range(7):
+        frame = encoder.encode(monitor.sample(("C:",)), STATIC_INFO)
+        decoder.decode(frame)
+        changes.append((bool(flags(frame) & FLAG_KEYFRAME), bool(flags(frame) & FLAG_STATIC), decoder.static_changed))
+
+    # 키프레임(0, 3, 6번째)마다 정적 정보가 실려 오지만 바뀐 것은 처음 한 번뿐입니다.
+    assert [keyframe for keyframe, _, _ in changes] == [True, False, False, True, False, False, True]
+    assert [static for _, static, _ in changes] == [True, False, False, True, False, False, True]
+    assert [changed for _, _, changed in changes] == [True, False, False, False, False, False, False]
+    assert decoder.static_info == STATIC_INFO
+
+def test_changed_static_info_is_reported_once():
+    monitor = FakeMonitor(cores=4)
+    encoder = SnapshotEncoder()
+    decoder = SnapshotDecoder()
+    decoder.decode(encoder.encode(monitor.sample(("C:",)), STATIC_INFO))
+    updated = dict(STATIC_INFO, os="OS | Updated")
+    decoder.decode(encoder.encode(monitor.sample(("C:",)), updated))
+    assert decoder.static_changed
+    assert decoder.static_info == updated
+    decoder.decode(encoder.encode(monitor.sample(("C:",)), updated))
+    assert not decoder.static_changed
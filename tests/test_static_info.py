@@ -0,0 +1,39 @@
+"""
+LinuxStaticInfo 가 mountinfo 에서 실제 블록 장치 마운트만 골라내는지 확인합니다.
+
+    python -m pytest tests/test_static_info.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.static_info import LinuxStaticInfo
+
+# Fedora 기본 설치처럼 루트와 /home 이 같은 btrfs 의 서브볼륨이고 /boot 만 ext4 인 경우입니다.
+MOUNTINFO = """\
+22 98 0:21 / /proc rw,nosuid,nodev,noexec,relatime shared:13 - proc proc rw
+23 98 0:22 / /sys rw,nosuid,nodev,noexec,relatime shared:2 - sysfs sysfs rw,seclabel
+25 98 0:5 / /dev rw,nosuid shared:9 - devtmpfs devtmpfs rw,seclabel,size=4096k,mode=755
+98 1 0:34 /root / rw,relatime shared:1 - btrfs /dev/nvme0n1p3 rw,seclabel,compress=zstd:1,ssd,subvol=/root
+99 98 0:34 /home /home rw,relatime shared:60 - btrfs /dev/nvme0n1p3 rw,seclabel,compress=zstd:1,ssd,subvol=/home
+100 98 259:2 / /boot rw,relatime shared:62 - ext4 /dev/nvme0n1p2 rw,seclabel
+101 98 0:38 / /tmp rw,nosuid,nodev shared:63 - tmpfs tmpfs rw,seclabel,size=8097580k
+102 98 0:39 / /var/lib/containers/overlay rw,relatime - overlay overlay rw,lowerdir=/a,upperdir=/b,workdir=/c
+103 98 0:40 / /mnt/USB\\040Drive rw,relatime shared:70 - btrfs /dev/sda1 rw,space_cache=v2
+104 98 0:41 / /mnt/gone rw,relatime shared:71 - btrfs /dev/sdz1 rw
+"""
+
+class FakeLinuxStaticInfo(LinuxStaticInfo):
+    BLOCK_DEVICES = {"/dev/nvme0n1p3": "259:3", "/dev/nvme0n1p2": "259:2", "/dev/sda1": "8:1"}
+
+    def _block_dev_number(self, path):
+        return self.BLOCK_DEVICES.get(path, "")
+
+def test_btrfs_root_resolves_to_its_block_device():
+    devices = FakeLinuxStaticInfo().mounted_devices(MOUNTINFO)
+    # 가상 파일시스템은 빠지고, 같은 btrfs 의 두 번째 서브볼륨(/home)과 장치를 찾을 수 없는 마운트도 빠집니다.
+    assert devices == [("259:3", "/"), ("259:2", "/boot"), ("8:1", "/mnt/USB Drive")]
+
+def test_malformed_lines_are_skipped():
+    assert FakeLinuxStaticInfo().mounted_devices("\n1 2 0:3\n98 1 259:3 / / rw - ext4\n") == []
@@ -0,0 +1,60 @@
+class WidgetBinder:
+    """
+    위젯에 마지막으로 반영한 값을 기억해 두고, 값이 바뀐 위젯만 갱신하는 얇은 바인딩 계층입니다.
+
+    한 틱은 begin_tick() 과 end_tick() 사이의 호출로 구분하며,
+    틱마다 실제로 갱신한 위젯 수와 건너뛴 위젯 수를 last_updated / last_skipped 에 남깁니다.
+    """
+    def __init__(self):
+        self._last = {}
+        self.updated = 0
+        self.skipped = 0
+        self.last_updated = 0
+        self.last_skipped = 0
+        self.total_skipped = 0
+
+    def begin_tick(self):
+        self.updated = 0
+        self.skipped = 0
+
+    def end_tick(self):
+        self.last_updated = self.updated
+        self.last_skipped = self.skipped
+        self.total_skipped += self.skipped
+
+    def changed(self, key, value):
+        """key 의 값이 지난번과 다르면 기억해 두고 True 를 반환합니다."""
+        if self._last.get(key, _MISSING) == value:
+            self.skipped += 1
+            return False
+        self._last[key] = value
+        self.updated += 1
+        return True
+
+    def set_text(self, label, text):
+        """QLabel 등 setText 를 가진 위젯에 텍스트가 바뀐 경우에만 반영합니다."""
+        if self.changed(label, text):
+            label.setText(text)
+
+    def set_value(self, widget, value):
+        """
+        QProgressBar 나 CircularProgressBar 처럼 값을 표시하는 위젯에 값이 바뀐 경우에만 반영합니다.
+        """
+        if self.changed(widget, value):
+            if hasattr(widget, "set_value"):
+                widget.set_value(value)
+            else:
+                widget.setValue(value)
+
+    def forget(self, widget):
+        """위젯이 제거될 때 기억해 둔 값을 지웁니다."""
+        self._last.pop(widget, None)
+
+    def stats(self):
+        return {
+            "updated": self.last_updated,
+            "skipped": self.last_skipped,
+            "total_skipped": self.total_skipped,
+        }
+
+_MISSING = object()
@@ -1,37 +1,111 @@
+import numpy as np
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QPen, QColor
-from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QPainter, QPen, QColor, QPixmap, QPolygonF
+from PyQt6.QtCore import Qt, QPointF, QRectF
+
+# (크기, 배율, 색, 두께, 여백) → 배경 링 QPixmap. 같은 크기의 링 수십 개가 하나의 픽스맵을 공유합니다.
+_RING_CACHE = {}
+# 창 크기를 계속 바꾸는 경우에도 캐시가 한없이 커지지 않도록 하는 상한
+_RING_CACHE_LIMIT = 64
+
+def ring_pixmap(size, device_pixel_ratio, color, pen_width, inset):
+    """
+    위젯 크기의 투명 픽스맵에 안티에일리어싱된 원 테두리를 한 번만 그려 캐시합니다.
+    device_pixel_ratio 만큼 큰 해상도로 그리므로 고해상도 화면에서도 흐려지지 않습니다.
+    """
+    key = (size.width(), size.height(), device_pixel_ratio, color.rgba(), pen_width, inset)
+    pixmap = _RING_CACHE.get(key)
+    if pixmap is None:
+        if len(_RING_CACHE) >= _RING_CACHE_LIMIT:
+            _RING_CACHE.clear()
+        pixmap = QPixmap(round(size.width() * device_pixel_ratio), round(size.height() * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(color, pen_width))
+        painter.drawEllipse(ring_rect(size, inset))
+        painter.end()
+        _RING_CACHE[key] = pixmap
+    return pixmap
+
+def ring_rect(size, inset):
+    return QRectF(inset, inset, size.width() - 2 * inset, size.height() - 2 * inset)
 
 class CircularProgressBar(QWidget):
+    """
+    원형 진행률 바입니다. 배경 링은 캐시된 픽스맵을 그대로 복사하고 진행 호만 새로 그리며,
+    표시되는 정수 퍼센트가 바뀌지 않으면 다시 그리지 않습니다.
+    """
+    PEN_WIDTH = 8
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.used_percent = 0
+        self.display_percent = 0
         self.bar_color = QColor("#00ffb4")
         self.background_color = QColor("#334444")
         self.text_color = QColor("#ffffff")
+        self.progress_pen = QPen(self.bar_color, self.PEN_WIDTH)
+        self.progress_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
         self.setMinimumSize(80, 80)
-        
+
     def set_value(self, percent):
         self.used_percent = percent
-        self.repaint()
+        display_percent = int(percent)
+        if display_percent == self.display_percent:
+            return
+        self.display_percent = display_percent
+        # repaint() 는 즉시 그리므로, update() 로 Qt 의 paint 병합에 맡깁니다.
+        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        pen_width = 8
-        rect = self.rect().adjusted(pen_width, pen_width, -pen_width, -pen_width)
-        
-        pen_bg = QPen(self.background_color, pen_width)
-        pen_bg.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen_bg)
-        painter.drawEllipse(rect)
-        
-        pen_progress = QPen(self.bar_color, pen_width)
-        pen_progress.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen_progress)
+        size = self.size()
+        painter.drawPixmap(
+            0, 0,
+            ring_pixmap(size, self.devicePixelRatioF(), self.background_color, self.PEN_WIDTH, self.PEN_WIDTH),
+        )
+        if self.display_percent <= 0:
+            return
 
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.progress_pen)
         start_angle = 90 * 16
-        span_angle = -int(self.used_percent * 3.6 * 16)
+        span_angle = -int(self.display_percent * 3.6 * 16)
+        painter.drawArc(ring_rect(size, self.PEN_WIDTH), start_angle, span_angle)
+
+class Sparkline(QWidget):
+    """
+    장치 줄에 쓰는 가벼운 스파크라인입니다. PlotWidget 과 달리 줄마다 그래프 장면과 뷰박스를 두지 않고
+    QPainter 로 꺾은선만 그리므로, 장치가 수십 개여도 줄 하나의 비용은 점 수에만 비례합니다.
+    모든 계열은 0 부터 계열 전체의 최대값까지 같은 눈금을 씁니다.
+    """
+    def __init__(self, colors, height=30, parent=None):
+        super().__init__(parent)
+        self.pens = [QPen(QColor(color), 1) for color in colors]
+        self.background_color = QColor("#2b2b2b")
+        self.series = ()
+        self.setFixedHeight(height)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def set_data(self, *series):
+        """계열마다 1차원 배열 하나를 받습니다. 다음 페인트에서 그립니다."""
+        self.series = series
+        self.update()
 
-        painter.drawArc(rect, start_angle, span_angle)
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.background_color)
+        if not self.series or len(self.series[0]) < 2:
+            return
+        top = max(float(np.max(values)) for values in self.series)
+        if top <= 0:
+            top = 1.0
+        width, height = self.width() - 1, self.height() - 2
+        xs = np.linspace(0.0, width, len(self.series[0])).tolist()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for pen, values in zip(self.pens, self.series):
+            ys = (height + 1 - np.asarray(values, dtype=np.float64) * (height / top)).tolist()
+            painter.setPen(pen)
+            painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)]))
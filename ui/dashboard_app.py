@@ -1,121 +1,188 @@
 import sys
-import threading
+import time
+import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QSizePolicy, QFrame,
-    QProgressBar, QStackedWidget
+    QProgressBar, QStackedWidget, QGridLayout
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QPainter, QColor, QPen
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSignal
+from PyQt6.QtGui import QFont, QPainter, QColor, QPen, QKeySequence, QShortcut
 
-import pyqtgraph as pg
+from ui.custom_widgets import CircularProgressBar, Sparkline, ring_pixmap, ring_rect
+from ui.bindings import WidgetBinder
+from ui.profiler import PerfHud, TickProfiler
+from utils.helpers import format_bytes, format_network_speed, format_uptime
+from data.sampler import BackgroundSampler
+from data.history import HISTORY_COLUMNS, HistoryBuffer, history_row
+from data.rollup import RollupStore
+from data.percentiles import DEFAULT_WINDOWS, PERCENT_COLUMNS, WINDOW_NAMES
+from data.downsample import minmax_downsample
+from data.network_identity import DEFAULT_EXTERNAL_IP_ENDPOINT, NetworkIdentityService
 
-from ui.custom_widgets import CircularProgressBar
-from utils.helpers import format_bytes, format_network_speed
-from data.system_monitor import SystemMonitor
+# 섹션 프레임의 기본 스타일과, 경보 규칙이 발생했을 때 프레임 테두리만 붉게 바꾸는 스타일
+SECTION_STYLE = "border: 1px dashed #666666;"
+ALERT_SECTION_STYLE = "* { border: 1px dashed #666666; } #section { border: 2px solid #ff4040; }"
+
+# pyqtgraph 는 불러오는 데 수백 ms 가 걸리므로 첫 화면이 그려진 뒤 _load_pyqtgraph() 로 불러옵니다.
+pg = None
+
+def _load_pyqtgraph():
+    global pg
+    if pg is None:
+        import pyqtgraph
+        pg = pyqtgraph
+    return pg
 
 class PieChartSpinner(QWidget):
     """
-    로딩 화면을 위한 파이 차트 스피너 위젯입니다.
+    정적 정보를 읽는 동안 보여 주는 파이 차트 스피너 위젯입니다.
+    화면에 보이는 동안에만 타이머가 돕니다.
     """
+    RING_COLOR = QColor(100, 100, 100)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(100, 100)
         self.angle = 0
         self.timer = QTimer(self)
+        self.timer.setInterval(30) # 30ms 마다 6도씩, 초당 200도 회전
         self.timer.timeout.connect(self.update_angle)
-        self.timer.start(10) # 10ms 마다 업데이트
+        self.arc_pen = QPen(QColor("#00ffb4"), 8)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
     
     def update_angle(self):
-        self.angle = (self.angle + 2) % 360 # 360도까지 2도씩 증가
+        self.angle = (self.angle + 6) % 360 # 360도까지 6도씩 증가
         self.update() # paintEvent 호출
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # 배경 원 그리기
-        painter.setPen(QPen(QColor(100, 100, 100), 8))
-        rect = self.rect().adjusted(10, 10, -10, -10)
-        painter.drawEllipse(rect)
+        # 배경 원은 캐시된 픽스맵을 복사합니다.
+        painter.drawPixmap(0, 0, ring_pixmap(self.size(), self.devicePixelRatioF(), self.RING_COLOR, 8, 10))
         
         # 파이 조각 그리기
-        painter.setPen(QPen(QColor("#00ffb4"), 8))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.arc_pen)
         # 0도에서 시작하여 self.angle만큼 그리기
-        painter.drawArc(rect, 90 * 16, -self.angle * 16) # 각도는 16으로 곱해야 함
-
-class LoadingScreen(QWidget):
-    """
-    애플리케이션 시작 시 표시되는 로딩 화면입니다.
-    파이 차트 스피너 애니메이션을 포함합니다.
-    """
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setStyleSheet("background-color: #2b2b2b; color: white;")
-        
-        main_layout = QVBoxLayout(self)
-        main_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # 파이 차트 스피너 위젯 추가
-        self.spinner = PieChartSpinner(self)
-        main_layout.addWidget(self.spinner, alignment=Qt.AlignmentFlag.AlignCenter)
-        
-        loading_label = QLabel("로딩 중...", self)
-        loading_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-        loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        main_layout.addWidget(loading_label)
+        painter.drawArc(ring_rect(self.size(), 10), 90 * 16, -self.angle * 16) # 각도는 16으로 곱해야 함
 
 class DashboardApp(QStackedWidget):
     """
-    로딩 화면과 메인 대시보드 화면을 관리하는 주 애플리케이션 클래스입니다.
+    메인 대시보드 화면을 관리하는 주 애플리케이션 클래스입니다.
+    위젯을 만들자마자 화면을 띄우고, 정적 정보와 그래프는 준비되는 대로 채워 넣습니다.
     """
-    def __init__(self):
+    # QStackedWidget 초기화 중에도 event() 가 호출되므로 클래스 기본값을 둡니다.
+    first_frame_shown = pyqtSignal(float)
+
+    profiler = None
+    sampler = None
+    sampler_slowdown = 1.0
+    watched_window = None
+    HIDDEN_SLOWDOWN = 8.0
+    # 레이아웃 전이라 그래프 폭을 모를 때 쓰는 픽셀 폭
+    DEFAULT_CHART_WIDTH = 800
+
+    def __init__(self, sample_interval_ms=1000, display_interval_ms=1000, history_path=None,
+                 history_window_seconds=None, ip_endpoint=DEFAULT_EXTERNAL_IP_ENDPOINT, process_limit=8,
+                 started_at=None, history_points=100, source=None, fullscreen=True, record_path=None,
+                 monitor=None, alert_rules=()):
         super().__init__()
         self.setWindowTitle("PC Dashboard")
         self.setStyleSheet("background-color: rgba(43, 43, 43, 191); color: white; padding: 10px;")
 
-        # 시스템 모니터링 클래스 인스턴스 생성
-        self.monitor = SystemMonitor()
-        
-        # 로딩 화면 위젯 생성 및 추가
-        self.loading_screen = LoadingScreen()
-        self.addWidget(self.loading_screen)
-        
-        # 메인 대시보드 위젯 생성
+        # 시스템 모니터링은 백그라운드 샘플러가 전담합니다.
+        # sample_interval_ms 를 50~100ms 로 낮추면 1초 평균에 묻히는 짧은 I/O 버스트도 잡을 수 있습니다.
+        # history_path 를 지정하면 히스토리를 링 파일에 남겨 재시작 후에도 이어서 보여 줍니다.
+        # process_limit 개의 상위 프로세스도 샘플러 스레드에서 함께 수집합니다. (0 이면 패널을 숨깁니다)
+        # source 를 넘기면 로컬 수집 대신 그 소스(원격 호스트, 녹화 재생)의 스냅샷을 보여 줍니다.
+        # record_path 를 지정하면 로컬에서 수집한 스냅샷을 재생용 녹화 파일로도 남깁니다.
+        # monitor 를 넘기면 로컬 수집에 SystemMonitor 대신 그 모니터(예: SyntheticMonitor)를 씁니다.
+        self.process_limit = process_limit
+        self.local = source is None
+        if self.local:
+            self.sampler = BackgroundSampler(sample_interval_ms, display_interval_ms, history_path,
+                                             process_limit=process_limit, record_path=record_path,
+                                             monitor=monitor)
+        else:
+            self.sampler = source
+        self.sampler.connect(self.update_all_data)
+
+        # history_window_seconds 를 지정하면 그래프가 원시 히스토리 대신 집계 계층(1s/10s/1min/1h)에서
+        # 해당 기간을 골라 그립니다. (예: 86400 이면 최근 하루)
+        self.history_window_seconds = history_window_seconds
+        # 메모리에 둘 원시 히스토리 점 수. 그래프는 픽셀 폭으로 줄여 그리므로 크게 잡아도 그리는 비용은 같습니다.
+        self.history_points = history_points
+
+        # 내부/외부 IP 는 비동기 서비스가 조회하고 시그널로 알려 줍니다.
+        self.network_identity = NetworkIdentityService(ip_endpoint, parent=self)
+        self.network_identity.identity_changed.connect(self.update_ip_label)
+
+        # 값이 바뀐 위젯만 갱신하기 위한 바인딩 계층
+        self.binder = WidgetBinder()
+
+        # 스냅샷마다 평가하는 경보 규칙 (data/alerts.py). 발생한 규칙의 섹션 프레임을 강조합니다.
+        # 규칙이 없으면 모듈(정규식 컴파일, subprocess)을 불러오지 않아 시작 시간에 더하지 않습니다.
+        self.alerts = None
+        if alert_rules:
+            from data.alerts import AlertEngine
+            self.alerts = AlertEngine(alert_rules)
+
+        # 섹션별 틱 프로파일러. F12 로 성능 HUD 를 켜고 끄며, Ctrl+Shift+P 로 JSON 을 저장합니다.
+        self.profiler = TickProfiler()
+        self.perf_hud = PerfHud(self.profiler, self)
+        QShortcut(QKeySequence("F12"), self, activated=self.perf_hud.toggle)
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self.export_profile)
+        # 값 옆의 p50/p95/p99 창(5분/1시간/24시간)은 F10 으로 바꿉니다.
+        QShortcut(QKeySequence("F10"), self, activated=self.cycle_percentile_window)
+        
+        # 첫 화면까지 걸린 시간. started_at 은 프로세스 시작 시각(perf_counter)으로, 없으면 생성 시각을 씁니다.
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.time_to_first_frame_ms = None
+
+        # 정적 정보와 디스크 목록은 샘플러 스레드가 읽어 시그널로 보내 줍니다.
+        self.sampler.connect_static_info(self.apply_static_info)
+        self.sampler.connect_percentiles(self.update_percentiles)
+
+        # 메인 대시보드 위젯 생성. 라벨과 프레임만 먼저 만들고 그래프는 첫 화면 이후에 붙입니다.
         self.main_dashboard_widget = QWidget()
         self.setup_main_ui()
         self.addWidget(self.main_dashboard_widget)
         
         # 모니터 선택 기능은 화면이 보여지기 전에 호출되어야 합니다.
-        self.show_on_specific_monitor(target="ZeroMOD")
+        if fullscreen:
+            self.show_on_specific_monitor(target="ZeroMOD")
 
-        # 초기 화면을 로딩 화면으로 설정
-        self.setCurrentIndex(0)
-
-        # 초기 데이터 로드를 위한 타이머 설정 (여기서는 메인 화면을 보여주기 전 로딩 시간)
-        QTimer.singleShot(2000, self.initialize_app)
+        # 나머지 초기화는 첫 화면을 그린 직후에 진행합니다. 창이 가려진 채 시작해
+        # 페인트가 일어나지 않는 경우를 위해 일정 시간 뒤에도 한 번 시도합니다.
+        self.app_initialized = False
+        QTimer.singleShot(500, self.initialize_app)
         
         # 전체 화면으로 표시
-        self.showFullScreen()
+        if fullscreen:
+            self.showFullScreen()
         
     def initialize_app(self):
         """
-        초기 설정을 완료하고 메인 대시보드로 전환하는 함수입니다.
+        첫 화면이 뜬 뒤 수집을 시작하고 그래프를 붙입니다.
         """
-        # 로딩 화면의 타이머를 멈춥니다.
-        self.loading_screen.spinner.timer.stop()
-
-        # 정적 시스템 정보 초기 로드
-        self.get_static_system_info()
-        threading.Thread(target=self.get_external_ip).start()
-        
-        # 데이터 업데이트를 위한 타이머 설정
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_all_data)
-        self.update_timer.start(1000)
-        
-        # 로딩이 끝난 후 바로 메인 대시보드로 전환합니다.
-        self.setCurrentIndex(1)
+        if self.app_initialized:
+            return
+        self.app_initialized = True
+        # 데이터 수집은 샘플러 스레드에서, UI 반영은 update_all_data 에서 처리합니다.
+        # 샘플러가 정적 정보를 읽는 동안 GUI 스레드는 그래프를 준비합니다.
+        self.sampler.start()
+        if self.local:
+            self.network_identity.start()
+        else:
+            self.update_ip_label(*self.sampler.describe())
+        self.setup_charts()
         
     def setup_main_ui(self):
         """
@@ -127,18 +194,36 @@ class DashboardApp(QStackedWidget):
         self.title_font.setBold(True)
         self.content_font = QFont("Arial", 16)
         
-        # 초기 데이터 로드를 위한 변수 설정
-        self.sent_data = []
-        self.received_data = []
-        self.cpu_data = []
-        self.ram_data = []
-        self.disk_read_data = []
-        self.disk_write_data = []
-        self.max_history = 100
-        
+        # 그래프 히스토리는 고정 크기 링 버퍼에 열 단위로 저장합니다.
+        self.max_history = self.history_points
+        self.history = HistoryBuffer(HISTORY_COLUMNS, capacity=self.max_history)
+        self.rollups = RollupStore(HISTORY_COLUMNS) if self.history_window_seconds else None
+        # 지표별 최근 5분/1시간/24시간 p50/p95/p99. 분포는 샘플러(또는 원격/재생 소스)가 매 샘플 갱신하고
+        # 화면에는 창별로 완성된 값({창 길이: {열 이름: (p50, p95, p99)}})만 넘어옵니다.
+        self.percentile_summary = {}
+        self.percentile_window = DEFAULT_WINDOWS[0][0]
+        self.percentile_labels = {}
+        # 소스가 이미 가진 히스토리(로컬 링 파일, 원격 호스트의 수신기 버퍼)로 그래프를 먼저 채웁니다.
+        # 그래프에 들어갈 만큼만 읽습니다. (원시 히스토리는 마지막 max_history 개, 집계 계층은 표시 기간)
+        rows = self.sampler.history_rows(self.max_history)
+        if rows is not None:
+            self.history.extend(rows)
+        if self.sampler.ring_file is not None and self.rollups is not None:
+            timestamps, rows = self.sampler.ring_file.since(time.time() - self.history_window_seconds)
+            self.rollups.load(timestamps, rows)
+        
+        # 그래프는 pyqtgraph 를 불러온 뒤 setup_charts 에서 이 자리에 붙입니다.
+        self.pending_charts = []
+        self.charts_ready = False
+
         # UI 섹션 프레임 생성
         self.system_info_frame, system_info_layout = self.create_section_frame("System Information")
         self.system_info_layout = system_info_layout
+        self.static_info_spinner = PieChartSpinner()
+        system_info_layout.addWidget(self.static_info_spinner, alignment=Qt.AlignmentFlag.AlignCenter)
+        # 정적 정보로 만든 라벨과 디스크 위젯. 정적 정보가 바뀌면 지우고 새로 만듭니다.
+        self.static_info = None
+        self.static_info_widgets = []
         main_layout.addWidget(self.system_info_frame, stretch=2)
         
         self.uptime_frame, uptime_layout = self.create_section_frame("Uptime")
@@ -153,22 +238,18 @@ class DashboardApp(QStackedWidget):
         main_layout.addWidget(self.disk_usage_frame, stretch=2)
 
         self.cpu_cores_frame, cpu_cores_layout = self.create_section_frame("CPU Core Usage")
+        # 코어별 히스토리 (코어 × 시간). 코어 수는 첫 스냅샷에서 정해집니다.
         self.num_cores = 0
-        
-        self.core_graph_widget = pg.PlotWidget()
-        self.core_graph_widget.setBackground("#2b2b2b")
-        self.core_graph_widget.showGrid(x=False, y=True)
-        self.core_graph_widget.setYRange(0, 100)
-        self.core_graph_widget.setMinimumHeight(150)
-        self.core_graph_widget.hideAxis('bottom')
-        self.core_graph_widget.hideAxis('left')
-        
-        self.core_bar_graph_item = pg.BarGraphItem(x=[], height=[], width=0.8, brush='#ffff00')
-        self.core_graph_widget.addItem(self.core_bar_graph_item)
-        
-        cpu_cores_layout.addWidget(self.core_graph_widget)
+        self.core_history = None
+        self.defer_chart(cpu_cores_layout, self.build_core_chart)
         main_layout.addWidget(self.cpu_cores_frame, stretch=1)
 
+        self.process_rows = []
+        if self.process_limit > 0:
+            self.processes_frame, processes_layout = self.create_section_frame("Top Processes")
+            self.create_process_table(processes_layout)
+            main_layout.addWidget(self.processes_frame, stretch=2)
+
         self.disk_io_frame, disk_io_layout = self.create_section_frame("Disk I/O")
         self.create_disk_io_widget("DISK READ", disk_io_layout, "read")
         self.create_disk_io_widget("DISK WRITE", disk_io_layout, "write")
@@ -188,33 +269,127 @@ class DashboardApp(QStackedWidget):
         self.create_network_widget("↓", network_layout, "received")
         main_layout.addWidget(self.network_frame, stretch=2)
 
-    def get_static_system_info(self):
-        """SystemMonitor 클래스에서 정적 정보를 가져와 UI에 표시합니다."""
-        info = self.monitor.get_static_system_info()
-        if info:
-            self.system_info_layout.addWidget(QLabel(info["os"], font=self.content_font))
-            self.system_info_layout.addWidget(QLabel(info["cpu"], font=self.content_font))
-            self.system_info_layout.addWidget(QLabel(info["gpu"], font=self.content_font))
-            self.system_info_layout.addWidget(QLabel(info["board"], font=self.content_font))
-            
+        # NIC/디스크별 처리량. 장치가 추가되거나 빠지면 해당 줄만 만들거나 지웁니다.
+        self.devices_frame, devices_layout = self.create_section_frame("Devices")
+        self.devices_layout = devices_layout
+        self.device_rows = {}
+        main_layout.addWidget(self.devices_frame, stretch=2)
+
+        # 경보 규칙의 section 이름 → 강조할 프레임
+        self.section_frames = {
+            "cpu_cores": self.cpu_cores_frame,
+            "cpu_mem": self.cpu_mem_frame,
+            "disk_usage": self.disk_usage_frame,
+            "disk_io": self.disk_io_frame,
+            "network": self.network_frame,
+        }
+
+    def defer_chart(self, layout, build, stretch=1):
+        """
+        그래프 자리를 layout 의 현재 위치에 예약합니다. build() 는 setup_charts 에서 호출되어
+        그래프 위젯을 반환하고, 위젯은 예약한 위치에 들어갑니다.
+        """
+        self.pending_charts.append((layout, layout.count(), build, stretch))
+
+    def setup_charts(self):
+        """
+        pyqtgraph 를 불러와 예약된 그래프를 만듭니다. 불러오는 데 수백 ms 가 걸리므로
+        첫 화면이 그려진 뒤에 호출합니다.
+        """
+        if self.charts_ready:
+            return
+        _load_pyqtgraph()
+        # 뒤에서부터 끼워 넣어야 같은 layout 안의 앞선 예약 위치가 밀리지 않습니다.
+        for layout, index, build, stretch in reversed(self.pending_charts):
+            layout.insertWidget(index, build(), stretch)
+        self.pending_charts = []
+        self.charts_ready = True
+        self.refresh_charts()
+
+    def build_core_chart(self):
+        """
+        코어별 사용률 히트맵(행 = 코어, 열 = 시간, 오른쪽 끝이 최신)입니다.
+        코어가 128개를 넘어도 이미지 한 장이므로, 틱마다 막대나 선을 코어 수만큼 다시 그리지 않고
+        텍스처 한 번만 갱신합니다. 이미지가 그래프 픽셀보다 크면 픽셀 크기로 줄여 그립니다.
+        """
+        self.core_graph_widget = pg.PlotWidget()
+        self.core_graph_widget.setBackground("#2b2b2b")
+        self.core_graph_widget.setMinimumHeight(150)
+        self.core_graph_widget.hideAxis('bottom')
+        self.core_graph_widget.hideAxis('left')
+        self.core_graph_widget.setMouseEnabled(x=False, y=False)
+        self.core_graph_widget.hideButtons()
+
+        colormap = pg.ColorMap(
+            [0.0, 0.5, 0.8, 1.0],
+            [(43, 43, 43), (0, 255, 180), (255, 255, 0), (255, 64, 64)],
+        )
+        self.core_heatmap_item = pg.ImageItem(axisOrder="row-major", autoDownsample=True)
+        self.core_heatmap_item.setLookupTable(colormap.getLookupTable(0.0, 1.0, 256))
+        self.core_heatmap_item.setLevels((0, 100))
+        self.core_graph_widget.addItem(self.core_heatmap_item)
+        self.core_heatmap_shape = None
+        self.refresh_core_heatmap()
+        return self.core_graph_widget
+
+    def refresh_core_heatmap(self):
+        """코어 히스토리 뷰를 이미지로 넘깁니다. 링 버퍼의 정렬된 뷰이므로 복사 없이 넘어갑니다."""
+        if not self.num_cores or not len(self.core_history):
+            return
+        image = self.core_history.window()
+        self.core_heatmap_item.setImage(image, autoLevels=False)
+        # 히스토리가 아직 다 차지 않았으면 오른쪽에 붙여 그립니다. 크기가 바뀔 때만 위치를 다시 잡습니다.
+        if self.core_heatmap_shape != image.shape:
+            self.core_heatmap_shape = image.shape
+            cores, length = image.shape
+            self.core_heatmap_item.setRect(self.max_history - length, 0, length, cores)
+            self.core_graph_widget.setRange(xRange=(0, self.max_history), yRange=(0, cores), padding=0)
+
+    def apply_static_info(self, info):
+        """
+        샘플러 스레드가 읽어 보낸 정적 정보를 UI에 표시합니다. 같은 정보가 다시 오면 무시하고,
+        달라졌으면 이전에 만든 라벨과 디스크 위젯을 바꿔 끼웁니다.
+        """
+        if self.static_info_spinner is not None:
+            self.system_info_layout.removeWidget(self.static_info_spinner)
+            self.static_info_spinner.deleteLater()
+            self.static_info_spinner = None
+        elif info == self.static_info:
+            return
+        self.static_info = info
+        for widget in self.static_info_widgets:
+            widget.setParent(None)
+            widget.deleteLater()
+        self.static_info_widgets = []
+        for widgets in self.disk_widgets.values():
+            for widget in widgets.values():
+                self.binder.forget(widget)
+        self.disk_widgets = {}
+
+        if not info:
+            self.add_static_info_widget(self.system_info_layout, QLabel("System information unavailable",
+                                                                        font=self.content_font))
+        else:
+            for key in ("os", "cpu", "gpu", "board"):
+                self.add_static_info_widget(self.system_info_layout, QLabel(info[key], font=self.content_font))
+
             for disk in info["disks"]:
-                used, total, percent = self.monitor.get_disk_usage(disk["device_id"])
-                
                 disk_container = QWidget()
                 disk_layout = QVBoxLayout(disk_container)
                 
-                self.create_disk_widget(disk["name"], used, total, percent, disk_layout, disk["device_id"])
+                # 사용량은 첫 스냅샷이 도착하면 채워집니다.
+                self.create_disk_widget(disk["name"], 0, 0, 0, disk_layout, disk["device_id"])
                 
-                self.disk_usage_layout.addWidget(disk_container)
-            
-            # CPU 코어 수 초기화
-            cpu_percents = self.monitor.get_cpu_usage()
-            self.num_cores = len(cpu_percents)
-            self.core_bar_graph_item.setOpts(x=list(range(self.num_cores)), height=[0]*self.num_cores)
-            
+                self.add_static_info_widget(self.disk_usage_layout, disk_container)
+
+    def add_static_info_widget(self, layout, widget):
+        layout.addWidget(widget)
+        self.static_info_widgets.append(widget)
+
     def create_section_frame(self, title):
         frame = QWidget()
-        frame.setStyleSheet("border: 1px dashed #666666;")
+        frame.setObjectName("section")
+        frame.setStyleSheet(SECTION_STYLE)
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(10, 10, 10, 10)
         title_label = QLabel(f" {title} ")
@@ -277,14 +452,38 @@ class DashboardApp(QStackedWidget):
             "circular_bar": circular_bar
         }
     
+    def create_process_table(self, parent_layout):
+        """상위 프로세스를 보여 줄 고정 크기 라벨 표를 만듭니다. 매 틱마다 라벨을 새로 만들지 않습니다."""
+        grid = QGridLayout()
+        grid.setColumnStretch(0, 1)
+        header_font = QFont("Arial", 10)
+        header_font.setBold(True)
+        row_font = QFont("Consolas", 11)
+        for column, title in enumerate(("PROCESS", "CPU", "RSS", "I/O")):
+            header = QLabel(title, font=header_font)
+            header.setStyleSheet("border: none; color: #00ffb4;")
+            if column:
+                header.setAlignment(Qt.AlignmentFlag.AlignRight)
+            grid.addWidget(header, 0, column)
+        for row in range(self.process_limit):
+            labels = []
+            for column in range(4):
+                label = QLabel("", font=row_font)
+                label.setStyleSheet("border: none;")
+                if column:
+                    label.setAlignment(Qt.AlignmentFlag.AlignRight)
+                grid.addWidget(label, row + 1, column)
+                labels.append(label)
+            self.process_rows.append(labels)
+        parent_layout.addLayout(grid)
+
     def create_ip_labels(self, parent_layout):
         self.ip_label = QLabel("IP | Fetching...", font=self.content_font)
         self.ip_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         parent_layout.addWidget(self.ip_label)
 
-    def get_external_ip(self):
-        """SystemMonitor 클래스에서 IP 주소를 가져와 UI에 표시합니다."""
-        internal_ip, external_ip = self.monitor.get_ips()
+    def update_ip_label(self, internal_ip, external_ip):
+        """NetworkIdentityService 가 보낸 IP 주소를 UI 에 표시합니다."""
         self.ip_label.setText(f"IP | {external_ip} ({internal_ip})")
         
     def create_network_widget(self, title, parent_layout, data_type):
@@ -304,9 +503,21 @@ class DashboardApp(QStackedWidget):
         text_layout.addWidget(title_label)
         text_layout.addWidget(speed_label)
         text_layout.addWidget(total_label)
+        text_layout.addWidget(self.create_percentile_label(data_type))
         
         container_layout.addLayout(text_layout)
         
+        if data_type == "sent":
+            self.sent_speed_label = speed_label
+            self.sent_total_label = total_label
+        else:
+            self.received_speed_label = speed_label
+            self.received_total_label = total_label
+        
+        self.defer_chart(container_layout, lambda: self.build_network_chart(data_type))
+        parent_layout.addWidget(container)
+
+    def build_network_chart(self, data_type):
         chart_widget = pg.PlotWidget()
         chart_widget.setBackground("#2b2b2b")
         chart_widget.showGrid(x=False, y=False)
@@ -316,17 +527,47 @@ class DashboardApp(QStackedWidget):
         
         if data_type == "sent":
             pen = pg.mkPen(color='#0000FF', width=2)
-            self.sent_speed_label = speed_label
-            self.sent_total_label = total_label
-            self.sent_plot_data_item = chart_widget.plot(pen=pen)
+            self.sent_plot_data_item = chart_widget.plot(pen=pen, clipToView=True)
         else:
             pen = pg.mkPen(color='#FF0000', width=2)
-            self.received_speed_label = speed_label
-            self.received_total_label = total_label
-            self.received_plot_data_item = chart_widget.plot(pen=pen)
-        
-        container_layout.addWidget(chart_widget, stretch=1)
-        parent_layout.addWidget(container)
+            self.received_plot_data_item = chart_widget.plot(pen=pen, clipToView=True)
+        return chart_widget
+
+    def create_percentile_label(self, name):
+        """HISTORY_COLUMNS 의 name 열에 대한 p50/p95/p99 를 보여 줄 작은 라벨을 만듭니다."""
+        label = QLabel("", font=QFont("Consolas", 9))
+        label.setStyleSheet("border: none; color: #aaaaaa; padding: 0px;")
+        self.percentile_labels[name] = label
+        return label
+
+    def cycle_percentile_window(self):
+        """분위값 창을 5분 → 1시간 → 24시간 순으로 바꿉니다."""
+        windows = [window for window, _ in DEFAULT_WINDOWS]
+        self.percentile_window = windows[(windows.index(self.percentile_window) + 1) % len(windows)]
+        self.refresh_percentile_labels()
+
+    def update_percentiles(self, summary):
+        """샘플러가 화면 주기마다 보내는 창별 분위값을 받아 선택한 창의 라벨을 갱신합니다."""
+        with self.profiler.span("percentiles"):
+            self.percentile_summary = summary
+            self.refresh_percentile_labels()
+
+    def refresh_percentile_labels(self):
+        caption = WINDOW_NAMES[self.percentile_window]
+        for name, values in self.percentile_summary.get(self.percentile_window, {}).items():
+            label = self.percentile_labels.get(name)
+            if label is None:
+                continue
+            if values is None:
+                self.binder.set_text(label, "")
+                continue
+            if name in PERCENT_COLUMNS:
+                texts = [f"{value:5.1f}%" for value in values]
+            else:
+                texts = [f"{format_network_speed(value):>11s}" for value in values]
+            lines = [f"{caption if i == 0 else '':>3s} {p} {text}"
+                     for i, (p, text) in enumerate(zip(("p50", "p95", "p99"), texts))]
+            self.binder.set_text(label, "\n".join(lines))
 
     def create_cpu_ram_widget(self, parent_layout, data_type):
         container = QWidget()
@@ -338,6 +579,20 @@ class DashboardApp(QStackedWidget):
         percent_label.setFixedWidth(80)
         percent_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
+        if data_type == "cpu":
+            self.cpu_percent_label = percent_label
+        else:
+            self.ram_percent_label = percent_label
+        
+        text_layout = QVBoxLayout()
+        text_layout.addWidget(percent_label)
+        text_layout.addWidget(self.create_percentile_label(data_type))
+        container_layout.addLayout(text_layout)
+        self.defer_chart(container_layout, lambda: self.build_cpu_ram_chart(data_type))
+        
+        parent_layout.addWidget(container, stretch=1)
+
+    def build_cpu_ram_chart(self, data_type):
         chart_widget = pg.PlotWidget()
         chart_widget.setBackground("#2b2b2b")
         chart_widget.showGrid(x=False, y=False)
@@ -348,17 +603,11 @@ class DashboardApp(QStackedWidget):
         
         if data_type == "cpu":
             pen = pg.mkPen(color='#ffff00', width=2)
-            self.cpu_percent_label = percent_label
-            self.cpu_plot_data_item = chart_widget.plot(pen=pen)
+            self.cpu_plot_data_item = chart_widget.plot(pen=pen, clipToView=True)
         else:
             pen = pg.mkPen(color='#ff0000', width=2)
-            self.ram_percent_label = percent_label
-            self.ram_plot_data_item = chart_widget.plot(pen=pen)
-        
-        container_layout.addWidget(percent_label)
-        container_layout.addWidget(chart_widget, stretch=1)
-        
-        parent_layout.addWidget(container, stretch=1)
+            self.ram_plot_data_item = chart_widget.plot(pen=pen, clipToView=True)
+        return chart_widget
         
     def create_disk_io_widget(self, title, parent_layout, data_type):
         container = QWidget()
@@ -370,7 +619,16 @@ class DashboardApp(QStackedWidget):
         data_label.setFont(QFont("Arial", 20))
         text_layout.addWidget(title_label)
         text_layout.addWidget(data_label)
+        text_layout.addWidget(self.create_percentile_label(f"disk_{data_type}"))
         container_layout.addLayout(text_layout)
+        if data_type == "read":
+            self.disk_read_label = data_label
+        else:
+            self.disk_write_label = data_label
+        self.defer_chart(container_layout, lambda: self.build_disk_io_chart(data_type))
+        parent_layout.addWidget(container)
+
+    def build_disk_io_chart(self, data_type):
         chart_widget = pg.PlotWidget()
         chart_widget.setBackground("#2b2b2b")
         chart_widget.showGrid(x=False, y=False)
@@ -379,78 +637,280 @@ class DashboardApp(QStackedWidget):
         chart_widget.setMinimumHeight(60)
         if data_type == "read":
             pen = pg.mkPen(color='#3498db', width=2)
-            self.disk_read_label = data_label
-            self.disk_read_plot_data_item = chart_widget.plot(pen=pen)
+            self.disk_read_plot_data_item = chart_widget.plot(pen=pen, clipToView=True)
         else:
             pen = pg.mkPen(color='#e74c3c', width=2)
-            self.disk_write_label = data_label
-            self.disk_write_plot_data_item = chart_widget.plot(pen=pen)
-        container_layout.addWidget(chart_widget, stretch=1)
-        parent_layout.addWidget(container)
+            self.disk_write_plot_data_item = chart_widget.plot(pen=pen, clipToView=True)
+        return chart_widget
+
+    def create_device_row(self, kind, name):
+        """장치 하나의 이름, 현재 속도, 스파크라인 줄을 만듭니다."""
+        container = QWidget()
+        container.setStyleSheet("border: none;")
+        layout = QHBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        name_label = QLabel(name, font=QFont("Arial", 11))
+        name_label.setFixedWidth(140)
+        layout.addWidget(name_label)
+        rate_label = QLabel("", font=QFont("Consolas", 11))
+        rate_label.setFixedWidth(260)
+        layout.addWidget(rate_label)
+
+        # 장치 수만큼 PlotWidget 을 만들면 틱과 페인트 비용이 장치 수에 크게 늘어나므로 QPainter 스파크라인을 씁니다.
+        sparkline = Sparkline(('#2ecc71', '#f1c40f') if kind == "nic" else ('#3498db', '#e74c3c'))
+        layout.addWidget(sparkline, stretch=1)
+
+        self.devices_layout.addWidget(container)
+        return {
+            "container": container,
+            "rate_label": rate_label,
+            "sparkline": sparkline,
+            "history": HistoryBuffer(("a", "b"), capacity=60),
+        }
+
+    def update_device_rows(self, kind, rates):
+        """장치별 속도를 반영합니다. 새 장치는 줄을 추가하고, 사라진 장치는 그 줄만 제거합니다."""
+        for key in [key for key in self.device_rows if key[0] == kind and key[1] not in rates]:
+            row = self.device_rows.pop(key)
+            self.binder.forget(row["rate_label"])
+            row["container"].deleteLater()
+
+        labels = ("↑", "↓") if kind == "nic" else ("R", "W")
+        for name, (first, second) in rates.items():
+            row = self.device_rows.get((kind, name))
+            if row is None:
+                row = self.device_rows[(kind, name)] = self.create_device_row(kind, name)
+            history = row["history"]
+            history.append((first, second))
+            self.binder.set_text(
+                row["rate_label"],
+                f"{labels[0]} {format_network_speed(first):>11s}  {labels[1]} {format_network_speed(second):>11s}",
+            )
+            row["sparkline"].set_data(history.view("a"), history.view("b"))
+
+    def update_all_data(self, snapshot):
+        """샘플러가 보낸 스냅샷을 UI 에 반영합니다. GUI 스레드에서는 수집을 하지 않습니다."""
+        with self.profiler.span(TickProfiler.TICK):
+            self.apply_snapshot(snapshot)
+        self.profiler.tick_done()
+        if self.perf_hud.isVisible():
+            stats = self.binder.stats()
+            lines = [f"widgets      {stats['updated']} updated, {stats['skipped']} skipped"]
+            for name, cost in self.sampler.collector_stats().items():
+                lines.append(
+                    f"collect {name:10s} {cost['mean_ms']:6.2f}ms every {cost['cadence_s']:5.2f}s "
+                    f"({cost['share'] * 100:.2f}%)"
+                )
+                if "refreshed" in cost:
+                    lines.append(f"        {cost['processes']} processes, {cost['refreshed']} refreshed")
+            self.perf_hud.refresh(lines)
+
+    def apply_snapshot(self, snapshot):
+        span = self.profiler.span
+        binder = self.binder
+        binder.begin_tick()
 
-    def update_all_data(self):
         # Uptime 업데이트
-        self.uptime_label.setText(self.monitor.get_uptime())
+        with span("uptime"):
+            binder.set_text(self.uptime_label, format_uptime(snapshot.uptime_seconds))
         
         # 디스크 사용률 업데이트
-        for device_id, widgets in self.disk_widgets.items():
-            used, total, percent = self.monitor.get_disk_usage(device_id)
-            if total > 0:
-                widgets["size_label"].setText(f"{format_bytes(used)} / {format_bytes(total)}")
-                widgets["progress_bar"].setValue(int(percent))
-                widgets["circular_bar"].set_value(percent)
+        with span("disk_usage"):
+            for device_id, (used, total, percent) in snapshot.disk_usage.items():
+                widgets = self.disk_widgets.get(device_id)
+                if widgets and total > 0:
+                    binder.set_text(widgets["size_label"], f"{format_bytes(used)} / {format_bytes(total)}")
+                    binder.set_value(widgets["progress_bar"], int(percent))
+                    binder.set_value(widgets["circular_bar"], percent)
                 
         # CPU 코어 사용률 업데이트
-        cpu_percents = self.monitor.get_cpu_usage()
-        if self.num_cores == 0:
-            self.num_cores = len(cpu_percents)
-            self.core_bar_graph_item.setOpts(x=list(range(self.num_cores)), height=[0]*self.num_cores)
-
-        x_values = list(range(self.num_cores))
-        y_values = [p for p in cpu_percents]
-        self.core_bar_graph_item.setOpts(x=x_values, height=y_values)
+        with span("cpu_cores"):
+            cpu_percents = snapshot.cpu_percents
+            if self.num_cores != len(cpu_percents):
+                self.num_cores = len(cpu_percents)
+                self.core_history = HistoryBuffer(range(self.num_cores), self.max_history, dtype=np.float32)
+            # 링 버퍼에 한 열만 덮어쓰고, 이미지는 그 뷰를 다시 넘겨 텍스처만 갱신합니다.
+            self.core_history.append(cpu_percents)
+            if self.charts_ready:
+                self.refresh_core_heatmap()
         
         # 네트워크 사용량 업데이트
-        sent_rate, received_rate, sent_total, received_total = self.monitor.get_network_stats()
-        
-        self.sent_speed_label.setText(f"{format_network_speed(sent_rate)}")
-        self.sent_total_label.setText(f"{format_bytes(sent_total)}")
-        self.received_speed_label.setText(f"{format_network_speed(received_rate)}")
-        self.received_total_label.setText(f"{format_bytes(received_total)}")
-        
-        self.sent_data.append(sent_rate)
-        self.received_data.append(received_rate)
-        self.sent_plot_data_item.setData(self.sent_data)
-        self.received_plot_data_item.setData(self.received_data)
+        with span("network"):
+            sent_rate, received_rate = snapshot.sent_rate, snapshot.received_rate
+            
+            binder.set_text(self.sent_speed_label, format_network_speed(sent_rate))
+            binder.set_text(self.sent_total_label, format_bytes(snapshot.sent_total))
+            binder.set_text(self.received_speed_label, format_network_speed(received_rate))
+            binder.set_text(self.received_total_label, format_bytes(snapshot.received_total))
 
         # 디스크 I/O 업데이트
-        read_speed, write_speed = self.monitor.get_disk_io()
-        
-        self.disk_read_label.setText(f"{format_network_speed(read_speed)}")
-        self.disk_write_label.setText(f"{format_network_speed(write_speed)}")
-        self.disk_read_data.append(read_speed)
-        self.disk_write_data.append(write_speed)
-        self.disk_read_plot_data_item.setData(self.disk_read_data)
-        self.disk_write_plot_data_item.setData(self.disk_write_data)
-
-        # CPU/RAM 사용량 그래프 업데이트
-        cpu_usage = sum(self.monitor.get_cpu_usage()) / len(self.monitor.get_cpu_usage()) if self.monitor.get_cpu_usage() else 0
-        ram_usage = self.monitor.get_ram_usage()
-        self.cpu_data.append(cpu_usage)
-        self.ram_data.append(ram_usage)
-        self.cpu_percent_label.setText(f"{cpu_usage:.0f}%")
-        self.ram_percent_label.setText(f"{ram_usage:.0f}%")
-        self.cpu_plot_data_item.setData(self.cpu_data)
-        self.ram_plot_data_item.setData(self.ram_data)
-
-        # 데이터 히스토리 관리
-        if len(self.sent_data) > self.max_history:
-            self.sent_data.pop(0)
-            self.received_data.pop(0)
-            self.cpu_data.pop(0)
-            self.ram_data.pop(0)
-            self.disk_read_data.pop(0)
-            self.disk_write_data.pop(0)
+        with span("disk_io"):
+            read_speed, write_speed = snapshot.read_speed, snapshot.write_speed
+            
+            binder.set_text(self.disk_read_label, format_network_speed(read_speed))
+            binder.set_text(self.disk_write_label, format_network_speed(write_speed))
+
+        # NIC/디스크별 처리량 업데이트
+        with span("devices"):
+            self.update_device_rows("nic", snapshot.nic_rates)
+            self.update_device_rows("disk", snapshot.disk_rates)
+
+        # 상위 프로세스 업데이트 (스캔 주기 사이에는 같은 목록이므로 바인더가 건너뜁니다)
+        with span("processes"):
+            if self.process_rows and binder.changed("processes", snapshot.processes):
+                processes = snapshot.processes
+                for row, (name_label, cpu_label, rss_label, io_label) in enumerate(self.process_rows):
+                    if row < len(processes):
+                        process = processes[row]
+                        binder.set_text(name_label, f"{process.name} ({process.pid})")
+                        binder.set_text(cpu_label, f"{process.cpu_percent:.1f}%")
+                        binder.set_text(rss_label, format_bytes(process.rss))
+                        binder.set_text(io_label, format_network_speed(process.io_rate))
+                    else:
+                        for label in (name_label, cpu_label, rss_label, io_label):
+                            binder.set_text(label, "")
+
+        # CPU/RAM 사용량 업데이트
+        with span("cpu_ram"):
+            cpu_usage = snapshot.cpu_average
+            ram_usage = snapshot.ram_percent
+            binder.set_text(self.cpu_percent_label, f"{cpu_usage:.0f}%")
+            binder.set_text(self.ram_percent_label, f"{ram_usage:.0f}%")
+
+        binder.end_tick()
+
+        # 경보 규칙 평가. 발생하거나 해제된 규칙이 있는 섹션만 다시 칠합니다.
+        if self.alerts is not None:
+            with span("alerts"):
+                changed = self.alerts.evaluate(snapshot)
+                if changed:
+                    self.apply_alerts(changed)
+
+        # 히스토리 관리: 링 버퍼에 한 행을 추가하고 복사 없는 뷰를 그래프에 넘깁니다.
+        # 라벨은 구간 평균 속도를, 그래프는 구간 내 최대 속도를 보여 줍니다. (샘플 주기와 화면 주기가 같으면 동일)
+        with span("charts"):
+            row = history_row(snapshot)
+            self.history.append(row)
+            if self.rollups is not None:
+                self.rollups.add(snapshot.timestamp, row)
+
+            self.refresh_charts()
+
+    def apply_alerts(self, changed):
+        """
+        상태가 바뀐 규칙의 섹션 프레임 테두리와 툴팁을 현재 발생 중인 규칙에 맞춥니다.
+        툴팁에는 규칙과 발생 시점의 값을 보여 주며, 외부 알림은 규칙의 => 명령으로 합니다.
+        """
+        for section in {rule.section for rule in changed}:
+            frame = self.section_frames.get(section)
+            if frame is None:
+                continue
+            firing = self.alerts.firing(section)
+            frame.setStyleSheet(ALERT_SECTION_STYLE if firing else SECTION_STYLE)
+            frame.setToolTip("\n".join(f"{rule.text} (값 {rule.value:g})" for rule in firing))
+
+    def refresh_charts(self):
+        """히스토리를 그래프에 반영합니다. 그래프가 아직 만들어지지 않았으면 아무 일도 하지 않습니다."""
+        if not self.charts_ready:
+            return
+        for name, plot_data_item in (
+            ("sent", self.sent_plot_data_item),
+            ("received", self.received_plot_data_item),
+            ("disk_read", self.disk_read_plot_data_item),
+            ("disk_write", self.disk_write_plot_data_item),
+            ("cpu", self.cpu_plot_data_item),
+            ("ram", self.ram_plot_data_item),
+        ):
+            x, y = self.chart_series(name, plot_data_item)
+            plot_data_item.setData(x, y)
+
+    def chart_series(self, name, plot_data_item):
+        """
+        그래프에 넘길 (x, y) 를 고릅니다. 긴 기간을 표시할 때는 차트 픽셀 폭을 채우는
+        가장 거친 집계 계층을 사용하고, 속도 그래프는 최대값으로 집계해 피크를 보존합니다.
+        마지막으로 픽셀당 최소/최대 두 점으로 줄이므로 히스토리 길이와 상관없이 그리는 비용이 일정합니다.
+        """
+        pixel_width = int(plot_data_item.getViewBox().width()) or self.DEFAULT_CHART_WIDTH
+        if self.rollups is None:
+            series = self.history.view(name)
+        else:
+            stat = "mean" if name in ("cpu", "ram") else "max"
+            series = self.rollups.series(name, self.history_window_seconds, pixel_width, stat)
+        return minmax_downsample(series, pixel_width)
+
+    def event(self, event):
+        # 최상위 창의 UpdateRequest 처리 중에 모든 자식 위젯의 페인트가 일어나므로 여기서 페인트 시간을 잽니다.
+        profiler = self.profiler
+        if profiler is None or event.type() != QEvent.Type.UpdateRequest:
+            return super().event(event)
+        if profiler.enabled:
+            with profiler.span(TickProfiler.PAINT):
+                result = super().event(event)
+        else:
+            result = super().event(event)
+        if self.time_to_first_frame_ms is None:
+            self.record_first_frame()
+        return result
+
+    def record_first_frame(self):
+        """첫 화면을 그린 시각을 기록하고 first_frame_shown 시그널로 알립니다."""
+        self.time_to_first_frame_ms = (time.perf_counter() - self.started_at) * 1000
+        self.profiler.mark("time_to_first_frame_ms", self.time_to_first_frame_ms)
+        self.first_frame_shown.emit(self.time_to_first_frame_ms)
+        QTimer.singleShot(0, self.initialize_app)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 다른 창에 완전히 가려지는 것은 QWindow 의 Expose 이벤트로만 알 수 있으므로 최상위 창을 감시합니다.
+        window = self.windowHandle()
+        if window is not None and window is not self.watched_window:
+            window.installEventFilter(self)
+            self.watched_window = window
+        self.update_visibility_state()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_visibility_state()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.update_visibility_state()
+
+    def eventFilter(self, watched, event):
+        if watched is self.watched_window and event.type() == QEvent.Type.Expose:
+            self.update_visibility_state()
+        return super().eventFilter(watched, event)
+
+    def update_visibility_state(self):
+        """창이 최소화되거나 가려지면 샘플러의 수집 주기를 HIDDEN_SLOWDOWN 배로 늘립니다."""
+        if self.sampler is None:
+            return
+        window = self.windowHandle()
+        visible = (
+            self.isVisible()
+            and not self.isMinimized()
+            and (window is None or window.isExposed())
+        )
+        slowdown = 1.0 if visible else self.HIDDEN_SLOWDOWN
+        if slowdown != self.sampler_slowdown:
+            self.sampler_slowdown = slowdown
+            self.sampler.set_slowdown(slowdown)
+
+    def export_profile(self, path=None):
+        """프로파일러 통계를 JSON 파일로 저장합니다."""
+        path = path or time.strftime("perf_profile_%Y%m%d_%H%M%S.json")
+        self.profiler.export_json(path)
+        print(f"성능 프로파일을 저장했습니다: {path}")
+
+    def closeEvent(self, event):
+        # 창을 닫을 때 샘플러 스레드와 네트워크 조회를 정리합니다.
+        # 초기화 전에 닫힌 경우 뒤늦게 initialize_app 이 샘플러를 시작하지 않도록 막습니다.
+        self.app_initialized = True
+        self.network_identity.stop()
+        self.sampler.stop()
+        super().closeEvent(event)
     
     def show_on_specific_monitor(self, target="main"):
         screens = QApplication.instance().screens()
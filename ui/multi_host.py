@@ -0,0 +1,169 @@
+import time
+from PyQt6.QtWidgets import QFrame, QGridLayout, QLabel, QProgressBar, QScrollArea, QVBoxLayout, QWidget
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont
+
+from ui.bindings import WidgetBinder
+from utils.helpers import format_network_speed
+from data.remote_source import RemoteHostSource
+
+ONLINE_STYLE = "QFrame#hostTile { border: 1px dashed #666666; }"
+OFFLINE_STYLE = "QFrame#hostTile { border: 1px solid #ff5555; }"
+
+class HostTile(QFrame):
+    """
+    호스트 하나의 요약 타일입니다. CPU/RAM 막대와 네트워크, 디스크 I/O 속도만 보여 주고,
+    클릭하면 clicked 시그널로 호스트 이름을 알립니다.
+    """
+    clicked = pyqtSignal(str)
+
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.online = None
+        self.setObjectName("hostTile")
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+
+        title_font = QFont("Arial", 12)
+        title_font.setBold(True)
+        self.title_label = QLabel(name, font=title_font)
+        layout.addWidget(self.title_label)
+
+        self.cpu_bar = self.create_bar(layout, "CPU %p%")
+        self.ram_bar = self.create_bar(layout, "RAM %p%")
+        content_font = QFont("Arial", 10)
+        self.network_label = QLabel("↑ -  ↓ -", font=content_font)
+        self.disk_label = QLabel("R -  W -", font=content_font)
+        for label in (self.network_label, self.disk_label):
+            label.setStyleSheet("border: none;")
+            layout.addWidget(label)
+
+    def create_bar(self, layout, text_format):
+        bar = QProgressBar()
+        bar.setRange(0, 100)
+        bar.setFormat(text_format)
+        bar.setFixedHeight(16)
+        bar.setStyleSheet("""
+            QProgressBar { border: 1px solid #555; border-radius: 4px; text-align: center; padding: 0px; }
+            QProgressBar::chunk { background-color: #00ffb4; border-radius: 4px; }
+        """)
+        layout.addWidget(bar)
+        return bar
+
+    def update_state(self, status, online, binder):
+        """수신기가 복사해 준 HostStatus 를 반영합니다. 값이 바뀐 위젯만 바인더가 갱신합니다."""
+        if online != self.online:
+            self.online = online
+            self.setStyleSheet(ONLINE_STYLE if online else OFFLINE_STYLE)
+        binder.set_text(self.title_label, self.name if online else f"{self.name} (offline)")
+        snapshot = status.snapshot
+        if snapshot is None:
+            return
+        binder.set_value(self.cpu_bar, int(snapshot.cpu_average))
+        binder.set_value(self.ram_bar, int(snapshot.ram_percent))
+        binder.set_text(
+            self.network_label,
+            f"↑ {format_network_speed(snapshot.sent_rate)}  ↓ {format_network_speed(snapshot.received_rate)}",
+        )
+        binder.set_text(
+            self.disk_label,
+            f"R {format_network_speed(snapshot.read_speed)}  W {format_network_speed(snapshot.write_speed)}",
+        )
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit(self.name)
+        super().mouseReleaseEvent(event)
+
+class MultiHostView(QWidget):
+    """
+    여러 호스트를 한 화면에 타일로 보여 주는 창입니다.
+
+    수신기(HostReceiver)는 자체 스레드에서 스냅샷을 받고, 이 창은 refresh_ms 마다 호스트 상태의 복사본을 읽어
+    타일을 갱신합니다. 스냅샷마다 GUI 이벤트를 만들지 않으므로 호스트 수가 많아도 GUI 비용은
+    타일 수 × 화면 주기에 비례합니다. 타일을 클릭하면 기존 DashboardApp 패널로 그 호스트를 자세히 보며,
+    그래프는 수신기가 모아 둔 그 호스트의 히스토리로 채운 채 시작합니다.
+    """
+    def __init__(self, receiver, columns=4, refresh_ms=1000, stale_after=5.0, process_limit=8, history_points=100,
+                 parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("PC Dashboard - Hosts")
+        self.setStyleSheet("background-color: rgba(43, 43, 43, 191); color: white;")
+        self.receiver = receiver
+        self.columns = columns
+        self.stale_after = stale_after
+        self.process_limit = process_limit
+        self.history_points = history_points
+        self.binder = WidgetBinder()
+        self.tiles = {}
+        self.detail_windows = {}
+
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel("Waiting for agents...", font=QFont("Arial", 12))
+        layout.addWidget(self.summary_label)
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        container = QWidget()
+        self.grid = QGridLayout(container)
+        self.grid.setAlignment(Qt.AlignmentFlag.AlignTop)
+        scroll_area.setWidget(container)
+        layout.addWidget(scroll_area)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(refresh_ms)
+
+    def refresh(self):
+        now = time.monotonic()
+        binder = self.binder
+        binder.begin_tick()
+        # 수신 스레드가 쓰는 상태 객체 대신 잠금 안에서 복사한 값을 읽습니다.
+        statuses = self.receiver.statuses()
+        online_count = 0
+        for status in statuses:
+            tile = self.tiles.get(status.name)
+            if tile is None:
+                tile = self.add_tile(status.name)
+            online = status.connected and now - status.last_seen < self.stale_after
+            online_count += online
+            tile.update_state(status, online, binder)
+        binder.set_text(self.summary_label, f"Hosts {online_count} online / {len(statuses)}")
+        binder.end_tick()
+
+    def add_tile(self, name):
+        # 수신기는 이름 순 목록을 주지만, 기존 타일을 옮기지 않도록 도착 순서대로 뒤에 붙입니다.
+        index = len(self.tiles)
+        tile = HostTile(name)
+        tile.clicked.connect(self.open_host)
+        self.grid.addWidget(tile, index // self.columns, index % self.columns)
+        self.tiles[name] = tile
+        return tile
+
+    def open_host(self, name):
+        """호스트의 상세 화면을 엽니다. 이미 열려 있으면 앞으로 가져옵니다."""
+        window = self.detail_windows.get(name)
+        if window is not None and window.isVisible():
+            window.raise_()
+            window.activateWindow()
+            return
+        # dashboard_app 은 pyqtgraph 때문에 무거우므로 처음 상세 화면을 열 때 불러옵니다.
+        from ui.dashboard_app import DashboardApp
+        window = DashboardApp(
+            process_limit=self.process_limit,
+            history_points=self.history_points,
+            source=RemoteHostSource(self.receiver, name),
+            fullscreen=False,
+        )
+        window.setWindowTitle(f"PC Dashboard - {name}")
+        window.resize(480, 1280)
+        window.show()
+        self.detail_windows[name] = window
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        for window in self.detail_windows.values():
+            window.close()
+        self.receiver.stop()
+        super().closeEvent(event)
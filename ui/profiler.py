@@ -0,0 +1,215 @@
+import json
+import time
+
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+# 2의 거듭제곱 구간(옥타브)마다 2^_SUB_BITS 개의 같은 폭 하위 구간을 둡니다 (HDR 히스토그램 방식).
+# 하위 구간 폭은 값의 1/16 이하이므로 백분위수 오차는 6.25% 이내입니다.
+# 2^40 ns(약 18분)까지 나누고 그보다 긴 값은 마지막 구간에 넣습니다.
+_SUB_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BITS
+_MAX_BITS = 40
+_BUCKETS = (_MAX_BITS - _SUB_BITS + 1) << _SUB_BITS
+
+def _bucket_index(value):
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BITS - 1
+    return min(_BUCKETS - 1, ((shift + 1) << _SUB_BITS) + (value >> shift) - _SUB_BUCKETS)
+
+def _bucket_bounds(index):
+    """구간 번호의 (하한, 폭) 입니다."""
+    if index < 2 * _SUB_BUCKETS:
+        return index, 1
+    shift = (index >> _SUB_BITS) - 1
+    return ((index & (_SUB_BUCKETS - 1)) + _SUB_BUCKETS) << shift, 1 << shift
+
+class SpanStats:
+    """
+    이름 붙은 구간 하나의 누적 통계입니다.
+    지연 시간은 로그-선형 구간 히스토그램으로 모으므로 기록 비용과 메모리가 일정합니다.
+    """
+    __slots__ = ("count", "total_ns", "max_ns", "last_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.last_ns = 0
+        self.buckets = [0] * _BUCKETS
+
+    def record(self, elapsed_ns):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.last_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.buckets[_bucket_index(elapsed_ns)] += 1
+
+    def percentile_ns(self, p):
+        """히스토그램에서 근사 백분위수를 구합니다. 목표 순위가 들어 있는 구간 안에서 선형 보간합니다."""
+        if self.count == 0:
+            return 0
+        target = self.count * p / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            if bucket_count and seen + bucket_count >= target:
+                lower, width = _bucket_bounds(index)
+                return min(self.max_ns, lower + width * max(0.0, target - seen) / bucket_count)
+            seen += bucket_count
+        return self.max_ns
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ns / self.count / 1e6 if self.count else 0,
+            "p50_ms": self.percentile_ns(50) / 1e6,
+            "p99_ms": self.percentile_ns(99) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+            "last_ms": self.last_ns / 1e6,
+        }
+
+class _Span:
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.record(time.perf_counter_ns() - self.start)
+        return False
+
+class _NullSpan:
+    """프로파일러가 꺼져 있을 때 쓰는 아무 일도 하지 않는 구간입니다."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class TickProfiler:
+    """
+    update_all_data 의 섹션별 소요 시간과 Qt 페인트 시간을 모으는 프로파일러입니다.
+    enabled 가 False 이면 span() 은 공유된 빈 컨텍스트를 돌려주므로 비용이 거의 없습니다.
+    """
+    TICK = "tick"
+    PAINT = "paint"
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.sections = {}
+        self._spans = {}
+        self.window_start = time.perf_counter_ns()
+        self.window_ticks = 0
+        self.window_busy_base = 0
+        self.frame_rate = 0.0
+        self.utilization = 0.0
+        # 시작 시간처럼 한 번만 재는 값. 프로파일러가 꺼져 있어도 기록하며 reset() 으로 지우지 않습니다.
+        self.marks = {}
+
+    def mark(self, name, value):
+        self.marks[name] = value
+
+    def span(self, name):
+        if not self.enabled:
+            return _NULL_SPAN
+        span = self._spans.get(name)
+        if span is None:
+            stats = self.sections[name] = SpanStats()
+            span = self._spans[name] = _Span(stats)
+        return span
+
+    def tick_done(self):
+        """한 틱(데이터 반영)이 끝날 때 호출합니다. 틱 빈도와 GUI 스레드 점유율을 갱신합니다."""
+        if not self.enabled:
+            return
+        self.window_ticks += 1
+        now = time.perf_counter_ns()
+        elapsed = now - self.window_start
+        if elapsed >= 1e9:
+            busy = self._busy_ns()
+            self.frame_rate = self.window_ticks * 1e9 / elapsed
+            self.utilization = (busy - self.window_busy_base) / elapsed
+            self.window_start = now
+            self.window_ticks = 0
+            self.window_busy_base = busy
+
+    def _busy_ns(self):
+        """지금까지 GUI 스레드가 틱 반영과 페인트에 쓴 총 시간입니다."""
+        return sum(self.sections[name].total_ns for name in (self.TICK, self.PAINT) if name in self.sections)
+
+    def reset(self):
+        self.sections.clear()
+        self._spans.clear()
+        self.window_start = time.perf_counter_ns()
+        self.window_ticks = 0
+        self.window_busy_base = 0
+
+    def to_dict(self):
+        return {
+            "frame_rate": self.frame_rate,
+            "gui_utilization": self.utilization,
+            "marks": dict(self.marks),
+            "sections": {name: stats.to_dict() for name, stats in self.sections.items()},
+        }
+
+    def export_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+class PerfHud(QLabel):
+    """
+    섹션별 비용, 전체 틱 시간, 틱 빈도, GUI 스레드 점유율을 보여 주는 반투명 오버레이입니다.
+    숨겨져 있는 동안에는 프로파일러를 꺼 둡니다.
+    """
+    def __init__(self, profiler, parent=None):
+        super().__init__(parent)
+        self.profiler = profiler
+        self.setFont(QFont("Consolas", 10))
+        self.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 200); color: #00ffb4; border: 1px solid #00ffb4; padding: 6px;"
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.move(10, 10)
+        self.hide()
+
+    def toggle(self):
+        visible = not self.isVisible()
+        self.profiler.enabled = visible
+        if visible:
+            self.profiler.reset()
+            self.show()
+            self.raise_()
+            self.refresh()
+        else:
+            self.hide()
+
+    def refresh(self, extra_lines=()):
+        if not self.isVisible():
+            return
+        profiler = self.profiler
+        lines = [f"{'section':12s} {'last':>7s} {'p50':>7s} {'p99':>7s}  (ms)"]
+        for name, stats in profiler.sections.items():
+            lines.append(
+                f"{name:12s} {stats.last_ns / 1e6:7.2f} {stats.percentile_ns(50) / 1e6:7.2f} "
+                f"{stats.percentile_ns(99) / 1e6:7.2f}"
+            )
+        lines.append(f"tick rate    {profiler.frame_rate:7.2f} /s")
+        lines.append(f"gui busy     {profiler.utilization * 100:7.2f} %")
+        first_frame = profiler.marks.get("time_to_first_frame_ms")
+        if first_frame is not None:
+            lines.append(f"first frame  {first_frame:7.1f} ms")
+        lines.extend(extra_lines)
+        self.setText("\n".join(lines))
+        self.adjustSize()
@@ -21,3 +21,14 @@ def format_network_speed(bytes_per_sec):
         speed /= 1024
         unit_index += 1
     return f"{speed:.2f}{units[unit_index]}"
+
+def format_uptime(uptime_seconds):
+    """
+    부팅 후 경과 시간(초)을 "N days, HH:MM:SS" 형식의 문자열로 변환
+    """
+    uptime_seconds = int(uptime_seconds)
+    days = uptime_seconds // (24 * 3600)
+    hours = (uptime_seconds % (24 * 3600)) // 3600
+    minutes = (uptime_seconds % 3600) // 60
+    seconds = uptime_seconds % 60
+    return f"{days} day{'s' if days != 1 else ''}, {hours:02d}:{minutes:02d}:{seconds:02d}"